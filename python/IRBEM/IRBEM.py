@@ -26,13 +26,22 @@ along with IRBEM-LIB.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
 import sys
-import copy
 import pathlib
 import ctypes
 import shutil
 import datetime
 import dateutil.parser
 import warnings
+import atexit
+import collections
+import queue
+import tempfile
+import threading
+import concurrent.futures
+import hashlib
+import io
+import sqlite3
+import time
 
 import numpy as np
 import scipy.interpolate
@@ -51,22 +60,36 @@ except ModuleNotFoundError as err:
 Re = 6371 #km
 c = 3.0E8 # m/s
 
+# IRBEM-LIB's Fortran bad data value.
+baddata = -1E31
+
 # External magnetic field model look up table.
 extModels = ['None', 'MF75', 'TS87', 'TL87', 'T89', 'OPQ77', 'OPD88', 'T96', 
     'OM97', 'T01', 'T01S', 'T04', 'A00', 'T07', 'MT']
 
+# TS07D coefficient archive records: the 101 A07 coefficients, M_INX, N_INX,
+# PDYN and TILT. datetime.date.toordinal() + _JULDAY_OFFSET is the Julian
+# day number that IRBEM-LIB's JULDAY returns.
+_TS07D_NTOT = 101
+_TS07D_NREC = _TS07D_NTOT + 4
+_JULDAY_OFFSET = 1721425
+
 class MagFields:
     """
     Wrappers for IRBEM's magnetic field functions. 
         
     Functions wrapped and tested:
     make_lstar()
+    make_lstar_shell_splitting()
     drift_shell()
-    find_mirror_point()   
-    find_foot_point()
+    drift_shell_multi()
+    find_mirror_point() (and find_mirror_point_multi for array inputs)
+    find_foot_point() (and find_foot_point_multi for array inputs)
     trace_field_line()
-    find_magequator()
+    trace_field_line_multi()
+    find_magequator() (and find_magequator_multi for array inputs)
     get_field_multi()
+    get_hemi()
     get_mlt()
     
     Functions wrapped and not tested:
@@ -74,7 +97,11 @@ class MagFields:
     
     Special functions not in normal IRBEM (no online documentation yet):
     bounce_period()
+    bounce_period_multi()
     mirror_point_altitude()
+
+    The X and maginput arguments can also be a PreparedInput, so an ephemeris 
+    is prepared once for several methods.
     
     Please contact me at msshumko at gmail.com if you have questions/comments
     or you would like me to wrap a particular function.
@@ -103,11 +130,24 @@ class MagFields:
         verbose: bool
             Prints a statement prior to running each function. Usefull for debugging in 
             case Python quietly crashes (likely a wrapper or a Fortran issue).
+        private_library: bool
+            Load a private copy of the shared object so this instance does not share the 
+            Fortran COMMON block state with other MagFields instances in this process. 
+            Instances with private copies can run in separate threads at the same time.
+        cache: str, pathlib.Path or ResultCache
+            An optional persistent cache for the make_lstar() and drift_shell() 
+            outputs. A path opens (or creates) a ResultCache SQLite file there.
+        memo_size: int
+            The memory, in bytes, of the in-memory LRU memo of the field lines and 
+            local magnetic fields used by bounce_period() and 
+            mirror_point_altitude(). Defaults to 64 MB, 0 disables it.
         """
         self.irbem_obj_path = kwargs.get('path', None)
         self.TMI = kwargs.get('verbose', False)
         
-        self.path, self._irbem_obj = _load_shared_object(self.irbem_obj_path)
+        self.path, self._irbem_obj = _load_shared_object(
+            self.irbem_obj_path, private=kwargs.get('private_library', False)
+            )
         
         # global model parameters, default is OPQ77 model with GDZ coordinate
         # system. If kext is a string, find the corresponding integer value.
@@ -133,12 +173,25 @@ class MagFields:
         else:
             self.options = optionsType(0,0,0,0,0)
             
-        # Get the NTIME_MAX value
+        # Get the NTIME_MAX value. NTIME_MAX is the chunk size of the array 
+        # methods and can be lowered, _ntime_max stays the size of the 
+        # compiled Fortran arrays.
         self.NTIME_MAX = ctypes.c_int(-1)
         self._irbem_obj.get_irbem_ntime_max1_(ctypes.byref(self.NTIME_MAX))
+        self._ntime_max = self.NTIME_MAX.value
+
+        self._memo = _LRUMemo(kwargs.get('memo_size', 2**26))
+
+        self.cache = kwargs.get('cache', None)
+        if self.cache is not None:
+            if not isinstance(self.cache, ResultCache):
+                self.cache = ResultCache(self.cache)
+            version = ctypes.c_int()
+            self._irbem_obj.irbem_fortran_version1_(ctypes.byref(version))
+            self.cache.validate(version.value)
         return
         
-    def make_lstar(self, X, maginput):
+    def make_lstar(self, X, maginput, method='full', out=None, baddata_to_nan=False):
         """
         This function allows one to compute magnetic coordinate at any s/c position, 
         i.e. L, L*, Blocal/Bmirror, Bequator. A set of internal/external field can be selected.
@@ -152,35 +205,235 @@ class MagFields:
         maginput: dict
             The magnetic field input dictionary. See the online documentation for the valid
             keys and the corresponding models.
+        method: str
+            'full' traces the drift shell to compute L* (make_lstar1). 'fast' 
+            estimates L* from Lm, I and the day of year with empirical fits 
+            (LAndI2Lstar1), which is orders of magnitude faster. The fits are 
+            only available for the IGRF + Olson-Pfitzer quiet (OPQ77) models, 
+            which 'fast' always uses.
+        out: dict
+            Optional preallocated output arrays, with some or all of the 'Lm', 
+            'Lstar', 'blocal', 'bmin', 'xj' and 'MLT' keys with shape 
+            (ntime,). The outputs are written into them in place, so a 
+            streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
 
         Returns
         -------
         dict
             Contains keys Lm, MLT, blocal, bmin, LStar, and xj.
+
+        If the model has a cache, the points found there are not recomputed. 
+        make_lstar1 starts each L* calculation from the previous point's drift 
+        shell, so L* can differ, within the accuracy set by options[2], from 
+        a run without the cache.
         """
-        # Convert the satellite time and position into c objects.
+        self._check_lstar_method(method)
+        # Convert the satellite time and position into contiguous arrays.
         ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)       
 
-        # Convert the model parameters into c objects.     
-        maginput = self._prepMagInput(maginput)
+        # Convert the model parameters into an (ntime, 25) array, broadcasting 
+        # scalar inputs.
+        maginput = self._prepMagInput(maginput, ntime.value)
                 
-        # Model outputs
-        doubleArrType = ctypes.c_double * ntime.value
-        lm, lstar, blocal, bmin, xj, mlt = [doubleArrType() for i in range(6)]
-        
-        if self.TMI: print("Running IRBEM-LIB make_lstar")
-
-        self._irbem_obj.make_lstar1_(ctypes.byref(ntime), ctypes.byref(self.kext), 
-                ctypes.byref(self.options), ctypes.byref(self.sysaxes), ctypes.byref(iyear),
-                ctypes.byref(idoy), ctypes.byref(ut), ctypes.byref(x1), 
-                ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(maginput), 
-                ctypes.byref(lm), ctypes.byref(lstar), ctypes.byref(blocal),
-                ctypes.byref(bmin), ctypes.byref(xj), ctypes.byref(mlt))
-        self.make_lstar_output = {'Lm':lm[:], 'MLT':mlt[:], 'blocal':blocal[:],
-            'bmin':bmin[:], 'Lstar':lstar[:], 'xj':xj[:]}  
+        out = _out_tuple(out, ['Lm', 'Lstar', 'blocal', 'bmin', 'xj', 'MLT'])
+        if self.cache is None:
+            outputs = self._make_lstar_arrays(
+                    iyear, idoy, ut, x1, x2, x3, maginput, method, out=out)
+        else:
+            outputs = self._cached_arrays(
+                    'make_lstar', self._make_lstar_arrays, 
+                    iyear, idoy, ut, x1, x2, x3, maginput, method, out=out)
+        if baddata_to_nan:
+            _baddata_to_nan(*outputs)
+        lm, lstar, blocal, bmin, xj, mlt = outputs
+        self.make_lstar_output = {'Lm':lm, 'MLT':mlt, 'blocal':blocal, 
+            'bmin':bmin, 'Lstar':lstar, 'xj':xj}  
         return self.make_lstar_output
+
+    def make_lstar_trajectory(self, X, maginput, rtol=1e-2, cadence=60, 
+                              method='full', out=None, baddata_to_nan=False):
+        """
+        Computes the make_lstar outputs along a spacecraft trajectory at an 
+        adaptive cadence. make_lstar is run every `cadence` samples, and each 
+        interval between the computed samples is checked at its midpoint: if 
+        linear interpolation in time misses the computed midpoint by more 
+        than rtol, or if the samples differ in bad data or in the sign of Lm 
+        or L* (e.g. at the edge of an open drift shell), the interval is split 
+        in two and checked again. The samples left in between are linearly 
+        interpolated.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input time and location, as in 
+            make_lstar. The times must be strictly increasing.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        rtol: float
+            The interpolation tolerance, relative to the value for Lm, L*, 
+            blocal and bmin, to Lm for xj and to 24 h for MLT.
+        cadence: int
+            The number of samples between the first computed points.
+        method: str
+            'full' or 'fast'. See make_lstar.
+        out: dict
+            Optional preallocated output arrays, with some or all of the 'Lm', 
+            'Lstar', 'blocal', 'bmin', 'xj' and 'MLT' keys with shape 
+            (ntime,). The outputs are written into them in place.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        dict
+            Contains the make_lstar keys Lm, MLT, blocal, bmin, Lstar, and xj 
+            with shape (ntime,), and the boolean (ntime,) array computed that 
+            is True for the samples computed by make_lstar.
+
+        An interval whose endpoints and midpoint are bad data is filled with 
+        bad data, so features narrower than the interval can be missed. Use 
+        a smaller cadence for low altitude orbits.
+        """
+        self._check_lstar_method(method)
+        if int(cadence) < 1:
+            raise ValueError(f'cadence must be a positive integer. Got {cadence}.')
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+        t = _trajectory_seconds(iyear, idoy, ut)
+        if np.any(np.diff(t) <= 0):
+            raise ValueError('make_lstar_trajectory needs strictly increasing times.')
+
+        def compute(idx):
+            args = (iyear[idx], idoy[idx], ut[idx], x1[idx], x2[idx], x3[idx], 
+                    maginput[idx], method)
+            if self.cache is None:
+                return np.column_stack(self._make_lstar_arrays(*args))
+            return np.column_stack(self._cached_arrays(
+                    'make_lstar', self._make_lstar_arrays, *args))
+
+        values, computed = _adaptive_samples(t, compute, int(cadence), rtol)
+        if self.TMI: print(f"Computed {computed.sum()} of {ntime.value} trajectory points")
+
+        outputs = _output_buffers(_out_tuple(out, ['Lm', 'Lstar', 'blocal', 'bmin', 
+                                                   'xj', 'MLT']), [(ntime.value,)]*6)
+        for output, column in zip(outputs, values.T):
+            output[:] = column
+        if baddata_to_nan:
+            _baddata_to_nan(*outputs)
+        lm, lstar, blocal, bmin, xj, mlt = outputs
+        self.make_lstar_trajectory_output = {'Lm':lm, 'MLT':mlt, 'blocal':blocal, 
+            'bmin':bmin, 'Lstar':lstar, 'xj':xj, 'computed':computed}
+        return self.make_lstar_trajectory_output
+
+    def make_lstar_shell_splitting(self, X, maginput, alpha, method='full', out=None, 
+                                   baddata_to_nan=False):
+        """
+        This function allows one to compute L, L*, Bmirror and I at any s/c position 
+        for several local pitch angles at once. The field setup and the search for the 
+        mirror points are done once per position for all of the pitch angles.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input time and location. The `time` key can be a
+            ISO-formatted time string, or a `datetime.datetime` or `pd.TimeStamp` objects. 
+            The three location keys: `x1`, `x2`, and `x3` specify the location in the `sysaxes`.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        alpha: float or array-like
+            The local pitch angles in degrees (at most 25).
+        method: str
+            'full' (make_lstar_shell_splitting1) or 'fast' 
+            (LAndI2Lstar_shell_splitting1). See make_lstar.
+        out: dict
+            Optional preallocated output arrays, with some or all of the 'Lm', 
+            'Lstar', 'bmirr', 'bmin', 'xj' and 'MLT' keys, shaped like the 
+            outputs. The outputs are written into them in place, so a 
+            streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        dict
+            Contains keys Lm, Lstar, bmirr and xj with shape (ntime, Nipa) and keys 
+            bmin and MLT with shape (ntime,).
+        """
+        self._check_lstar_method(method)
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=np.float64))
+        if alpha.ndim != 1 or not 1 <= alpha.shape[0] <= 25:
+            raise ValueError('alpha must be a scalar or a 1D array of 1 to 25 '
+                             f'pitch angles. Got shape {alpha.shape}.')
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+
+        outputs = self._make_lstar_shell_splitting_arrays(
+                iyear, idoy, ut, x1, x2, x3, maginput, tuple(alpha), method, 
+                out=_out_tuple(out, ['Lm', 'Lstar', 'bmirr', 'bmin', 'xj', 'MLT']))
+        if baddata_to_nan:
+            _baddata_to_nan(*outputs)
+        lm, lstar, bmirr, bmin, xj, mlt = outputs
+        self.make_lstar_shell_splitting_output = {'Lm':lm, 'Lstar':lstar, 
+            'bmirr':bmirr, 'bmin':bmin, 'xj':xj, 'MLT':mlt}
+        return self.make_lstar_shell_splitting_output
+
+    def make_lstar_foot_equator(self, X, maginput, stopAlt=100, out=None, 
+                                baddata_to_nan=False):
+        """
+        Computes the make_lstar outputs, the magnetic equator and the northern 
+        and southern foot points at any s/c position in one call 
+        (make_lstar_foot_equator1). The field model is set up once per 
+        position, and the equator and both foot points come from a single 
+        trace of the field line, instead of separate make_lstar, 
+        find_magequator and two find_foot_point calls.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input time and location. The `time` key can be a
+            ISO-formatted time string, or a `datetime.datetime` or `pd.TimeStamp` objects. 
+            The three location keys: `x1`, `x2`, and `x3` specify the location in the `sysaxes`.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        stopAlt: float
+            The foot point altitude above Earth's surface, in kilometers.
+        out: dict
+            Optional preallocated output arrays, with some or all of the 
+            output keys, shaped like the outputs. The outputs are written 
+            into them in place, so a streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        dict
+            Contains the make_lstar keys Lm, MLT, blocal, bmin, Lstar and xj, 
+            the (ntime, 3) GEO magnetic equator XGEO, and for the northern 
+            (_N) and southern (_S) magnetic hemispheres the (ntime, 3) GDZ 
+            foot point XFOOT, the (ntime, 3) GEO field BFOOT and its 
+            magnitude BFOOTMAG, as find_foot_point with hemiFlag=+1 and -1.
+            bmin is the make_lstar value, computed with the drift shell.
+        """
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+
+        keys = ['Lm', 'Lstar', 'blocal', 'bmin', 'xj', 'MLT', 'XGEO', 
+                'XFOOT_N', 'BFOOT_N', 'BFOOTMAG_N', 
+                'XFOOT_S', 'BFOOT_S', 'BFOOTMAG_S']
+        outputs = self._make_lstar_foot_equator_arrays(
+                iyear, idoy, ut, x1, x2, x3, maginput, stopAlt, 
+                out=_out_tuple(out, keys))
+        if baddata_to_nan:
+            _baddata_to_nan(*outputs)
+        self.make_lstar_foot_equator_output = dict(zip(keys, outputs))
+        return self.make_lstar_foot_equator_output
         
-    def drift_shell(self, X, maginput):
+    def drift_shell(self, X, maginput, compact=False):
         """
         This function traces a full drift shell for particles that have their 
         mirror point at the input location.  The output is a full array of positions 
@@ -195,6 +448,9 @@ class MagFields:
         maginput: dict
             The magnetic field input dictionary. See the online documentation for the valid
             keys and the corresponding models.
+        compact: bool
+            If True, POSIT and blocal only contain the points traced along the 48 field 
+            lines, packed one line after the other, and an "offsets" key is added.
 
         Returns
         -------
@@ -205,41 +461,146 @@ class MagFields:
             line, 3rd element: number of field lines. Nposit structure: long integer array 
             (48) providing the number of points along the field line for each field line 
             traced in 2nd element of POSIT max 1000.
+
+            With compact=True, POSIT has shape (total_points, 3), blocal has shape 
+            (total_points,) and the points of line i are POSIT[offsets[i]:offsets[i+1]].
         """
         # Prep the magnetic field model inputs and samping spacetime location.
         self._prepMagInput(maginput)
         iyear, idoy, ut, x1, x2, x3 = self._prepTimeLoc(X)
         
         # DEFINE OUTPUTS HERE        
-        positType = (((ctypes.c_double * 3) * 1000) * 48)
-        posit = positType()
-        npositType = (48 * ctypes.c_int)
-        nposit = npositType()
+        posit = np.empty((48, 1000, 3))
+        nposit = np.zeros(48, dtype=np.int32)
         lm, lstar, bmin, xj = [ctypes.c_double() for i in range(4)]
-        blocalType = ((ctypes.c_double * 1000) * 48)
-        blocal = blocalType()
+        blocal = np.zeros((48, 1000))
+
+        if self.cache is not None:
+            key = self._cache_keys('drift_shell', 
+                *[np.array([arg.value]) for arg in (iyear, idoy, ut, x1, x2, x3)], 
+                self.maginput)[0]
+            cached = self.cache.get_many([key])
+            if key in cached:
+                scalars, nposit, valid_posit, valid_blocal = _unpack_arrays(cached[key])
+                lm, lstar, bmin, xj = [ctypes.c_double(value) for value in scalars]
+                valid = np.arange(1000) < nposit[:, np.newaxis]
+                posit[valid] = valid_posit
+                blocal[valid] = valid_blocal
+                return self._format_drift_shell(lm, lstar, bmin, xj, posit, blocal, 
+                                                nposit, compact)
         
         if self.TMI: print("Running IRBEM-LIB drift_shell")
 
         self._irbem_obj.drift_shell1_(ctypes.byref(self.kext), ctypes.byref(self.options),\
                 ctypes.byref(self.sysaxes), ctypes.byref(iyear),\
                 ctypes.byref(idoy), ctypes.byref(ut), ctypes.byref(x1), \
-                ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(self.maginput), \
-                ctypes.byref(lm), ctypes.byref(lstar), ctypes.byref(blocal), \
-                ctypes.byref(bmin), ctypes.byref(xj), ctypes.byref(posit), \
-                ctypes.byref(nposit))
-        # Format the output into a dictionary, and convert ctypes arrays into
-        # native Python format.
-        posit = np.array(posit)
-        nposit = np.array(nposit)
-        for i,n in enumerate(nposit):
-            posit[i,n:,:] = np.nan
-        self.drift_shell_output = {'Lm':lm.value, 'blocal':np.array(blocal),
-            'bmin':bmin.value, 'lstar':lstar.value, 'xj':xj.value, 
-            'POSIT':posit, 'Nposit':nposit} 
+                ctypes.byref(x2), ctypes.byref(x3), _c_ptr(self.maginput), \
+                ctypes.byref(lm), ctypes.byref(lstar), _c_ptr(blocal), \
+                ctypes.byref(bmin), ctypes.byref(xj), _c_ptr(posit), \
+                _c_ptr(nposit))
+        if self.cache is not None:
+            valid = np.arange(1000) < np.clip(nposit, 0, 1000)[:, np.newaxis]
+            self.cache.put_many([(key, _pack_arrays(
+                np.array([lm.value, lstar.value, bmin.value, xj.value]), 
+                np.clip(nposit, 0, 1000), posit[valid], blocal[valid]))])
+        return self._format_drift_shell(lm, lstar, bmin, xj, posit, blocal, nposit, 
+                                        compact)
+
+    def _format_drift_shell(self, lm, lstar, bmin, xj, posit, blocal, nposit, compact):
+        """
+        Formats the drift_shell outputs into the drift_shell_output dictionary.
+        """
+        self.drift_shell_output = {'Lm':lm.value, 'bmin':bmin.value, 
+            'lstar':lstar.value, 'xj':xj.value, 'Nposit':nposit} 
+        self.drift_shell_output.update(_pack_lines(posit, blocal, nposit, compact))
         return self.drift_shell_output
+
+    def drift_shell_multi(self, X, maginput, baddata_to_nan=False):
+        """
+        Trace the drift shells of particles that have their mirror point at each 
+        of the input locations. All of the shells are traced in one Fortran call 
+        (per NTIME_MAX chunk) and returned in the compact layout of 
+        drift_shell(..., compact=True), with the 48 lines of each shell one 
+        after the other.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input times and locations. The `time` key 
+            can be an array of ISO-formatted time strings, `datetime.datetime`, 
+            `numpy.datetime64` or pandas times. The three location keys: `x1`, `x2`, 
+            and `x3` specify the locations in the `sysaxes`.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        dict:
+            A dictionary with nine keys:
+            - "POSIT" the GEO coordinates of all drift shell points with shape (total_points, 3).
+            - "blocal" the magnitude of the magnetic field at each POSIT point.
+            - "offsets" an (48*N+1,) array. The points of line j of shell i are 
+              POSIT[offsets[48*i+j]:offsets[48*i+j+1]].
+            - "Nposit" the number of points along each line with shape (N, 48).
+            - "Lm" is the McIlwain L shell of each shell.
+            - "lstar" is Roederer L* or Φ of each shell.
+            - "bmin" the magnitude of the minimum magnetic field of each shell.
+            - "xj" I, related to second adiabatic invariant, of each shell.
+        """
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+        ntime = ntime.value
+
+        lm, lstar, bmin, xj = [np.empty(ntime) for i in range(4)]
+        offsets = np.zeros(48*ntime+1, dtype=np.int32)
+        # The Fortran routine needs room for a full shell (48 lines of up to 
+        # 1000 points) before tracing it, so start with a few shells and grow.
+        capacity = 4*48000
+        posit = np.empty((capacity, 3))
+        blocal = np.empty(capacity)
+        n_used = 0
+        maxPoints = ctypes.c_int()
+        nProcessed = ctypes.c_int()
+
+        if self.TMI: print("Running IRBEM-LIB drift_shell_multi")
+
+        start = 0
+        while start < ntime:
+            stop = min(start + self.NTIME_MAX.value, ntime)
+            if capacity - n_used < 48000:
+                capacity = 2*capacity
+                posit = _grow(posit, capacity)
+                blocal = _grow(blocal, capacity)
+            maxPoints.value = capacity - n_used
+            line_offsets = np.empty(48*(stop-start)+1, dtype=np.int32)
+            mag = np.ascontiguousarray(maginput[start:stop])
+            self._irbem_obj.drift_shell_multi_(
+                ctypes.byref(ctypes.c_int(stop-start)), ctypes.byref(self.kext), 
+                ctypes.byref(self.options), ctypes.byref(self.sysaxes), 
+                _c_ptr(iyear[start:]), _c_ptr(idoy[start:]), _c_ptr(ut[start:]), 
+                _c_ptr(x1[start:]), _c_ptr(x2[start:]), _c_ptr(x3[start:]), 
+                _c_ptr(mag), ctypes.byref(maxPoints), _c_ptr(lm[start:]), 
+                _c_ptr(lstar[start:]), _c_ptr(blocal[n_used:]), 
+                _c_ptr(bmin[start:]), _c_ptr(xj[start:]), _c_ptr(posit[n_used:]), 
+                _c_ptr(line_offsets), ctypes.byref(nProcessed))
+            n = 48*nProcessed.value
+            offsets[48*start+1:48*start+n+1] = n_used + line_offsets[1:n+1]
+            n_used = int(offsets[48*start+n])
+            start += nProcessed.value
+
+        if baddata_to_nan:
+            _baddata_to_nan(lm, lstar, bmin, xj)
+        self.drift_shell_multi_output = {
+            'POSIT':posit[:n_used].copy(), 'blocal':blocal[:n_used].copy(), 
+            'offsets':offsets, 'Nposit':np.diff(offsets).reshape(ntime, 48), 
+            'Lm':lm, 'lstar':lstar, 'bmin':bmin, 'xj':xj
+            }
+        return self.drift_shell_multi_output
                    
-    def drift_bounce_orbit(self, X, maginput, alpha=90, R0=1):
+    def drift_bounce_orbit(self, X, maginput, alpha=90, R0=1, compact=False):
         """
         This function traces a full drift-bounce orbit for particles with a specified pitch
         angle at the input location.  The output is a full array of positions of the
@@ -268,6 +629,10 @@ class MagFields:
         R0: float
             The radius, in units of RE, of the reference surface (i.e. altitude) between which
             the line is traced.
+        compact: bool
+            If True, POSIT and blocal only contain the points traced along the 25 field 
+            lines, packed one line after the other, and an "offsets" key is added. See 
+            `drift_shell`.
 
         Returns
         -------
@@ -281,35 +646,28 @@ class MagFields:
         R0 = ctypes.c_double(R0)
 
         # DEFINE OUTPUTS HERE
-        positType = (((ctypes.c_double * 3) * 1000) * 25)
-        posit = positType()
-        npositType = (25 * ctypes.c_int)
-        nposit = npositType()
+        posit = np.empty((25, 1000, 3))
+        nposit = np.zeros(25, dtype=np.int32)
         lm, lstar, bmin, bmirr, xj, hmin, hmin_lon = [ctypes.c_double() for i in range(7)]
-        blocalType = ((ctypes.c_double * 1000) * 25)
-        blocal = blocalType()
+        blocal = np.zeros((25, 1000))
 
         if self.TMI: print("Running IRBEM-LIB drift_bounce_orbit")
         self._irbem_obj.drift_bounce_orbit2_1_(ctypes.byref(self.kext), ctypes.byref(self.options),\
                 ctypes.byref(self.sysaxes), ctypes.byref(iyear),\
                 ctypes.byref(idoy), ctypes.byref(ut), ctypes.byref(x1), \
-                ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(alpha), ctypes.byref(self.maginput), \
-                ctypes.byref(R0), ctypes.byref(lm), ctypes.byref(lstar), ctypes.byref(blocal), \
-                ctypes.byref(bmin), ctypes.byref(bmirr), ctypes.byref(xj), ctypes.byref(posit), \
-                ctypes.byref(nposit), ctypes.byref(hmin), ctypes.byref(hmin_lon))
-        # Format the output into a dictionary, and convert ctypes arrays into
-        # native Python format.
-        posit = np.array(posit)
-        nposit = np.array(nposit)
-        for i,n in enumerate(nposit):
-            posit[i,n:,:] = np.nan
-        self.drift_bounce_orbit_output = {'Lm':lm.value, 'blocal':np.array(blocal),
-            'bmin':bmin.value, 'bmirr':bmirr.value, 'lstar':lstar.value, 'xj':xj.value,
-            'POSIT':posit, 'Nposit':nposit, 'hmin':hmin.value,
-            'hmin_lon': hmin_lon.value}
+                ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(alpha), _c_ptr(self.maginput), \
+                ctypes.byref(R0), ctypes.byref(lm), ctypes.byref(lstar), _c_ptr(blocal), \
+                ctypes.byref(bmin), ctypes.byref(bmirr), ctypes.byref(xj), _c_ptr(posit), \
+                _c_ptr(nposit), ctypes.byref(hmin), ctypes.byref(hmin_lon))
+        # Format the output into a dictionary.
+        self.drift_bounce_orbit_output = {'Lm':lm.value, 'bmin':bmin.value, 
+            'bmirr':bmirr.value, 'lstar':lstar.value, 'xj':xj.value,
+            'Nposit':nposit, 'hmin':hmin.value, 'hmin_lon': hmin_lon.value}
+        self.drift_bounce_orbit_output.update(
+            _pack_lines(posit, blocal, nposit, compact))
         return self.drift_bounce_orbit_output
     
-    def find_mirror_point(self, X, maginput, alpha):
+    def find_mirror_point(self, X, maginput, alpha, out=None, baddata_to_nan=False):
         """
         Find the magnitude and location of the mirror point along a field 
         line traced from any given location and local pitch-angle.
@@ -323,15 +681,40 @@ class MagFields:
         maginput: dict
             The magnetic field input dictionary. See the online documentation for the valid
             keys and the corresponding models.
-        alpha: float
-            The local pitch angle in degrees.
+        alpha: float or array
+            The local pitch angle in degrees. One value per time can be given 
+            with array inputs.
+        out: dict
+            Optional preallocated output arrays for array inputs, with some or 
+            all of the 'blocal', 'bmin' and 'POSIT' keys, shaped like the 
+            outputs. The outputs are written into them in place, so a 
+            streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs of 
+            array inputs.
 
         Returns
         -------
         dict
             A dictionary with "blocal" and "bmin" scalars, and "POSIT" that contains the 
-            GEO coordinates of the mirror point.
+            GEO coordinates of the mirror point. If X contains arrays, all of the 
+            points are run in one Fortran call and "blocal" and "bmin" are 
+            (N,) arrays and "POSIT" is an (N,3) array.
         """
+        if _is_array_input(X):
+            ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+            maginput = self._prepMagInput(maginput, ntime.value)
+            alpha = np.ascontiguousarray(
+                np.broadcast_to(np.asarray(alpha, dtype=np.float64), (ntime.value,))
+                )
+            blocal, bmin, posit = self._find_mirror_point_arrays(
+                iyear, idoy, ut, x1, x2, x3, maginput, alpha, 
+                out=_out_tuple(out, ['blocal', 'bmin', 'POSIT']))
+            if baddata_to_nan:
+                _baddata_to_nan(blocal, bmin, posit)
+            self.find_mirror_point_output = {'blocal':blocal, 'bmin':bmin, 'POSIT':posit}
+            return self.find_mirror_point_output
+
         a = ctypes.c_double(alpha)
         
         # Prep the magnetic field model inputs and samping spacetime location.
@@ -348,14 +731,15 @@ class MagFields:
                 ctypes.byref(self.options), ctypes.byref(self.sysaxes), \
                 ctypes.byref(iyear), ctypes.byref(idoy), ctypes.byref(ut), \
                 ctypes.byref(x1), ctypes.byref(x2), ctypes.byref(x3), \
-                ctypes.byref(a), ctypes.byref(self.maginput), \
+                ctypes.byref(a), _c_ptr(self.maginput), \
                 ctypes.byref(blocal), ctypes.byref(bmin), ctypes.byref(posit))     
                 
         self.find_mirror_point_output = {'blocal':blocal.value, 'bmin':bmin.value, \
                 'POSIT':posit[:]}
         return self.find_mirror_point_output
     
-    def find_foot_point(self, X, maginput, stopAlt, hemiFlag):
+    def find_foot_point(self, X, maginput, stopAlt, hemiFlag, out=None, 
+                        baddata_to_nan=False):
         """
         Find the footprint of a field line that passes throgh location X in
         a given hemisphere.
@@ -377,6 +761,14 @@ class MagFields:
             - +1   = northern magnetic hemisphere
             - -1   = southern magnetic hemisphere
             - +2   = opposite magnetic hemisphere as starting point  
+        out: dict
+            Optional preallocated output arrays for array inputs, with some or 
+            all of the 'XFOOT', 'BFOOT' and 'BFOOTMAG' keys, shaped like the 
+            outputs. The outputs are written into them in place, so a 
+            streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs of 
+            array inputs.
 
         Returns
         -------
@@ -386,7 +778,21 @@ class MagFields:
             - "BFOOT" the magnetic field vector at the footprint, in GEO coordinates, and in 
             unit of nT.
             - "BFOOTMAG" the footprint magnetic field magnitude in nT units.
+            If X contains arrays, all of the points are run in one Fortran call and 
+            "XFOOT" and "BFOOT" are (N,3) arrays and "BFOOTMAG" is an (N,) array.
         """
+        if _is_array_input(X):
+            ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+            maginput = self._prepMagInput(maginput, ntime.value)
+            XFOOT, BFOOT, BFOOTMAG = self._find_foot_point_arrays(
+                iyear, idoy, ut, x1, x2, x3, maginput, stopAlt, hemiFlag, 
+                out=_out_tuple(out, ['XFOOT', 'BFOOT', 'BFOOTMAG']))
+            if baddata_to_nan:
+                _baddata_to_nan(XFOOT, BFOOT, BFOOTMAG)
+            self.find_foot_point_output = {'XFOOT':XFOOT, 'BFOOT':BFOOT, 
+                                           'BFOOTMAG':BFOOTMAG}
+            return self.find_foot_point_output
+
         # Prep the magnetic field model inputs and samping spacetime location.
         self._prepMagInput(maginput)
         iyear, idoy, ut, x1, x2, x3 = self._prepTimeLoc(X)      
@@ -407,7 +813,7 @@ class MagFields:
                 ctypes.byref(self.sysaxes), ctypes.byref(iyear),\
                 ctypes.byref(idoy), ctypes.byref(ut), ctypes.byref(x1), \
                 ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(stop_alt), \
-                ctypes.byref(hemi_flag), ctypes.byref(self.maginput), \
+                ctypes.byref(hemi_flag), _c_ptr(self.maginput), \
                 ctypes.byref(XFOOT), ctypes.byref(BFOOT), \
                 ctypes.byref(BFOOTMAG))
         self.find_foot_point_output = {'XFOOT':XFOOT[:], 'BFOOT':BFOOT[:], \
@@ -466,7 +872,7 @@ class MagFields:
                 ctypes.byref(self.options),\
                 ctypes.byref(self.sysaxes), ctypes.byref(iyear),\
                 ctypes.byref(idoy), ctypes.byref(ut), ctypes.byref(x1), \
-                ctypes.byref(x2), ctypes.byref(x3), ctypes.byref(self.maginput), \
+                ctypes.byref(x2), ctypes.byref(x3), _c_ptr(self.maginput), \
                 ctypes.byref(R0), ctypes.byref(lm), ctypes.byref(blocal), \
                 ctypes.byref(bmin), ctypes.byref(xj), ctypes.byref(posit), \
                 ctypes.byref(Nposit))
@@ -475,8 +881,97 @@ class MagFields:
         "Nposit":Nposit.value, 'lm':lm.value, 'blocal':np.array(blocal[:Nposit.value]), \
         'bmin':bmin.value, 'xj':xj.value}        
         return self.trace_field_line_output
+
+    def trace_field_line_multi(self, X, maginput, R0=1, baddata_to_nan=False):
+        """
+        Trace the full field lines which cross each of the input positions. All 
+        of the lines are traced in one Fortran call (per NTIME_MAX chunk) and 
+        returned in a compact ragged layout, so the memory scales with the 
+        number of points along the traced lines.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input times and locations. The `time` key 
+            can be an array of ISO-formatted time strings, `datetime.datetime`, 
+            `numpy.datetime64` or pandas times. The three location keys: `x1`, `x2`, 
+            and `x3` specify the locations in the `sysaxes`.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        R0: float
+            The radius, in units of RE, of the reference surface (i.e. altitude) between which 
+            the lines are traced.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        dict:
+            A dictionary with seven keys:
+            - "POSIT" the GEO coordinates of all field line points with shape (total_points, 3).
+            - "blocal" the magnitude of the magnetic field at each POSIT point.
+            - "offsets" an (N+1,) array. The points of line i are 
+              POSIT[offsets[i]:offsets[i+1]].
+            - "Nposit" the number of points along each field line.
+            - "lm" is the McIlwain L shell of each line.
+            - "bmin" the magnitude of the minimum magnetic field of each line.
+            - "xj" I, related to second adiabatic invariant, of each line.
+        """
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+        ntime = ntime.value
+
+        lm, bmin, xj = [np.empty(ntime) for i in range(3)]
+        offsets = np.zeros(ntime+1, dtype=np.int32)
+        # Start with room for a few hundred points per line of the first 
+        # chunk, and grow when the Fortran routine stops for lack of room for 
+        # the next line, which has at most 3000 points.
+        capacity = 3000 + 300*min(ntime, self.NTIME_MAX.value)
+        posit = np.empty((capacity, 3))
+        blocal = np.empty(capacity)
+        n_used = 0
+        maxPoints = ctypes.c_int()
+        nProcessed = ctypes.c_int()
+
+        if self.TMI: print("Running IRBEM-LIB trace_field_line_multi")
+
+        start = 0
+        while start < ntime:
+            stop = min(start + self.NTIME_MAX.value, ntime)
+            if capacity - n_used < 3000:
+                capacity = 2*capacity
+                posit = _grow(posit, capacity)
+                blocal = _grow(blocal, capacity)
+            maxPoints.value = capacity - n_used
+            line_offsets = np.empty(stop-start+1, dtype=np.int32)
+            mag = np.ascontiguousarray(maginput[start:stop])
+            # The input views start at the first line left to trace and the 
+            # output views at the first free point.
+            self._irbem_obj.trace_field_line_multi_(
+                ctypes.byref(ctypes.c_int(stop-start)), ctypes.byref(self.kext), 
+                ctypes.byref(self.options), ctypes.byref(self.sysaxes), 
+                _c_ptr(iyear[start:]), _c_ptr(idoy[start:]), _c_ptr(ut[start:]), 
+                _c_ptr(x1[start:]), _c_ptr(x2[start:]), _c_ptr(x3[start:]), 
+                _c_ptr(mag), ctypes.byref(ctypes.c_double(R0)), 
+                ctypes.byref(maxPoints), _c_ptr(lm[start:]), _c_ptr(blocal[n_used:]), 
+                _c_ptr(bmin[start:]), _c_ptr(xj[start:]), _c_ptr(posit[n_used:]), 
+                _c_ptr(line_offsets), ctypes.byref(nProcessed))
+            n = nProcessed.value
+            offsets[start+1:start+n+1] = n_used + line_offsets[1:n+1]
+            n_used = int(offsets[start+n])
+            start += n
+
+        if baddata_to_nan:
+            _baddata_to_nan(lm, bmin, xj)
+        self.trace_field_line_multi_output = {
+            'POSIT':posit[:n_used].copy(), 'blocal':blocal[:n_used].copy(), 
+            'offsets':offsets, 'Nposit':np.diff(offsets), 'lm':lm, 'bmin':bmin, 
+            'xj':xj
+            }
+        return self.trace_field_line_multi_output
         
-    def find_magequator(self, X, maginput):
+    def find_magequator(self, X, maginput, out=None, baddata_to_nan=False):
         """
         Find the coordinates of the magnetic equator from tracing the magntic 
         field line from the input location.
@@ -490,6 +985,14 @@ class MagFields:
         maginput: dict
             The magnetic field input dictionary. See the online documentation for the valid
             keys and the corresponding models.
+        out: dict
+            Optional preallocated output arrays for array inputs, with some or 
+            all of the 'bmin' and 'XGEO' keys, shaped like the outputs. The 
+            outputs are written into them in place, so a streaming loop can 
+            reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs of 
+            array inputs.
 
         Returns
         -------
@@ -497,7 +1000,19 @@ class MagFields:
             A dictionary with two keys:
             - "bmin" the magntitude of the magnetic field at the equator.
             - "XGEO" the location of the magnetic equator in GEO coordinates.
+            If X contains arrays, all of the points are run in one Fortran call and 
+            "bmin" is an (N,) array and "XGEO" is an (N,3) array.
         """
+        if _is_array_input(X):
+            ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+            maginput = self._prepMagInput(maginput, ntime.value)
+            bmin, XGEO = self._find_magequator_arrays(iyear, idoy, ut, x1, x2, x3, 
+                maginput, out=_out_tuple(out, ['bmin', 'XGEO']))
+            if baddata_to_nan:
+                _baddata_to_nan(bmin, XGEO)
+            self.find_magequator_output = {'bmin':bmin, 'XGEO':XGEO}
+            return self.find_magequator_output
+
         # Prep the magnetic field model inputs and samping spacetime location.
         self._prepMagInput(maginput)
         iyear, idoy, ut, x1, x2, x3 = self._prepTimeLoc(X)
@@ -513,12 +1028,12 @@ class MagFields:
                 ctypes.byref(self.options), ctypes.byref(self.sysaxes), \
                 ctypes.byref(iyear), ctypes.byref(idoy), ctypes.byref(ut), \
                 ctypes.byref(x1), ctypes.byref(x2), ctypes.byref(x3), \
-                ctypes.byref(self.maginput), ctypes.byref(bmin), \
+                _c_ptr(self.maginput), ctypes.byref(bmin), \
                 ctypes.byref(XGEO))
         self.find_magequator_output = {'bmin':bmin.value, 'XGEO':np.array(XGEO)}
         return self.find_magequator_output
 
-    def get_field_multi(self, X, maginput):
+    def get_field_multi(self, X, maginput, out=None, baddata_to_nan=False):
         """
         This function computes the GEO vector of the magnetic field at input 
         location for a set of internal/external magnetic field to be selected. 
@@ -529,6 +1044,13 @@ class MagFields:
             The dictionary specifying the time and location.  
         maginput : dict
             The magnetic field inpit parameter dictionary.
+        out: dict
+            Optional preallocated output arrays, with some or all of the keys 
+            'Bgeo', an (ntime, 3) array that BxGEO, ByGEO and BzGEO are views 
+            of, and 'Bl'. The outputs are written into them in place, so a 
+            streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
 
         Returns
         -------
@@ -558,28 +1080,162 @@ class MagFields:
         ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
 
         # Prep magnetic field model inputs        
-        maginput = self._prepMagInput(maginput)
-
-        # Model output types
-        Bl_type = ctypes.c_double * ntime.value
-        Bgeo_type = ( (ctypes.c_double * 3) * ntime.value )
-        # Model output arrays
-        Bgeo = Bgeo_type()
-        Bl = Bl_type()
+        maginput = self._prepMagInput(maginput, ntime.value)
+
+        Bgeo, Bl = self._get_field_multi_arrays(iyear, idoy, ut, x1, x2, x3, 
+            maginput, out=_out_tuple(out, ['Bgeo', 'Bl']))
+        if baddata_to_nan:
+            _baddata_to_nan(Bgeo, Bl)
+        self.get_field_multi_output = {'BxGEO':Bgeo[:,0], 'ByGEO':Bgeo[:,1], 
+            'BzGEO':Bgeo[:,2], 'Bl':Bl}
+        return self.get_field_multi_output
+
+    def get_hemi(self, X, maginput, out=None):
+        """
+        This function computes the magnetic hemisphere of the input locations 
+        by comparing the magnetic field magnitude at each location to the 
+        magnitude a small step along the field line.
+
+        Parameters
+        ----------
+        X : dict
+            The dictionary specifying the time and location.  
+        maginput : dict
+            The magnetic field inpit parameter dictionary.
+        out: array
+            An optional preallocated (ntime,) int8 array to write the output into.
+
+        Returns
+        -------
+        xHEMI: array
+            An int8 array with +1 for the northern magnetic hemisphere, -1 for 
+            the southern magnetic hemisphere and 0 for an invalid magnetic field.
         
-        if self.TMI: print("Running IRBEM-LIB get_field_multi")
+        Example
+        -------
+        model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=True)
+        LLA = {}
+        LLA['x1'] = [651, 651]
+        LLA['x2'] = [63.97, -63.97]
+        LLA['x3'] = [15.9, 15.9]
+        LLA['dateTime'] = ['2015-02-02T06:12:43', '2015-02-02T06:12:43']
+        maginput = {'Kp':[40.0, 40.0]} 
+        output = model.get_hemi(LLA, maginput)
+        print(output)
+        """
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
 
-        self._irbem_obj.get_field_multi_(
-                ctypes.byref(ntime), ctypes.byref(self.kext), 
-                ctypes.byref(self.options), ctypes.byref(self.sysaxes), 
-                ctypes.byref(iyear), ctypes.byref(idoy), ctypes.byref(ut), 
-                ctypes.byref(x1), ctypes.byref(x2), ctypes.byref(x3), 
-                ctypes.byref(maginput), ctypes.byref(Bgeo), ctypes.byref(Bl)
-                )
-        Bgeo_np = np.array(Bgeo)
-        self.get_field_multi_output = {'BxGEO':Bgeo_np[:,0], 'ByGEO':Bgeo_np[:,1], 
-            'BzGEO':Bgeo_np[:,2], 'Bl':np.array(Bl)}
-        return self.get_field_multi_output
+        xhemi, = self._get_hemi_arrays(iyear, idoy, ut, x1, x2, x3, maginput)
+        if out is None:
+            out, = _output_buffers(None, [xhemi.shape], dtype=np.int8)
+        else:
+            _output_buffers((out,), [xhemi.shape], dtype=np.int8)
+        out[:] = xhemi
+        self.get_hemi_output = out
+        return self.get_hemi_output
+
+    def get_bderivs(self, X, maginput, dX=1E-3, out=None, baddata_to_nan=False):
+        """
+        This function computes the magnetic field and its spatial derivatives, 
+        in GEO, at the input locations with finite differences.
+
+        Parameters
+        ----------
+        X : dict
+            The dictionary specifying the time and location.  
+        maginput : dict
+            The magnetic field inpit parameter dictionary.
+        dX: float
+            The step size, in Re, of the finite differences.
+        out: dict
+            Optional preallocated output arrays, with some or all of the 'Bgeo', 
+            'Bmag', 'gradBmag' and 'diffB' keys, shaped like the outputs. The 
+            outputs are written into them in place, so a streaming loop can 
+            reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        A dictionary with the following key-value pairs:
+        Bgeo: array
+            The (ntime, 3) GEO components of the magnetic field (nT)
+        Bmag: array
+            Magnitude of magnetic field (nT)
+        gradBmag: array
+            The (ntime, 3) GEO gradient of Bmag (nT/Re)
+        diffB: array
+            The (ntime, 3, 3) derivatives of Bgeo, diffB[t, i, j] = dB_i/dx_j (nT/Re)
+        """
+        ntime, iyear, idoy, ut, x1, x2, x3 = self._prepTimeLocArray(X)
+        maginput = self._prepMagInput(maginput, ntime.value)
+
+        out = _out_tuple(out, ['Bgeo', 'Bmag', 'gradBmag', 'diffB'])
+        Bgeo, Bmag, gradBmag, diffB = self._get_bderivs_arrays(
+            iyear, idoy, ut, x1, x2, x3, maginput, dX, self.sysaxes.value, 
+            out=None if out is None else out[:3] + (None,))
+        if baddata_to_nan:
+            _baddata_to_nan(Bgeo, Bmag, gradBmag, diffB)
+        # The Fortran diffB(i, j, t) array is (t, j, i) in C order.
+        diffB = diffB.swapaxes(1, 2)
+        if out is not None and out[3] is not None:
+            out[3][:] = diffB
+            diffB = out[3]
+        self.get_bderivs_output = {'Bgeo':Bgeo, 'Bmag':Bmag, 'gradBmag':gradBmag, 
+            'diffB':diffB}
+        return self.get_bderivs_output
+
+    def compute_grad_curv_curl(self, bderivs, out=None, baddata_to_nan=False):
+        """
+        This function computes the gradient and curvature drift factors, the 
+        curvature, the curl and the divergence of the magnetic field from the 
+        get_bderivs() output.
+
+        Parameters
+        ----------
+        bderivs: dict
+            The get_bderivs() output dictionary.
+        out: dict
+            Optional preallocated output arrays, with some or all of the output 
+            keys, shaped like the outputs. The outputs are written into them in 
+            place, so a streaming loop can reuse the same memory.
+        baddata_to_nan: bool
+            Replace IRBEM-LIB's -1E31 bad data value with NaN in the outputs.
+
+        Returns
+        -------
+        A dictionary with the following key-value pairs, all in GEO:
+        grad_par: array
+            Gradient of Bmag along B (nT/Re)
+        grad_perp: array
+            The (ntime, 3) gradient of Bmag perpendicular to B (nT/Re)
+        grad_drift: array
+            The (ntime, 3) (bhat x grad_perp)/B (1/Re), part of the gradient drift 
+            velocity
+        curvature: array
+            The (ntime, 3) (bhat dot grad)bhat (1/Re), part of the curvature force
+        Rcurv: array
+            Radius of curvature 1/|curvature| (Re)
+        curv_drift: array
+            The (ntime, 3) bhat x curvature (1/Re), part of the curvature drift
+        curlB: array
+            The (ntime, 3) curl of B (nT/Re)
+        divB: array
+            Divergence of B (nT/Re), should be zero
+        """
+        diffB = np.ascontiguousarray(np.swapaxes(bderivs['diffB'], 1, 2), dtype=np.float64)
+        keys = ['grad_par', 'grad_perp', 'grad_drift', 'curvature', 'Rcurv', 
+                'curv_drift', 'curlB', 'divB']
+        outputs = self._compute_grad_curv_curl_arrays(
+            np.ascontiguousarray(bderivs['Bgeo'], dtype=np.float64), 
+            np.ascontiguousarray(bderivs['Bmag'], dtype=np.float64), 
+            np.ascontiguousarray(bderivs['gradBmag'], dtype=np.float64), diffB, 
+            out=_out_tuple(out, keys))
+        if baddata_to_nan:
+            _baddata_to_nan(*outputs)
+        self.compute_grad_curv_curl_output = dict(zip(keys, outputs))
+        return self.compute_grad_curv_curl_output
 
     def get_mlt(self, X):
         """
@@ -588,8 +1244,9 @@ class MagFields:
 
         Parameters
         ----------
-        X: dict
-            The dictionary specifying the time and location in GEO coordinates. 
+        X: dict or PreparedInput
+            The dictionary specifying the time and location in GEO coordinates, 
+            or a PreparedInput of one point. 
 
         Returns
         -------
@@ -597,9 +1254,9 @@ class MagFields:
             The MLT value (hours).
         """
         # Inputs
-        iyear, idoy, ut, _, _, _ = self._prepTimeLoc(X)
+        iyear, idoy, ut, x1, x2, x3 = self._prepTimeLoc(X)
         coordsType =  ctypes.c_double * 3
-        geo_coords = coordsType(X['x1'], X['x2'], X['x3'])
+        geo_coords = coordsType(x1.value, x2.value, x3.value)
 
         # Model output variable
         MLT = ctypes.c_double(-9999)
@@ -685,6 +1342,172 @@ class MagFields:
             self.Tb = 2*np.sum(np.divide(ds[1:-1], vparalel(E, fLine['mirrorB'], dB, 
                                              Erest = Erest)[1:-1]))
         return self.Tb
+
+    def bounce_period_multi(self, X, maginput, E, alpha=90, Erest=511, R0=1, nNodes=64):
+        """
+        Calculate the bounce periods on a grid of locations, local pitch angles and 
+        energies. Each field line is traced once (all of them in one 
+        trace_field_line_multi call) and used for all of its pitch angles, and the 
+        energy dependence, 1/v, is applied by broadcasting.
+
+        The bounce period is 2/v times the integral of ds/sqrt(1 - B(s)/Bm) between 
+        the mirror points s1 and s2, with B(s) a cubic spline of the traced field. 
+        Substituting s = (s1 + s2)/2 - (s2 - s1)/2*cos(theta) removes the inverse 
+        square root singularities at the mirror points, so a Gauss-Legendre 
+        quadrature in theta converges quickly.
+
+        Parameters
+        ----------
+        X: dict
+            A dictionary that specifies the input times and locations. The `time` key 
+            can be a single time or an array of times (see trace_field_line_multi). The 
+            three location keys: `x1`, `x2`, and `x3` specify the locations in the `sysaxes`.
+        maginput: dict
+            The magnetic field input dictionary. See the online documentation for the valid
+            keys and the corresponding models.
+        E: float, list, or np.array
+            The particle energies in keV.
+        alpha: float, list, or np.array
+            The local pitch angles in degrees.
+        Erest: float
+            The particle's rest energy in keV.
+        R0: float
+            The radius, in units of RE, of the reference surface (i.e. altitude) between which 
+            the lines are traced.
+        nNodes: int
+            The number of Gauss-Legendre nodes of the quadrature.
+
+        Returns
+        -------
+        np.array
+            Bounce periods in seconds with shape (n_locations, n_alpha, n_E). The 
+            bounce period is NaN if a mirror point is below R0, the field line is 
+            open, or the particle mirrors at the minimum of B along the line.
+        """
+        if self.TMI: print('IRBEM: Calculating bounce periods')
+        E = np.atleast_1d(np.asarray(E, dtype=np.float64))
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=np.float64))
+
+        inputblocal = self.get_field_multi(X, maginput)['Bl']
+        lines = self.trace_field_line_multi(X, maginput, R0=R0)
+        offsets = lines['offsets']
+
+        theta, weights = _bounce_quadrature(nNodes)
+        mirrorB = inputblocal[:, np.newaxis]/np.sin(np.deg2rad(alpha))**2
+        path = np.full(mirrorB.shape, np.nan)
+        for i in range(inputblocal.shape[0]):
+            line = slice(offsets[i], offsets[i+1])
+            path[i] = _bounce_path_integral(lines['POSIT'][line], lines['blocal'][line], 
+                                            mirrorB[i], theta, weights)
+        # The path integral is in Re.
+        v = c*beta(E, Erest)
+        self.Tb = 2*Re*1E3*path[:, :, np.newaxis]/v
+        return self.Tb
+
+    def drift_bounce_period_grid(self, L, alpha, E, dateTime, maginput, MLT=0, 
+                                 Erest=511, R0=1, nNodes=32, dX=1E-3):
+        """
+        Calculate the bounce and gradient-curvature drift periods on a grid of 
+        L, equatorial pitch angles and energies for one model epoch.
+
+        One field line is traced per L, from the SM equatorial plane at the given 
+        MLT, and used for all of the pitch angles. The bounce integrals use the 
+        quadrature of bounce_period_multi(), and the field derivatives at the 
+        quadrature nodes of all lines come from one get_bderivs() call. The 
+        drift period is 2*pi over the bounce averaged angular drift velocity 
+        about the model's dipole axis on that meridian, which is exact in an 
+        axisymmetric field. Since the energy only enters through v and p*v, it 
+        is applied by broadcasting.
+
+        Parameters
+        ----------
+        L: float, list, or np.array
+            The radial distances, in Re, of the starting points in the SM 
+            equatorial plane.
+        alpha: float, list, or np.array
+            The equatorial pitch angles in degrees (less than 90).
+        E: float, list, or np.array
+            The particle energies in keV.
+        dateTime: str, datetime.datetime, or np.datetime64
+            The model epoch.
+        maginput: dict
+            The magnetic field input dictionary, with one value per key.
+        MLT: float
+            The magnetic local time, in hours, of the starting points.
+        Erest: float
+            The particle's rest energy in keV.
+        R0: float
+            The radius, in units of RE, of the reference surface (i.e. altitude) 
+            between which the lines are traced.
+        nNodes: int
+            The number of Gauss-Legendre nodes of the bounce integrals.
+        dX: float
+            The step size, in Re, of the magnetic field derivatives.
+
+        Returns
+        -------
+        dict
+            Contains the "Tb" bounce and "Td" drift periods in seconds, both 
+            with shape (n_L, n_alpha, n_E), and the "Lm" and "bmin" of each 
+            traced field line. The periods are NaN where a mirror point is below 
+            R0 or the field line is open.
+        """
+        L = np.atleast_1d(np.asarray(L, dtype=np.float64))
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=np.float64))
+        E = np.atleast_1d(np.asarray(E, dtype=np.float64))
+        nL = L.shape[0]
+
+        # Trace the field lines from the starting points in the model's sysaxes.
+        coords = Coords(path=self.path)
+        times = np.repeat(_to_datetime64(dateTime), nL)
+        phi = np.deg2rad(15*(MLT - 12))
+        posSM = np.column_stack((L*np.cos(phi), L*np.sin(phi), np.zeros(nL)))
+        pos = coords.transform(times, posSM, 'SM', self.sysaxes.value)
+        X = {'x1':pos[:, 0], 'x2':pos[:, 1], 'x3':pos[:, 2], 'dateTime':times}
+        lines = self.trace_field_line_multi(X, maginput, R0=R0)
+        offsets = lines['offsets']
+        mirrorB = lines['bmin'][:, np.newaxis]/np.sin(np.deg2rad(alpha))**2
+
+        # Quadrature nodes and weights of every (L, alpha) bounce integral.
+        theta, weights = _bounce_quadrature(nNodes)
+        nodes = np.full((nL, alpha.shape[0], nNodes, 3), np.nan)
+        B = np.full(nodes.shape[:-1], np.nan)
+        w = np.full(nodes.shape[:-1], np.nan)
+        for i in range(nL):
+            line = slice(offsets[i], offsets[i+1])
+            splines = _spline_field_line(lines['POSIT'][line], lines['blocal'][line])
+            if splines is None:
+                continue
+            nodes[i], B[i], w[i] = _bounce_nodes(*splines, mirrorB[i], theta, weights)
+        path = np.sum(w, axis=-1)
+
+        # Bounce averaged angular drift velocity about the dipole axis.
+        valid = ~np.isnan(B)
+        nValid = int(valid.sum())
+        iyear, idoy, ut = _decode_times(times[:1])
+        Bgeo, Bmag, gradBmag, diffB = self._get_bderivs_arrays(
+            np.repeat(iyear, nValid), np.repeat(idoy, nValid), np.repeat(ut, nValid), 
+            *[np.ascontiguousarray(nodes[valid][:, k]) for k in range(3)], 
+            self._prepMagInput(maginput, nValid), dX, 1)
+        _, _, grad_drift, _, _, curv_drift, _, _ = self._compute_grad_curv_curl_arrays(
+            Bgeo, Bmag, gradBmag, diffB)
+        sin2 = (Bmag/np.broadcast_to(mirrorB[:, :, np.newaxis], B.shape)[valid])[:, np.newaxis]
+        drift = (sin2/2*grad_drift + (1 - sin2)*curv_drift)/Bmag[:, np.newaxis]
+        axis = self._dipole_axis(iyear, idoy, ut, maginput, dX)
+        r = nodes[valid]
+        rho2 = np.sum(r**2, axis=1) - (r @ axis)**2
+        omega = np.full(B.shape, np.nan)
+        omega[valid] = np.cross(r, drift) @ axis/rho2
+        omega = np.sum(w*omega, axis=-1)/path
+
+        # Energy dependence. pv/q is in V, B in nT and the lengths in Re.
+        v = c*beta(E, Erest)
+        pv = E*(E + 2*Erest)/(E + Erest)*1E3
+        Tb = 2*Re*1E3*path[:, :, np.newaxis]/v
+        Td = 2*np.pi*1E-9*(Re*1E3)**2/np.abs(omega[:, :, np.newaxis]*pv)
+        self.drift_bounce_period_grid_output = {'Tb':Tb, 'Td':Td, 
+            'Lm':lines['lm'], 'bmin':lines['bmin']}
+        return self.drift_bounce_period_grid_output
         
     def mirror_point_altitude(self, X, maginput, R0=1):
         """
@@ -762,27 +1585,27 @@ class MagFields:
         """
         if self.TMI: print('Prepping time and space input variables')
 
-        # Deep copy X so if the single inputs get encapsulated in 
-        # an array, it wont be propaged back to the user.
-        Xc = copy.deepcopy(X)
+        if isinstance(X, PreparedInput):
+            if X.ntime != 1:
+                raise ValueError('This method takes a single time and location. '
+                                 f'Got a PreparedInput of {X.ntime} points, use '
+                                 'the array or _multi methods instead.')
+            return (ctypes.c_int(int(X.iyear[0])), ctypes.c_int(int(X.idoy[0])), 
+                    ctypes.c_double(X.ut[0]), ctypes.c_double(X.x1[0]), 
+                    ctypes.c_double(X.x2[0]), ctypes.c_double(X.x3[0]))
 
-        time_key = [key for key in Xc.keys() if 'time' in key.lower()]
+        time_key = [key for key in X.keys() if 'time' in key.lower()]
         assert len(time_key) == 1, ('None or multiple time keys found in '
-                                    f'dictionary input \n {Xc}')
+                                    f'dictionary input \n {X}')
         time_key = time_key[0]
 
-        if isinstance(Xc[time_key], datetime.datetime):
-            t = Xc[time_key]
-        elif pandas_imported and isinstance(Xc[time_key], pd.Timestamp):
-            t = pd.dt.to_pydatetime()
-        else:
-            t = dateutil.parser.parse(Xc[time_key])
-        iyear = ctypes.c_int(t.year)
-        idoy = ctypes.c_int(t.timetuple().tm_yday)
-        ut = ctypes.c_double(3600*t.hour + 60*t.minute + t.second)  # Seconds of day
-        x1 = ctypes.c_double(Xc['x1']) 
-        x2 = ctypes.c_double(Xc['x2'])
-        x3 = ctypes.c_double(Xc['x3'])
+        iyear, idoy, ut = _decode_times(X[time_key])
+        iyear = ctypes.c_int(int(iyear[0]))
+        idoy = ctypes.c_int(int(idoy[0]))
+        ut = ctypes.c_double(ut[0])  # Seconds of day
+        x1 = ctypes.c_double(X['x1']) 
+        x2 = ctypes.c_double(X['x2'])
+        x3 = ctypes.c_double(X['x3'])
         if self.TMI: print('Done prepping time and space input variables')
         return iyear, idoy, ut, x1, x2, x3
     
@@ -794,186 +1617,913 @@ class MagFields:
         INPUT: A dictionary, X, containing the time and sampling location. 
                Input keys must be 'dateTime', 'x1', 'x2', 'x3'. Other time keys
                will work, as long as they contain the word 'time' (case 
-               insensitive). 
+               insensitive). X can also be a PreparedInput.
         AUTHOR: Mykhaylo Shumko
-        RETURNS: ctypes variables iyear, idoy, ut, x1, x2, x3.
+        RETURNS: ntime (ctypes int) and contiguous numpy arrays iyear, idoy 
+                 (int32), and ut, x1, x2, x3 (float64). NumPy inputs that are 
+                 already float64 and contiguous are passed through without a 
+                 copy.
         MOD:     2020-05-26
         """
-        # Deep copy X so if the single inputs get encapsulated in 
-        # an array, it wont be propaged back to the user.
-        Xc = copy.deepcopy(X)
-
-        # identify the time key.
-        time_keys = [key for key in Xc.keys() if 'time' in key.lower()]
-        assert len(time_keys) == 1, ('None or multiple time keys found in '
-                                    f'dictionary input \n {Xc}')
-        time_key = time_keys[0]
-
-        # Check if function arguments are lists or arrays and convert them
-        # to numpy arrays if they are not.
-        if not isinstance(Xc[time_key], (list, np.ndarray)):
-            for key in Xc.keys():
-                Xc[key] = np.array([Xc[key]])
-
-        # Check that the input array length does not exceed NTIME_MAX.
-        nTimePy = len(Xc[time_key])
-        if nTimePy > self.NTIME_MAX.value:
-            raise ValueError(f"Input array length {nTimePy} is longer "
-                             f"than IRBEM's NTIME_MAX = {self.NTIME_MAX.value}. "
-                             f"Use a for loop.")
-        ntime = ctypes.c_int(nTimePy)
-
-        # Check that the times are datetime objects, and convert otherwise.
-        if isinstance(Xc[time_key][0], datetime.datetime):
-            t = Xc[time_key]
-        elif pandas_imported and isinstance(Xc[time_key][0], pd.Timestamp):
-            t = pd.dt.to_pydatetime()
-        else:
-            t = [dateutil.parser.parse(t_i) for t_i in Xc[time_key]]
+        if isinstance(X, PreparedInput):
+            return (ctypes.c_int(X.ntime), X.iyear, X.idoy, X.ut, X.x1, X.x2, X.x3)
+        return _prep_time_loc_arrays(X)
 
-        nTimePy = len(Xc[time_key])
-        ntime = ctypes.c_int(nTimePy)
-        
-        # C arrays are statically defined with the following procedure.
-        # There are a few ways of doing this...
-        intArrType = ctypes.c_int * nTimePy
-        iyear = intArrType()
-        idoy = intArrType()
-        
-        doubleArrType = ctypes.c_double * nTimePy
-        ut, x1, x2, x3 = [doubleArrType() for i in range(4)]
-
-        # Now fill the input time and model sampling (s/c location) parameters.
-        for dt in range(nTimePy):
-            iyear[dt] = t[dt].year
-            idoy[dt] = t[dt].timetuple().tm_yday
-            ut[dt] = 3600*t[dt].hour + 60*t[dt].minute + t[dt].second
-            x1[dt] = Xc['x1'][dt]
-            x2[dt] = Xc['x2'][dt] 
-            x3[dt] = Xc['x3'][dt]
-        return ntime, iyear, idoy, ut, x1, x2, x3
-
-    def _prepMagInput(self, inputDict=None):
-        """
-        NAME:  _prepMagInput(self, inputDict)
+    def _prepMagInput(self, inputDict=None, ntime=None):
+        """
+        NAME:  _prepMagInput(self, inputDict, ntime)
         USE:   Prepares magnetic field model inputs.
         INPUT: A dictionary containing the maginput keys in either numpy 
               arrays, lists, ints, or doubles. The keys must be some of these: 
               'Kp', 'Dst', 'dens', 'velo', 'Pdyn', 'ByIMF', 'BzIMF',
               'G1', 'G2', 'G3', 'W1', 'W2', 'W3', 'W4', 'W5', 'W6', 'AL'
+              Each key can be a scalar or an array. A PreparedInput returns 
+              its prepared maginput. ntime, the number of times and 
+              locations of array inputs, broadcasts the result to (ntime, 25).
         AUTHOR: Mykhaylo Shumko
-        RETURNS: self.maginput, a ctypes 2D array to pass as an argument to 
-              IRBEM functions. Dummy values are -9999.
+        RETURNS: self.maginput, a float64 array with shape (25,) for scalar 
+              inputs or (ntime, 25) for array inputs, i.e. the Fortran 
+              maginput(25, ntime) layout. Broadcast inputs are read-only 
+              views with a zero stride along ntime. Dummy values are -9999.
         MOD:     2017-01-05
         """
         if self.TMI: print('Prepping magnetic field inputs.')
 
-        # If no model inputs (statis magnetic field model)
-        if (inputDict is None) or (inputDict == {}):
-            magInputType = (ctypes.c_double * 25)
-            self.maginput = magInputType()
-            for i in range(25):
-                self.maginput[i] = -9999
-            return self.maginput
-        
-        orderedKeys = ['Kp', 'Dst', 'dens', 'velo', 'Pdyn', 'ByIMF', \
-            'BzIMF', 'G1', 'G2', 'G3', 'W1', 'W2', 'W3', 'W4', 'W5', 'W6', \
-            'AL']
-        # Assume all values assosiated with keys are the same type.
-        magType = type(inputDict[list(inputDict.keys())[0]])
-        
-        # If the model inputs are arrays
-        if magType in [np.ndarray, list]:
-            nTimePy = len(inputDict[list(inputDict.keys())[0]])
-            magInputType = ((ctypes.c_double * 25) * nTimePy)
-            self.maginput = magInputType()
-            
-            # Loop over potential keys.
-            for i in range(len(orderedKeys)):
-                # Loop over times.
-                for dt in range(nTimePy):
-                    # For every key provided by user, populate the maginput 
-                    # C array.
-                    if orderedKeys[i] in list(inputDict.keys()):
-                        # maginput(25,ntime_max)
-                        self.maginput[dt][i] = inputDict[orderedKeys[i]][dt]
-                    else:
-                        self.maginput[dt][i] = ctypes.c_double(-9999) 
-                        
-        # If model inputs are integers or doubles.
-        elif magType in [int, float, np.float64]:
-            magInputType = (ctypes.c_double * 25)
-            self.maginput = magInputType()
-            
-            # Loop over ordered keys, and fill the maginput array with keys 
-            # given.
-            for i in range(len(orderedKeys)):
-                # Loop over times.
-                if orderedKeys[i] in list(inputDict.keys()):
-                    self.maginput[i] = inputDict[orderedKeys[i]]
-                else:
-                    self.maginput[i] = ctypes.c_double(-9999) 
-        
-        # If model inputs are something else (probably incorrect format)
+        if isinstance(inputDict, PreparedInput):
+            self.maginput = inputDict.maginput
+            if ntime is not None:
+                self.maginput = np.broadcast_to(self.maginput, (ntime, 25))
         else:
-            raise TypeError('Model inputs are in an unrecognizable format.' +\
-            ' Try a dictionary of numpy arrays, lists, ints or floats')
+            self.maginput = _prep_maginput(inputDict, ntime)
 
         if self.TMI: print('Done prepping magnetic field inputs.')
 
         return self.maginput  
         
-    def _interpolate_field_line(self, X, maginput, R0 = 1, alpha = 90):
-        """
-        NAME:  _interpolate_field_line(self, X, maginput)
-        USE:   This function cubic spline interpolates a magnetic field line 
-               that crosses the input location down to a radius, R0 from Earth 
-               center.               
-        INPUT: A dictionary, X containing the time and and location. 
-               Input keys must be 'dateTime', 'x1', 'x2', 'x3'. maginput
-               dictionary contains model parameters.
-               Optionally, R0 = 1 (Earth's surface) can be changed.
-               alpha = 90 is the local pitch angle (for bounce period 
-               calculation).
-        AUTHOR: Mykhaylo Shumko
-        RETURNS: Interpolate objects of the B field, B field path coordinate S,
-                 X, Y, Z GEO coordinates, and B field at input location.
-        MOD:     2017-04-06
+    def _make_lstar_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, 
+                           method='full', out=None):
         """
-        if self.TMI: print('Interpolating magnetic field line')
+        Runs make_lstar1, or LAndI2Lstar1 if method is 'fast', on prepared 
+        time, location and maginput arrays. out is an optional tuple of output 
+        arrays, see _output_buffers().
 
-        X2 = copy.deepcopy(X)
-        self.make_lstar(X2, maginput)
-        inputblocal = self.make_lstar_output['blocal'][0]
-        
-        out = self.trace_field_line(X, maginput)
-        if out['Nposit'] == -9999:
-            raise ValueError('This is an open field line!')
-        
-        # Create arrays of GEO coordinates, and path coordinate, S.
-        xGEO = out['POSIT'][:out['Nposit'], 0] 
-        yGEO = out['POSIT'][:out['Nposit'], 1] 
-        zGEO = out['POSIT'][:out['Nposit'], 2] 
-        S = range(len(out['blocal'][:out['Nposit']]))
-        
-        # Interpolate the magnetic field, as well as GEO coordinates.
-        fB = scipy.interpolate.interp1d(S, 
-            np.subtract(out['blocal'][:out['Nposit']], inputblocal/np.sin(
-            np.deg2rad(alpha))**2), kind = 'cubic')
-        fx = scipy.interpolate.interp1d(S, xGEO, kind = 'cubic')
-        fy = scipy.interpolate.interp1d(S, yGEO, kind = 'cubic')
-        fz = scipy.interpolate.interp1d(S, zGEO, kind = 'cubic')
-        if self.TMI: print('Done interpolating magnetic field line.')
-        return {'S':S, 'fB':fB, 'fx':fx, 'fy':fy, 'fz':fz, 
-            'mirrorB':inputblocal/np.sin(np.deg2rad(alpha))**2}
-        
+        Returns
+        -------
+        tuple
+            The Lm, Lstar, blocal, bmin, xj, and MLT numpy arrays.
+        """
+        ntime = iyear.shape[0]
+        lm, lstar, blocal, bmin, xj, mlt = _output_buffers(out, [(ntime,)]*6)
+        if method == 'fast':
+            routine = self._irbem_obj.landi2lstar1_
+        else:
+            routine = self._irbem_obj.make_lstar1_
+        kext, options = self._lstar_model(method)
         
-class Coords:
-    """
-    Wrappers for IRBEM's coordinate transformation functions. 
+        if self.TMI: print(f"Running IRBEM-LIB make_lstar (method={method})")
 
-    When initializing the instance, you can provide the directory 
-    'IRBEMdir' and 'IRBEMname' arguments to the class to specify the location 
+        # Inputs longer than NTIME_MAX are run in chunks that write directly 
+        # into the output arrays.
+        _run_chunked(routine, ntime, self.NTIME_MAX.value,
+                kext, options, self.sysaxes, iyear, idoy, ut, x1, x2, x3, 
+                maginput, lm, lstar, blocal, bmin, xj, mlt)
+        return lm, lstar, blocal, bmin, xj, mlt
+
+    def _make_lstar_foot_equator_arrays(self, iyear, idoy, ut, x1, x2, x3, 
+                                        maginput, stopAlt, out=None):
+        """
+        Runs make_lstar_foot_equator1 on prepared time, location and maginput 
+        arrays. out is an optional tuple of output arrays, see 
+        _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The Lm, Lstar, blocal, bmin, xj and MLT arrays, the (ntime, 3) 
+            equator array, and the (ntime, 3) XFOOT and BFOOT and the BFOOTMAG 
+            arrays of the northern and then the southern foot points.
+        """
+        ntime = iyear.shape[0]
+        outputs = _output_buffers(out, [(ntime,)]*6 + [(ntime, 3)] 
+                                  + [(ntime, 3), (ntime, 3), (ntime,)]*2)
+
+        if self.TMI: print("Running IRBEM-LIB make_lstar_foot_equator")
+
+        _run_chunked(self._irbem_obj.make_lstar_foot_equator1_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, ctypes.c_double(stopAlt), 
+                maginput, *outputs)
+        return tuple(outputs)
+
+    def _make_lstar_shell_splitting_arrays(self, iyear, idoy, ut, x1, x2, x3, 
+                                           maginput, alpha, method='full', 
+                                           out=None):
+        """
+        Runs make_lstar_shell_splitting1, or LAndI2Lstar_shell_splitting1 if 
+        method is 'fast', on prepared time, location and maginput arrays, and 
+        a tuple of pitch angles. out is an optional tuple of output arrays, see 
+        _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The Lm, Lstar, Bmirr and xj (ntime, Nipa) numpy arrays, and the 
+            bmin and MLT numpy arrays.
+        """
+        ntime = iyear.shape[0]
+        nipa = len(alpha)
+        lm, lstar, bmirr, bmin, xj, mlt = _output_buffers(
+            out, [(ntime, nipa)]*3 + [(ntime,), (ntime, nipa), (ntime,)])
+        # The pitch angle outputs are (ntime_max, 25) Fortran arrays, with 
+        # ntime_max as compiled in the shared object. Only the rows of the 
+        # chunk in their first Nipa columns are written, so each buffer holds 
+        # just that span, and is viewed as a (chunk, Nipa) array with the 
+        # Fortran column stride. The buffers are reused by all of the chunks.
+        chunk = min(ntime, self.NTIME_MAX.value)
+        buffers = [np.empty((nipa-1)*self._ntime_max + chunk) for i in range(4)]
+        views = [np.lib.stride_tricks.as_strided(buffer, (chunk, nipa), 
+                    (buffer.itemsize, buffer.itemsize*self._ntime_max)) 
+                 for buffer in buffers]
+        alpha = np.array(alpha + (0.0,)*(25-nipa))
+        if method == 'fast':
+            routine = self._irbem_obj.landi2lstar_shell_splitting1_
+        else:
+            routine = self._irbem_obj.make_lstar_shell_splitting1_
+        kext, options = self._lstar_model(method)
+
+        if self.TMI: print(f"Running IRBEM-LIB make_lstar_shell_splitting (method={method})")
+
+        for start in range(0, ntime, self.NTIME_MAX.value):
+            stop = min(start + self.NTIME_MAX.value, ntime)
+            mag = np.ascontiguousarray(maginput[start:stop])
+            routine(
+                ctypes.byref(ctypes.c_int(stop-start)), ctypes.byref(ctypes.c_int(nipa)), 
+                ctypes.byref(kext), ctypes.byref(options), 
+                ctypes.byref(self.sysaxes), _c_ptr(iyear[start:]), 
+                _c_ptr(idoy[start:]), _c_ptr(ut[start:]), _c_ptr(x1[start:]), 
+                _c_ptr(x2[start:]), _c_ptr(x3[start:]), _c_ptr(alpha), _c_ptr(mag), 
+                *[_c_ptr(buffer) for buffer in buffers[:3]], _c_ptr(bmin[start:]), 
+                _c_ptr(buffers[3]), _c_ptr(mlt[start:]))
+            for output, view in zip((lm, lstar, bmirr, xj), views):
+                output[start:stop] = view[:stop-start]
+        return lm, lstar, bmirr, bmin, xj, mlt
+
+    def _check_lstar_method(self, method):
+        """
+        Checks the make_lstar method, and warns if the 'fast' method will 
+        replace the selected magnetic field models.
+        """
+        if method not in ('full', 'fast'):
+            raise ValueError(f"Unknown L* method {method}. Valid methods are "
+                             "'full' and 'fast'.")
+        if method == 'fast' and (self.kext.value != 5 or self.options[4] != 0):
+            warnings.warn("The 'fast' L* method only supports the IGRF internal "
+                          "and the Olson-Pfitzer quiet (OPQ77) external models, "
+                          "which are used instead of the selected models.")
+        return
+
+    def _lstar_model(self, method):
+        """
+        Returns the kext and options to pass to the L* routines. The 'fast' 
+        routines overwrite kext and options(5) with IGRF + OPQ77, so they get 
+        copies set to those models.
+        """
+        if method != 'fast':
+            return self.kext, self.options
+        options = (ctypes.c_int * 5)(*self.options)
+        options[4] = 0
+        return ctypes.c_int(5), options
+
+    def _cache_keys(self, routine, iyear, idoy, ut, x1, x2, x3, maginput, *params):
+        """
+        Builds the cache key of every point: a hash of the routine name, the 
+        model selection and any extra parameters, followed by the exact 
+        Fortran inputs of the point. The keys of all of the points are built 
+        at once in a byte array.
+        """
+        ntime = iyear.shape[0]
+        prefix = hashlib.blake2b(repr((routine, self.kext.value, list(self.options), 
+                                       self.sysaxes.value, params)).encode(), 
+                                 digest_size=16).digest()
+        rows = np.column_stack((iyear, idoy, ut, x1, x2, x3, 
+                                np.broadcast_to(maginput, (ntime, 25))))
+        rows = np.ascontiguousarray(rows, dtype=np.float64)
+        keys = np.empty((ntime, len(prefix) + rows[0].nbytes), dtype=np.uint8)
+        keys[:, :len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
+        keys[:, len(prefix):] = rows.view(np.uint8)
+        return keys.view(f'V{keys.shape[1]}')[:, 0].tolist()
+
+    def _cached_arrays(self, routine, compute, iyear, idoy, ut, x1, x2, x3, 
+                       maginput, *params, out=None):
+        """
+        Looks up all of the points in the cache at once, runs compute() on the 
+        missing points only, stores their outputs, and returns the outputs of 
+        all points in the input order, in the optional out arrays.
+        """
+        ntime = iyear.shape[0]
+        keys = self._cache_keys(routine, iyear, idoy, ut, x1, x2, x3, maginput, *params)
+        cached = self.cache.get_many(keys)
+        hit = np.array([key in cached for key in keys], dtype=bool)
+        miss = ~hit
+        if self.TMI: print(f"Found {hit.sum()} of {ntime} {routine} points in the cache")
+
+        outputs = None
+        if hit.any():
+            hit_rows = np.frombuffer(b''.join(cached[key] for key in keys if key in cached))
+            hit_rows = hit_rows.reshape(hit.sum(), -1)
+            outputs = np.empty((ntime, hit_rows.shape[1]))
+            outputs[hit] = hit_rows
+        if miss.any():
+            if maginput.ndim == 2:
+                maginput = maginput[miss]
+            miss_rows = np.column_stack(compute(iyear[miss], idoy[miss], ut[miss], 
+                x1[miss], x2[miss], x3[miss], maginput, *params))
+            if outputs is None:
+                outputs = np.empty((ntime, miss_rows.shape[1]))
+            outputs[miss] = miss_rows
+            self.cache.put_many(zip([key for key, m in zip(keys, miss) if m], 
+                                    (row.tobytes() for row in miss_rows)))
+        buffers = _output_buffers(out, [(ntime,)]*outputs.shape[1])
+        for buffer, column in zip(buffers, outputs.T):
+            buffer[:] = column
+        return tuple(buffers)
+
+    def _get_field_multi_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, 
+                                out=None):
+        """
+        Runs GET_FIELD_MULTI on prepared time, location and maginput arrays. 
+        out is an optional tuple of output arrays, see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The (ntime, 3) GEO magnetic field array and the magnitude array.
+        """
+        ntime = iyear.shape[0]
+        Bgeo, Bl = _output_buffers(out, [(ntime, 3), (ntime,)])
+        
+        if self.TMI: print("Running IRBEM-LIB get_field_multi")
+
+        _run_chunked(self._irbem_obj.get_field_multi_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, maginput, Bgeo, Bl)
+        return Bgeo, Bl
+
+    def _get_hemi_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, out=None):
+        """
+        Runs GET_HEMI_MULTI on prepared time, location and maginput arrays. 
+        out is an optional tuple of output arrays, see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            A one element tuple with the int32 hemisphere array.
+        """
+        ntime = iyear.shape[0]
+        xhemi, = _output_buffers(out, [(ntime,)], dtype=np.int32)
+
+        if self.TMI: print("Running IRBEM-LIB get_hemi_multi")
+
+        _run_chunked(self._irbem_obj.get_hemi_multi_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, maginput, xhemi)
+        return xhemi,
+
+    def _get_bderivs_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, dX, 
+                            sysaxes, out=None):
+        """
+        Runs GET_Bderivs on prepared time, location and maginput arrays, with 
+        the locations in the sysaxes coordinate system. out is an optional 
+        tuple of output arrays, see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The (ntime, 3) Bgeo, the Bmag, the (ntime, 3) gradBmag, and the 
+            (ntime, 3, 3) diffB arrays, diffB in the Fortran (t, j, i) order.
+        """
+        ntime = iyear.shape[0]
+        Bgeo, Bmag, gradBmag, diffB = _output_buffers(
+            out, [(ntime, 3), (ntime,), (ntime, 3), (ntime, 3, 3)])
+
+        if self.TMI: print("Running IRBEM-LIB get_bderivs")
+
+        _run_chunked(self._irbem_obj.get_bderivs_, ntime, self.NTIME_MAX.value, 
+                self.kext, self.options, ctypes.c_int(sysaxes), ctypes.c_double(dX), 
+                iyear, idoy, ut, x1, x2, x3, maginput, Bgeo, Bmag, gradBmag, diffB)
+        return Bgeo, Bmag, gradBmag, diffB
+
+    def _compute_grad_curv_curl_arrays(self, Bgeo, Bmag, gradBmag, diffB, out=None):
+        """
+        Runs compute_grad_curv_curl on the GET_Bderivs output arrays, diffB in 
+        the Fortran (t, j, i) order. out is an optional tuple of output arrays, 
+        see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The grad_par, grad_perp, grad_drift, curvature, Rcurv, curv_drift, 
+            curlB and divB arrays.
+        """
+        ntime = Bmag.shape[0]
+        grad_par, grad_perp, grad_drift, curvature, Rcurv, curv_drift, curlB, divB = \
+            _output_buffers(out, [(ntime,)] + [(ntime, 3)]*3 + [(ntime,)] 
+                            + [(ntime, 3)]*2 + [(ntime,)])
+
+        if self.TMI: print("Running IRBEM-LIB compute_grad_curv_curl")
+
+        _run_chunked(self._irbem_obj.compute_grad_curv_curl_, ntime, 
+                self.NTIME_MAX.value, Bgeo, Bmag, gradBmag, diffB, grad_par, 
+                grad_perp, grad_drift, curvature, Rcurv, curv_drift, curlB, divB)
+        return grad_par, grad_perp, grad_drift, curvature, Rcurv, curv_drift, curlB, divB
+
+    def _find_mirror_point_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, 
+                                  alpha, out=None):
+        """
+        Runs FIND_MIRROR_POINT_MULTI on prepared time, location, maginput and 
+        pitch angle arrays. out is an optional tuple of output arrays, see 
+        _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The blocal and bmirror arrays and the (ntime, 3) GEO mirror point array.
+        """
+        ntime = iyear.shape[0]
+        blocal, bmir, posit = _output_buffers(out, [(ntime,), (ntime,), (ntime, 3)])
+
+        if self.TMI: print("Running IRBEM-LIB find_mirror_point_multi")
+
+        _run_chunked(self._irbem_obj.find_mirror_point_multi_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, alpha, maginput, blocal, bmir, posit)
+        return blocal, bmir, posit
+
+    def _find_foot_point_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, 
+                                stopAlt, hemiFlag, out=None):
+        """
+        Runs FIND_FOOT_POINT_MULTI on prepared time, location and maginput arrays. 
+        out is an optional tuple of output arrays, see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The (ntime, 3) XFOOT and BFOOT arrays and the BFOOTMAG array.
+        """
+        ntime = iyear.shape[0]
+        XFOOT, BFOOT, BFOOTMAG = _output_buffers(out, [(ntime, 3), (ntime, 3), (ntime,)])
+
+        if self.TMI: print("Running IRBEM-LIB find_foot_point_multi")
+
+        _run_chunked(self._irbem_obj.find_foot_point_multi_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, ctypes.c_double(stopAlt), 
+                ctypes.c_int(hemiFlag), maginput, XFOOT, BFOOT, BFOOTMAG)
+        return XFOOT, BFOOT, BFOOTMAG
+
+    def _find_magequator_arrays(self, iyear, idoy, ut, x1, x2, x3, maginput, 
+                                out=None):
+        """
+        Runs FIND_MAGEQUATOR_MULTI on prepared time, location and maginput arrays. 
+        out is an optional tuple of output arrays, see _output_buffers().
+
+        Returns
+        -------
+        tuple
+            The bmin array and the (ntime, 3) GEO magnetic equator array.
+        """
+        ntime = iyear.shape[0]
+        bmin, XGEO = _output_buffers(out, [(ntime,), (ntime, 3)])
+
+        if self.TMI: print("Running IRBEM-LIB find_magequator_multi")
+
+        _run_chunked(self._irbem_obj.find_magequator_multi_, ntime, 
+                self.NTIME_MAX.value, self.kext, self.options, self.sysaxes, 
+                iyear, idoy, ut, x1, x2, x3, maginput, bmin, XGEO)
+        return bmin, XGEO
+
+    def _interpolate_field_line(self, X, maginput, R0 = 1, alpha = 90):
+        """
+        NAME:  _interpolate_field_line(self, X, maginput)
+        USE:   This function cubic spline interpolates a magnetic field line 
+               that crosses the input location down to a radius, R0 from Earth 
+               center.               
+        INPUT: A dictionary, X containing the time and and location. 
+               Input keys must be 'dateTime', 'x1', 'x2', 'x3'. maginput
+               dictionary contains model parameters.
+               Optionally, R0 = 1 (Earth's surface) can be changed.
+               alpha = 90 is the local pitch angle (for bounce period 
+               calculation).
+        AUTHOR: Mykhaylo Shumko
+        RETURNS: Interpolate objects of the B field, B field path coordinate S,
+                 X, Y, Z GEO coordinates, and B field at input location.
+        MOD:     2017-04-06
+        """
+        if self.TMI: print('Interpolating magnetic field line')
+
+        inputblocal = self._local_field(X, maginput)
+        
+        out = self._field_line(X, maginput, R0=R0)
+        if out['Nposit'] == -9999:
+            raise ValueError('This is an open field line!')
+        
+        # Create arrays of GEO coordinates, and path coordinate, S.
+        xGEO = out['POSIT'][:out['Nposit'], 0] 
+        yGEO = out['POSIT'][:out['Nposit'], 1] 
+        zGEO = out['POSIT'][:out['Nposit'], 2] 
+        S = range(len(out['blocal'][:out['Nposit']]))
+        
+        # Interpolate the magnetic field, as well as GEO coordinates.
+        fB = scipy.interpolate.interp1d(S, 
+            np.subtract(out['blocal'][:out['Nposit']], inputblocal/np.sin(
+            np.deg2rad(alpha))**2), kind = 'cubic')
+        fx = scipy.interpolate.interp1d(S, xGEO, kind = 'cubic')
+        fy = scipy.interpolate.interp1d(S, yGEO, kind = 'cubic')
+        fz = scipy.interpolate.interp1d(S, zGEO, kind = 'cubic')
+        if self.TMI: print('Done interpolating magnetic field line.')
+        return {'S':S, 'fB':fB, 'fx':fx, 'fy':fy, 'fz':fz, 
+            'mirrorB':inputblocal/np.sin(np.deg2rad(alpha))**2}
+
+    def _dipole_axis(self, iyear, idoy, ut, maginput, dX):
+        """
+        Returns the GEO unit vector along the dipole axis of the model field, 
+        from the dipole (l = 1) part of the radial field on a sphere of radius 
+        2 Re, i.e. the average of (B.r)r over the sphere.
+        """
+        mu, weights = np.polynomial.legendre.leggauss(8)
+        phi = np.linspace(0, 2*np.pi, 16, endpoint=False)
+        mu, phi = np.meshgrid(mu, phi)
+        weights = np.broadcast_to(weights, mu.shape).ravel()
+        rho = np.sqrt(1 - mu**2)
+        r = np.column_stack(((rho*np.cos(phi)).ravel(), (rho*np.sin(phi)).ravel(), 
+                             mu.ravel()))
+        n = r.shape[0]
+        Bgeo, _, _, _ = self._get_bderivs_arrays(np.repeat(iyear, n), np.repeat(idoy, n), 
+            np.repeat(ut, n), *[np.ascontiguousarray(2*r[:, k]) for k in range(3)], 
+            self._prepMagInput(maginput, n), dX, 1)
+        axis = (weights*np.sum(Bgeo*r, axis=1)) @ r
+        return axis/np.linalg.norm(axis)
+
+    def _field_line(self, X, maginput, R0=1):
+        """
+        Returns the trace_field_line() output for the input location, from the 
+        memo if the same field line was traced before.
+        """
+        key = ('trace_field_line', R0) + self._memo_key(X, maginput)
+        output = self._memo.get(key)
+        if output is None:
+            # Copy the arrays so the memo does not share them with 
+            # self.trace_field_line_output.
+            output = {name:np.array(value) if isinstance(value, np.ndarray) else value 
+                      for name, value in self.trace_field_line(X, maginput, R0=R0).items()}
+            self._memo.put(key, output)
+        return output
+
+    def _local_field(self, X, maginput):
+        """
+        Returns the magnitude of the magnetic field at the input location, from 
+        the memo if it was looked up before. Only the field is computed, with 
+        GET_FIELD_MULTI.
+        """
+        key = ('get_field_multi',) + self._memo_key(X, maginput)
+        blocal = self._memo.get(key)
+        if blocal is None:
+            blocal = self.get_field_multi(X, maginput)['Bl'][0]
+            self._memo.put(key, blocal)
+        return blocal
+
+    def _memo_key(self, X, maginput):
+        """
+        The exact Fortran inputs of a single location, as a hashable memo key.
+        """
+        self._prepMagInput(maginput)
+        iyear, idoy, ut, x1, x2, x3 = self._prepTimeLoc(X)
+        return (self.kext.value, tuple(self.options), self.sysaxes.value, 
+                iyear.value, idoy.value, ut.value, x1.value, x2.value, x3.value, 
+                self.maginput.tobytes())
+        
+        
+class ParallelMagFields(MagFields):
+    """
+    A MagFields object that runs make_lstar(), make_lstar_shell_splitting(), 
+    get_field_multi() and the array inputs of find_mirror_point(), 
+    find_foot_point() and find_magequator() in parallel over a pool of 
+    workers. 
+
+    IRBEM keeps the magnetic field model state in Fortran COMMON blocks, so 
+    one copy of the shared object can only run one calculation at a time. 
+    Here the time axis is split into contiguous shards that are sent to the 
+    workers, each of which uses its own copy of the IRBEM shared object and 
+    keeps it loaded between tasks. The outputs are reassembled in the 
+    original order. All other methods run serially in the calling thread.
+
+    Two backends are available:
+    - 'process' runs the workers in separate processes.
+    - 'thread' loads one private copy of the shared object per thread (see 
+      the MagFields private_library kwarg) and pins each thread to its copy. 
+      ctypes releases the GIL during the Fortran calls, so this avoids the 
+      process spawn, pickling and IPC costs.
+
+    With a shared object built with OPENMP=1, each worker runs its Fortran
+    calls on a single OpenMP thread.
+
+    make_lstar1 uses the drift shell of the previous point as the starting 
+    guess for the next L* calculation. The first point of every shard starts 
+    from scratch instead, so its L* can differ from a serial run by an amount 
+    within the L* accuracy set by options[2].
+
+    Use it as a context manager, or call close(), to shut down the workers.
+
+    Example
+    -------
+    with IRBEM.ParallelMagFields(n_workers=8, kext='T89') as model:
+        output = model.make_lstar(X, maginput)
+    """
+    def __init__(self, n_workers=None, backend='process', **kwargs):
+        """
+        Parameters
+        ----------
+        n_workers: int
+            The number of workers. Defaults to os.cpu_count().
+        backend: str
+            Either 'process' or 'thread'.
+        kwargs: 
+            The MagFields keyword arguments, used by this object and by every 
+            worker.
+        """
+        super().__init__(**kwargs)
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self.backend = backend
+        # The cache is only used by this object, the workers compute the misses.
+        kwargs.pop('cache', None)
+        if backend == 'process':
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker_model, 
+                initargs=(kwargs,)
+                )
+            self._run_worker = _run_worker_model
+        elif backend == 'thread':
+            kwargs['private_library'] = True
+            self._thread_models = queue.Queue()
+            for _ in range(self.n_workers):
+                self._thread_models.put(MagFields(**kwargs))
+            self._thread_local = threading.local()
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.n_workers, initializer=self._pin_thread_model
+                )
+            self._run_worker = self._run_thread_model
+        else:
+            raise ValueError(f"Unknown backend {backend}. Valid backends are "
+                             "'process' and 'thread'.")
+        return
+
+    def close(self):
+        """
+        Shuts down the worker processes.
+        """
+        self._executor.shutdown()
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return
+
+    def _make_lstar_arrays(self, *args, out=None):
+        return self._run_sharded('_make_lstar_arrays', *args, out=out)
+
+    def _make_lstar_shell_splitting_arrays(self, *args, out=None):
+        return self._run_sharded('_make_lstar_shell_splitting_arrays', *args, out=out)
+
+    def _make_lstar_foot_equator_arrays(self, *args, out=None):
+        return self._run_sharded('_make_lstar_foot_equator_arrays', *args, out=out)
+
+    def _get_field_multi_arrays(self, *args, out=None):
+        return self._run_sharded('_get_field_multi_arrays', *args, out=out)
+
+    def _get_hemi_arrays(self, *args, out=None):
+        return self._run_sharded('_get_hemi_arrays', *args, out=out)
+
+    def _get_bderivs_arrays(self, *args, out=None):
+        return self._run_sharded('_get_bderivs_arrays', *args, out=out)
+
+    def _find_mirror_point_arrays(self, *args, out=None):
+        return self._run_sharded('_find_mirror_point_arrays', *args, out=out)
+
+    def _find_foot_point_arrays(self, *args, out=None):
+        return self._run_sharded('_find_foot_point_arrays', *args, out=out)
+
+    def _find_magequator_arrays(self, *args, out=None):
+        return self._run_sharded('_find_magequator_arrays', *args, out=out)
+
+    def _run_sharded(self, method, iyear, *args, out=None):
+        """
+        Splits the time axis of the prepared input arrays into shards, runs 
+        the MagFields method on each shard in the workers, and concatenates 
+        the output arrays in the original order, into the optional out arrays.
+        """
+        ntime = iyear.shape[0]
+        # Several shards per worker so the load is balanced when the run time 
+        # varies along the orbit.
+        n_shards = max(1, min(ntime, 4*self.n_workers))
+        bounds = np.linspace(0, ntime, n_shards+1).astype(int)
+        shards = [
+            [arg[start:stop] if _has_time_axis(arg, ntime) else arg 
+            for arg in (iyear, *args)] 
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+        if self.TMI: print(f"Running IRBEM-LIB {method} in {n_shards} shards")
+
+        futures = [self._executor.submit(self._run_worker, method, shard) 
+                   for shard in shards]
+        results = [future.result() for future in futures]
+        if out is None:
+            out = (None,)*len(results[0])
+        return tuple(np.concatenate(outputs, out=buffer) 
+                     for outputs, buffer in zip(zip(*results), out))
+
+    def _pin_thread_model(self):
+        """
+        Assigns one of the private MagFields copies to the calling thread.
+        """
+        self._thread_local.model = self._thread_models.get()
+        _single_openmp_thread(self._thread_local.model._irbem_obj)
+        return
+
+    def _run_thread_model(self, method, args):
+        """
+        Runs a MagFields array method with the calling thread's private copy.
+        """
+        return getattr(self._thread_local.model, method)(*args)
+
+
+class PreparedInput:
+    """
+    The time, location and magnetic field model inputs of an ephemeris, 
+    converted once into the contiguous arrays passed to the IRBEM routines. 
+    Pass it as both the X and the maginput arguments of the MagFields methods 
+    so they skip the time parsing and the maginput array construction.
+
+    Parameters
+    ----------
+    X: dict
+        The dictionary specifying the time and location, as for the MagFields 
+        methods.
+    maginput: dict
+        The magnetic field input parameter dictionary, as for the MagFields 
+        methods.
+    sort_by_time: bool
+        Sort the points by time. IRBEM-LIB skips the field model 
+        initialization when consecutive points share an epoch, so unordered 
+        inputs run faster sorted. The outputs of the MagFields methods are 
+        then in the sorted order; restore_order() puts them back in the 
+        order of X.
+
+    Example
+    -------
+    model = IRBEM.MagFields(options=[0,0,0,0,0], kext='T89')
+    X = {'dateTime':['2015-02-02T06:12:43', '2015-02-02T06:12:48'], 
+         'x1':[651, 652], 'x2':[63, 63.1], 'x3':[20, 20.2]}
+    ephemeris = IRBEM.PreparedInput(X, {'Kp':[40, 40]})
+    lstar = model.make_lstar(ephemeris, ephemeris)
+    field = model.get_field_multi(ephemeris, ephemeris)
+    """
+    __slots__ = ('ntime', 'iyear', 'idoy', 'ut', 'x1', 'x2', 'x3', 'maginput', 
+                 'scalar', 'order')
+
+    def __init__(self, X, maginput=None, sort_by_time=False):
+        self.scalar = not _is_array_input(X)
+        ntime, self.iyear, self.idoy, self.ut, self.x1, self.x2, self.x3 = \
+            _prep_time_loc_arrays(X)
+        self.ntime = ntime.value
+        self.maginput = _prep_maginput(maginput, None if self.scalar else self.ntime)
+        self.order = None
+        if sort_by_time and not self.scalar:
+            self.order = np.lexsort((self.ut, self.idoy, self.iyear))
+            for key in ('iyear', 'idoy', 'ut', 'x1', 'x2', 'x3'):
+                setattr(self, key, getattr(self, key)[self.order])
+            # A broadcast constant maginput is the same in any order.
+            if self.maginput.strides[0] != 0:
+                self.maginput = self.maginput[self.order]
+        return
+
+    def restore_order(self, output):
+        """
+        Puts the outputs of a MagFields method back in the order of X when 
+        the input was sorted by time.
+
+        Parameters
+        ----------
+        output: dict or array
+            The output dictionary of a MagFields method, or one of its arrays.
+
+        Returns
+        -------
+        The output with each ntime-long array reordered. It is returned 
+        unchanged if the input was not sorted.
+        """
+        if self.order is None:
+            return output
+        if isinstance(output, dict):
+            return {key:self.restore_order(value) for key, value in output.items()}
+        if not isinstance(output, np.ndarray) or output.shape[:1] != (self.ntime,):
+            return output
+        restored = np.empty_like(output)
+        restored[self.order] = output
+        return restored
+
+    def __len__(self):
+        return self.ntime
+
+    def __getitem__(self, key):
+        """
+        Looks up the 'dateTime', 'x1', 'x2' and 'x3' inputs like the X 
+        dictionary. The times are numpy.datetime64 values.
+        """
+        if key == 'dateTime':
+            days = ((self.iyear - 1970).astype('datetime64[Y]').astype('datetime64[D]') 
+                    + (self.idoy - 1).astype('timedelta64[D]'))
+            value = days + (self.ut*1E9).astype('timedelta64[ns]')
+        elif key in ('x1', 'x2', 'x3'):
+            value = getattr(self, key)
+        else:
+            raise KeyError(key)
+        return value[0] if self.scalar else value
+
+    def keys(self):
+        return ('dateTime', 'x1', 'x2', 'x3')
+
+    def items(self):
+        return ((key, self[key]) for key in self.keys())
+
+
+class _LRUMemo:
+    """
+    An in-memory least recently used memo whose size is bounded by the 
+    memory, in bytes, of the NumPy arrays it holds. Cached arrays are made 
+    read-only since they are shared by every lookup.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        return
+
+    def get(self, key):
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key, value):
+        size = sys.getsizeof(key) + _nbytes(value)
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        if size <= self.max_size:
+            if isinstance(value, dict):
+                for item in value.values():
+                    if isinstance(item, np.ndarray):
+                        item.setflags(write=False)
+            self._entries[key] = (value, size)
+            self.size += size
+        while self.size > self.max_size:
+            self.size -= self._entries.popitem(last=False)[1][1]
+        return
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+        return
+
+
+class ResultCache:
+    """
+    A persistent cache of IRBEM outputs in a local SQLite file, shared by 
+    the MagFields objects that are given it (or its path) as the cache kwarg.
+
+    The outputs of each point are stored under a key made of the exact 
+    Fortran inputs (a hash of the routine, kext, options and sysaxes, then 
+    the time, location and maginput), so only the points that were never computed are sent to the Fortran 
+    library. When the file grows past max_size bytes the least recently 
+    used entries are evicted, and all entries are dropped when the IRBEM 
+    Fortran version (IRBEM_FORTRAN_VERSION1) changes. Libraries built outside 
+    of a git checkout all report version -1, so call clear() after rebuilding 
+    one of those.
+
+    Example
+    -------
+    model = MagFields(kext='T89', cache='~/.irbem_cache.sqlite')
+    output = model.make_lstar(X, maginput)
+    """
+    def __init__(self, path, max_size=2**30):
+        """
+        Parameters
+        ----------
+        path: str or pathlib.Path
+            The SQLite file. It is created if it does not exist.
+        max_size: int
+            The maximum total size, in bytes, of the cached outputs.
+        """
+        self.path = pathlib.Path(path).expanduser()
+        self.max_size = max_size
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('CREATE TABLE IF NOT EXISTS meta '
+                         '(name TEXT PRIMARY KEY, value INTEGER)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, '
+                         'value BLOB, size INTEGER, last_used REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS results_last_used '
+                         'ON results (last_used)')
+        self._db.commit()
+        return
+
+    def validate(self, version):
+        """
+        Drops all of the cached outputs if they were computed with a different 
+        IRBEM Fortran version.
+        """
+        row = self._db.execute("SELECT value FROM meta WHERE name='fortran_version'"
+                               ).fetchone()
+        if row is None or row[0] != version:
+            self.clear()
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('fortran_version', ?)", 
+                             (version,))
+            self._db.commit()
+        return
+
+    def get_many(self, keys):
+        """
+        Looks up the keys in bulk and returns a {key:value} dictionary of the 
+        keys that were found.
+        """
+        found = {}
+        keys = list(keys)
+        # Stay below SQLite's limit on the number of query parameters.
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start+500]
+            query = ('SELECT key, value FROM results WHERE key IN '
+                     f'({",".join("?"*len(batch))})')
+            found.update(self._db.execute(query, batch).fetchall())
+        if found:
+            now = time.time()
+            self._db.executemany('UPDATE results SET last_used=? WHERE key=?', 
+                                 [(now, key) for key in found])
+            self._db.commit()
+        return found
+
+    def put_many(self, items):
+        """
+        Stores (key, value) pairs, then evicts the least recently used entries 
+        if the cache is larger than max_size.
+        """
+        now = time.time()
+        self._db.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)', 
+                             [(key, value, len(value), now) for key, value in items])
+        self._db.commit()
+        self._evict()
+        return
+
+    def size(self):
+        """
+        Returns the total size, in bytes, of the cached outputs.
+        """
+        return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def clear(self):
+        """
+        Drops all of the cached outputs.
+        """
+        self._db.execute('DELETE FROM results')
+        self._db.commit()
+        return
+
+    def close(self):
+        self._db.close()
+        return
+
+    def _evict(self):
+        excess = self.size() - self.max_size
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._db.execute(
+                'SELECT key, size FROM results ORDER BY last_used'):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany('DELETE FROM results WHERE key=?', evicted)
+        self._db.commit()
+        return
+
+
+class Coords:
+    """
+    Wrappers for IRBEM's coordinate transformation functions. 
+
+    When initializing the instance, you can provide the directory 
+    'IRBEMdir' and 'IRBEMname' arguments to the class to specify the location 
     of the  compiled FORTRAN shared object (so) file, otherwise, it will 
     search for a .so file in the ./../ directory.
     
@@ -994,6 +2544,7 @@ class Coords:
     
     WRAPPED_FUNCTION: 
         coords_transform(self, time, pos, sysaxesIn, sysaxesOut)
+        rotation_matrices(self, time, sysaxesIn, sysaxesOut)
     
     Please contact me at msshumko at gmail.com if you have questions/comments
     or you would like me to wrap a particular function.
@@ -1003,6 +2554,10 @@ class Coords:
         self.TMI = kwargs.get('verbose', False)
         
         self.path, self._irbem_obj = _load_shared_object(self.irbem_obj_path)
+
+        # Get the NTIME_MAX value
+        self.NTIME_MAX = ctypes.c_int(-1)
+        self._irbem_obj.get_irbem_ntime_max1_(ctypes.byref(self.NTIME_MAX))
         return 
     
     def coords_transform(self, *args, **kwargs):
@@ -1020,7 +2575,9 @@ class Coords:
                 pos - A (nT x 3) array where nT is the number of points to transform.
                 
                 Avaliable coordinate transformations (either as an integer or 
-                3 letter keyword will work as arguments)
+                keyword will work as arguments). All of the transformations, 
+                including the ones that go through several systems, are done 
+                in one Fortran call per NTIME_MAX chunk.
                 
                 0: GDZ (alti, lati, East longi - km,deg.,deg)
                 1: GEO (cartesian) - Re
@@ -1032,78 +2589,107 @@ class Coords:
                 7: SPH (geo in spherical) - (radial distance, lati, East 
                     longi - Re, deg., deg.)
                 8: RLL  (radial distance, lati, East longi - Re, deg., 
-                    deg. - prefered to 7)    
+                    deg. - prefered to 7)
+                9: HEE (cartesian) - AU
+                10: HAE (cartesian) - AU
+                11: HEEQ (cartesian) - AU
+                12: TOD (cartesian, same as GEI) - Re
+                13: J2000 (cartesian) - Re
+                14: TEME (cartesian) - Re
+                15: DMAG (eccentric dipole, cartesian) - Re
+    
         AUTHOR: Mykhaylo Shumko
         RETURNS: Transformed positions as a 1d or 2d array.
         MOD:     2017-07-17
         """
-        # Create the position arrays        
-        if hasattr(time, '__len__'):
-            pos = np.array(pos)
-            pos = pos.reshape((len(time), 3))
-            posArrType = ((ctypes.c_double * 3) * len(time))
-            nTime = ctypes.c_int(len(time))
-        else: 
-            pos = np.array([pos])
-            posArrType = ((ctypes.c_double * 3) * 1)
-            nTime = ctypes.c_int(1)   
-        posInArr = posArrType()
-        posOutArr = posArrType()
-
         ### Get the time entries ###
         iyear, idoy, ut = self._cTimes(time)
+        nTime = ctypes.c_int(iyear.shape[0])
+
+        # Create the position arrays        
+        posInArr = np.ascontiguousarray(pos, dtype=np.float64).reshape((nTime.value, 3))
+        posOutArr = np.empty_like(posInArr)
         
         ### Lookup coordinate systems ###
         sysIn = self._coordSys(sysaxesIn)
         sysOut = self._coordSys(sysaxesOut)
-        
-        # Fill the positions array.
-        for nT in range(pos.shape[0]):
-            for nX in range(pos.shape[1]):
-                posInArr[nT][nX] = ctypes.c_double(pos[nT, nX])   
        
-        self._irbem_obj.coord_trans_vec1_(ctypes.byref(nTime), ctypes.byref(sysIn),
-           ctypes.byref(sysOut), ctypes.byref(iyear), ctypes.byref(idoy),
-           ctypes.byref(ut), ctypes.byref(posInArr), ctypes.byref(posOutArr))
-        return np.array(posOutArr[:])
+        _run_chunked(self._irbem_obj.coord_trans_vec1_, nTime.value, 
+            self.NTIME_MAX.value, sysIn, sysOut, iyear, idoy, ut, posInArr, 
+            posOutArr)
+        return posOutArr
+
+    def rotation_matrices(self, time, sysaxesIn, sysaxesOut):
+        """
+        NAME:  rotation_matrices(self, time, sysaxesIn, sysaxesOut)
+        USE:   This function returns the matrices that rotate cartesian vectors 
+               from the coordinate system sysaxesIn to sysaxesOut at each time. 
+               One set of matrices can then be applied with rotate() to any 
+               number of vectors that share the times, e.g. positions and 
+               magnetic field vectors. The rotations are computed once per 
+               unique time.
+        INPUT:  time - times in any of the transform() formats.
+                sysaxesIn, sysaxesOut - geocentric cartesian coordinate 
+                systems (GEO, GSM, GSE, SM, GEI, MAG, TOD, J2000 or TEME), as 
+                integers or keywords.
+        RETURNS: A (nT x 3 x 3) array R, so that vOut = R[i] @ vIn at time i.
+        MOD:     2026-10-18
+        """
+        sysIn = self._coordSys(sysaxesIn)
+        sysOut = self._coordSys(sysaxesOut)
+        # The other systems are not cartesian, or their origin is not the 
+        # Earth's center.
+        rotations = {1, 2, 3, 4, 5, 6, 12, 13, 14}
+        if not {sysIn.value, sysOut.value} <= rotations:
+            raise ValueError('Rotation matrices are only defined between geocentric '
+                             'cartesian coordinate systems.')
+        try:
+            times, inverse = np.unique(_to_datetime64(time), return_inverse=True)
+        except (ValueError, TypeError, OverflowError) as err:
+            raise ValueError('Unknown time format. Valid formats: ISO '
+                'string, datetime, numpy.datetime64 or pandas objects, or '
+                'arrays of those objects') from err
+        iyear, idoy, ut = [np.repeat(t, 3) for t in self._cTimes(times)]
+
+        # The transformed x, y and z unit vectors are the matrix columns.
+        basis = np.tile(np.eye(3), (times.shape[0], 1))
+        columns = np.empty_like(basis)
+        _run_chunked(self._irbem_obj.coord_trans_vec1_, basis.shape[0], 
+            self.NTIME_MAX.value, sysIn, sysOut, iyear, idoy, ut, basis, columns)
+        matrices = columns.reshape(times.shape[0], 3, 3).swapaxes(1, 2)
+        return matrices[inverse.reshape(-1)]
+
+    def rotate(self, matrices, vectors):
+        """
+        NAME:  rotate(self, matrices, vectors)
+        USE:   Applies the rotation_matrices() output to the vectors at the 
+               same times with numpy.einsum.
+        INPUT:  matrices - A (nT x 3 x 3) rotation_matrices() array.
+                vectors - A (nT x 3) array, or (nT x ... x 3) for several 
+                vectors per time.
+        RETURNS: The rotated vectors, with the shape of vectors.
+        MOD:     2026-10-18
+        """
+        return np.einsum('tij,t...j->t...i', matrices, vectors)
         
     def _cTimes(self, times):
         """
         NAME:  _cTimes(self, times)
         USE:   This is a helper function that takes in an array of times in ISO 
-                format or datetime format and returns it in ctypes format with 
-                iyear, idoy, and ut.
-        INPUT: times as datetime or ISO string objects. Or an array/list of those
-                objects.
+                format, datetime, numpy.datetime64 or pandas format and returns 
+                it with iyear, idoy, and ut.
+        INPUT: times as datetime, numpy.datetime64, pandas or ISO string objects. 
+                Or an array/list/pandas.DatetimeIndex of those objects.
         AUTHOR: Mykhaylo Shumko
-        RETURNS: Arrays of iyear, idoy, ut.
+        RETURNS: Contiguous numpy arrays of iyear, idoy (int32), and ut (float64).
         MOD:     2017-07-14
         """
-        if not hasattr(times, '__len__'): # Make an array if only one value supplied.
-            times = np.array([times])
-        N = len(times)
-        
-        # Intialize the C arrays
-        tArrType = (ctypes.c_int * N)
-        utArrType = (ctypes.c_double * N)
-        iyear, idoy = [tArrType() for i in range(2)]
-        ut = utArrType()
-        
-        # Convert to datetimes if necessary.
-        if isinstance(times[0], str): 
-            t = list(map(dateutil.parser.parse, times))
-        elif isinstance(times[0], datetime.datetime):
-            t = times
-        else:
+        try:
+            return _decode_times(times)
+        except (ValueError, TypeError, OverflowError) as err:
             raise ValueError('Unknown time format. Valid formats: ISO '
-                'string, datetime objects, or arrays of those objects')   
-        
-        for nT in range(N): # Populate C arrays
-            iyear[nT] = ctypes.c_int(t[nT].year)
-            idoy[nT] = ctypes.c_int(t[nT].timetuple().tm_yday)
-            ut[nT] = ctypes.c_double(3600*t[nT].hour + 60*t[nT].minute + 
-                t[nT].second)
-        return iyear, idoy, ut
+                'string, datetime, numpy.datetime64 or pandas objects, or '
+                'arrays of those objects') from err
 
     def _coordSys(self, coordSystem):
         """
@@ -1122,29 +2708,120 @@ class Coords:
                     longi - Re, deg., deg.)
                 8: RLL  (radial distance, lati, East longi - Re, deg., 
                     deg. - prefered to 7)
+                9: HEE (cartesian) - AU
+                10: HAE (cartesian) - AU
+                11: HEEQ (cartesian) - AU
+                12: TOD (cartesian, same as GEI) - Re
+                13: J2000 (cartesian) - Re
+                14: TEME (cartesian) - Re
+                15: DMAG (eccentric dipole, cartesian) - Re
                either an integer or a 3 letter string.
         AUTHOR: Mykhaylo Shumko
         RETURNS: IRBEM sysaxes integer
         MOD:     2017-07-14
         """
         lookupTable = {'GDZ':0, 'GEO':1, 'GSM':2, 'GSE':3, 'SM':4, 'GEI':5, 
-            'MAG':6, 'SPH':7, 'RLL':8}
+            'MAG':6, 'SPH':7, 'RLL':8, 'HEE':9, 'HAE':10, 'HEEQ':11, 'TOD':12, 
+            'J2000':13, 'TEME':14, 'DMAG':15}
         
         if isinstance(coordSystem, str):
             assert coordSystem.upper() in lookupTable.keys(), ('ERROR: Unknown'
                 ' coordinate system! Choose from GDZ, GEO, GSM, GSE, SM, GEI, '
-                'MAG, SPH, RLL.')
-            return ctypes.c_int(lookupTable[coordSystem])
+                'MAG, SPH, RLL, HEE, HAE, HEEQ, TOD, J2000, TEME, DMAG.')
+            return ctypes.c_int(lookupTable[coordSystem.upper()])
         elif isinstance(coordSystem, int):
             return ctypes.c_int(coordSystem)
         else:
             raise ValueError('Error, coordinate axis can only be a string or int!')
 
 
-def _load_shared_object(path=None):
+def pack_ts07d_coeffs(data_path=None):
+    """
+    Packs the TS07D coefficient files in the Coeffs/YYYY_DOY/ subdirectories
+    of data_path into a single data_path/Coeffs.bin archive with one fixed
+    length record per 5 minute interval. When the archive exists, IRBEM-LIB
+    reads a coefficient set with one direct access read instead of opening
+    and parsing a text file, and the operating system keeps the archive
+    mapped in its page cache. The intervals in the archive take precedence
+    over the text files, and the other intervals are still read from their
+    text files, so run it again after adding or updating coefficient files.
+    A new archive takes effect at the next IRBEM call, also in a running
+    process.
+
+    Parameters
+    ----------
+    data_path: str or pathlib.Path
+        The TS07D data directory. Defaults to the TS07_DATA_PATH environment
+        variable.
+
+    Returns
+    -------
+    The pathlib.Path of the archive.
+
+    Example
+    -------
+    IRBEM.pack_ts07d_coeffs()  # once, after running setup_ts07d_files.sh
+    model = IRBEM.MagFields(options=[0,0,0,0,0], kext='T07')
+    """
+    if data_path is None:
+        data_path = os.environ.get('TS07_DATA_PATH')
+        if not data_path:
+            raise ValueError('data_path is not given and the TS07_DATA_PATH '
+                             'environment variable is not set.')
+    data_path = pathlib.Path(data_path)
+    files = sorted(data_path.glob('Coeffs/*/*.par'))
+    if not files:
+        raise FileNotFoundError(f'No coefficient files in {data_path / "Coeffs"}.')
+
+    keys = np.array([_ts07d_interval(*map(int, file.stem.split('_')))
+                     for file in files])
+    base = keys.min()
+    archive = data_path / 'Coeffs.bin'
+    tmp_archive = archive.with_suffix('.bin.tmp')
+    # Record 0 is the header (format version, first interval, number of
+    # intervals), and M_INX = -1 marks the intervals without a file.
+    records = np.memmap(tmp_archive, dtype=np.float64, mode='w+',
+                        shape=(keys.max() - base + 2, _TS07D_NREC))
+    records[1:, _TS07D_NTOT] = -1
+    records[0, :3] = [1, base, records.shape[0] - 1]
+    for file, key in zip(files, keys):
+        records[key - base + 1] = _read_ts07d_par(file)
+    records.flush()
+    del records
+    os.replace(tmp_archive, archive)
+    return archive
+
+
+def _ts07d_interval(year, doy, hour, minute):
+    """
+    The index of the 5 minute TS07D coefficient interval, as computed by
+    INIT_TS07D_COEFFS from the Julian day number.
+    """
+    jdn = datetime.date(year, 1, 1).toordinal() + _JULDAY_OFFSET + doy - 1
+    return jdn*288 + hour*12 + minute//5
+
+
+def _read_ts07d_par(file):
+    """
+    Reads a TS07D coefficient file into an archive record: the 101 A07
+    coefficients followed by M_INX, N_INX, PDYN and TILT.
+    """
+    lines = pathlib.Path(file).read_text().splitlines()
+    values = [float(line.replace('D', 'E')) for line in lines[:_TS07D_NTOT]]
+    # COEFF_Q, COEFF_B_RMS, M_INX, N_INX, PDYN and TILT follow a 7 character label.
+    extra = [float(line[7:].replace('D', 'E'))
+             for line in lines[_TS07D_NTOT:_TS07D_NTOT + 6]]
+    return values + extra[2:]
+
+
+def _load_shared_object(path=None, private=False):
     """
     Searches for and loads a shared object (.so or .dll file). If path is specified
-    it doesn't search for the file.
+    it doesn't search for the file. 
+    
+    If private is True, the shared object is copied to a temporary file before 
+    it is loaded. The dynamic loader treats every copy as a different library, 
+    so each one has its own Fortran COMMON block state.
     """
     if path is None:
         if (sys.platform == 'win32') or (sys.platform == 'cygwin'):
@@ -1159,6 +2836,12 @@ def _load_shared_object(path=None):
             f'{pathlib.Path(__file__).parents[2]} folder: {matched_object_files}.'
             )
         path = matched_object_files[0]
+
+    if private:
+        shared_object_path = path
+        fd, path = tempfile.mkstemp(suffix=pathlib.Path(path).suffix, prefix='libirbem_')
+        os.close(fd)
+        shutil.copyfile(shared_object_path, path)
         
     # Open the shared object file.
     try:
@@ -1175,8 +2858,474 @@ def _load_shared_object(path=None):
             raise OSError(f'Could not load the IRBEM shared object file in {path}') from err
         else:
             raise
+    finally:
+        if private:
+            # The loaded copy stays mapped in memory after the file is removed. 
+            # Windows can not remove a loaded .dll, so the removal is retried at exit.
+            try:
+                os.remove(path)
+            except OSError:
+                atexit.register(_remove_file, path)
+    if private:
+        path = shared_object_path
     return path, _irbem_obj
 
+def _remove_file(path):
+    """
+    Removes a file, ignoring errors.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return
+
+def _prep_time_loc_arrays(X):
+    """
+    Converts the X dictionary into ntime (ctypes int) and the contiguous 
+    iyear, idoy (int32), and ut, x1, x2, x3 (float64) arrays. A single time 
+    is repeated for all of the positions. See MagFields._prepTimeLocArray().
+    """
+    # identify the time key.
+    time_keys = [key for key in X.keys() if 'time' in key.lower()]
+    assert len(time_keys) == 1, ('None or multiple time keys found in '
+                                f'dictionary input \n {X}')
+    time_key = time_keys[0]
+
+    # Single inputs are viewed as length-1 arrays. This does not modify X.
+    x1, x2, x3 = [np.atleast_1d(np.asarray(X[key], dtype=np.float64)) 
+                  for key in ['x1', 'x2', 'x3']]
+    x1, x2, x3 = [np.ascontiguousarray(x) for x in (x1, x2, x3)]
+    nTimePy = x1.shape[0]
+    if not (x2.shape[0] == x3.shape[0] == nTimePy):
+        raise ValueError('The x1, x2, and x3 inputs must have the same length.')
+
+    ntime = ctypes.c_int(nTimePy)
+
+    iyear, idoy, ut = _decode_times(X[time_key])
+    if iyear.shape[0] == 1 and nTimePy > 1:
+        # A single time applies to all of the positions.
+        iyear, idoy, ut = [np.repeat(t, nTimePy) for t in (iyear, idoy, ut)]
+    if iyear.shape[0] != nTimePy:
+        raise ValueError(f'The time array length {iyear.shape[0]} does not '
+                         f'match the position array length {nTimePy}.')
+    return ntime, iyear, idoy, ut, x1, x2, x3
+
+def _prep_maginput(inputDict=None, ntime=None):
+    """
+    Converts the maginput dictionary into a float64 array with shape (25,) for 
+    scalar inputs or (ntime, 25) for array inputs. Each key can be a scalar or 
+    an array, and the keys are broadcast against each other. If ntime is 
+    given, the array is broadcast to (ntime, 25) as a read-only view, so a 
+    constant input does not take memory per point. See 
+    MagFields._prepMagInput().
+    """
+    orderedKeys = ['Kp', 'Dst', 'dens', 'velo', 'Pdyn', 'ByIMF', \
+        'BzIMF', 'G1', 'G2', 'G3', 'W1', 'W2', 'W3', 'W4', 'W5', 'W6', \
+        'AL']
+    # If no model inputs (statis magnetic field model)
+    if (inputDict is None) or (inputDict == {}):
+        maginput = np.full(25, -9999, dtype=np.float64)
+    else:
+        for value in inputDict.values():
+            # If model inputs are something else (probably incorrect format)
+            if not isinstance(value, (np.ndarray, list, tuple, int, float, np.number)):
+                raise TypeError('Model inputs are in an unrecognizable format.' +\
+                ' Try a dictionary of numpy arrays, lists, ints or floats')
+        columns = [np.asarray(inputDict.get(key, -9999), dtype=np.float64) 
+                   for key in orderedKeys]
+        shape = np.broadcast_shapes(*[column.shape for column in columns])
+        if len(shape) > 1:
+            raise ValueError('The maginput values must be scalars or 1d arrays.')
+        # Fill the columns in the maginput(25,ntime) order in one step.
+        maginput = np.full(shape + (25,), -9999, dtype=np.float64)
+        maginput[..., :len(orderedKeys)] = np.stack(
+            np.broadcast_arrays(*columns), axis=-1)
+
+    if ntime is not None:
+        if maginput.ndim == 2 and maginput.shape[0] not in (1, ntime):
+            raise ValueError(f'The maginput length {maginput.shape[0]} does not '
+                             f'match the position array length {ntime}.')
+        maginput = np.broadcast_to(maginput, (ntime, 25))
+    return maginput
+
+def _decode_times(times):
+    """
+    Converts a time, or an array of times, into the iyear, idoy, and ut 
+    arrays used by IRBEM in a few vectorized NumPy operations. Times can be 
+    numpy.datetime64 arrays, pandas Timestamps, DatetimeIndex or Series, 
+    datetime objects, or ISO-formatted strings. Fractional seconds are kept 
+    in ut. Timezone-aware times are decoded using their wall-clock time, as 
+    datetime.datetime.timetuple() does.
+
+    Returns contiguous int32 iyear and idoy arrays, and a float64 ut 
+    (seconds of day) array.
+    """
+    t = _to_datetime64(times)
+    days = t.astype('datetime64[D]')
+    years = t.astype('datetime64[Y]')
+    iyear = np.ascontiguousarray(years.astype(np.int64) + 1970, dtype=np.int32)
+    idoy = np.ascontiguousarray((days - years).astype(np.int64) + 1, dtype=np.int32)
+    ut = np.ascontiguousarray((t - days) / np.timedelta64(1, 's'), dtype=np.float64)
+    return iyear, idoy, ut
+
+def _to_datetime64(times):
+    """
+    Converts the time inputs accepted by _decode_times into a 1d 
+    numpy.datetime64 array.
+    """
+    if pandas_imported and isinstance(times, (pd.Series, pd.DatetimeIndex, pd.Timestamp)):
+        if isinstance(times, pd.Timestamp):
+            times = [times]
+        times = pd.DatetimeIndex(times)
+        if times.tz is not None:
+            times = times.tz_localize(None)
+        return np.atleast_1d(times.to_numpy(dtype='datetime64[ns]'))
+
+    times = np.atleast_1d(np.asarray(times))
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times
+    
+    first = times[0] if times.size else None
+    if isinstance(first, datetime.datetime):
+        if first.tzinfo is not None:
+            times = np.array([t.replace(tzinfo=None) for t in times])
+        return times.astype('datetime64[us]')
+    # ISO strings are parsed by NumPy in C. Anything NumPy can not parse 
+    # exactly (e.g. other formats or UTC offsets) falls back to dateutil.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            return times.astype('datetime64[ns]')
+    except (ValueError, TypeError, UserWarning, DeprecationWarning):
+        return np.array([dateutil.parser.parse(t).replace(tzinfo=None) 
+                         for t in times], dtype='datetime64[us]')
+
+# The MagFields object used by each ParallelMagFields worker process.
+_worker_model = None
+
+def _init_worker_model(kwargs):
+    """
+    Loads the IRBEM shared object once per ParallelMagFields worker process.
+    """
+    global _worker_model
+    _worker_model = MagFields(**kwargs)
+    _single_openmp_thread(_worker_model._irbem_obj)
+    return
+
+def _single_openmp_thread(irbem_obj):
+    """
+    Runs the OpenMP regions of a shared object built with OPENMP=1 on the 
+    calling thread only, as the workers already split the points. A worker 
+    process forked after the parent ran an OpenMP region would otherwise 
+    hang in its first one. Serial builds do not export omp_set_num_threads.
+    """
+    try:
+        irbem_obj.omp_set_num_threads(1)
+    except AttributeError:
+        pass
+    return
+
+def _run_worker_model(method, args):
+    """
+    Runs a MagFields array method in a ParallelMagFields worker process.
+    """
+    return getattr(_worker_model, method)(*args)
+
+def _run_chunked(routine, ntime, ntime_max, *args):
+    """
+    Runs an IRBEM routine whose first argument is ntime over consecutive chunks 
+    of at most ntime_max points, so inputs of any length can be processed.
+
+    NumPy array arguments with a leading time axis of length ntime are sliced 
+    along that axis. The slices of contiguous arrays are views, so each chunk 
+    reads its inputs and writes its outputs in place in the caller's 
+    (preallocated) arrays. Non-contiguous inputs, such as a broadcast 
+    maginput, are copied one chunk at a time. All other arguments are passed 
+    by reference as they are.
+    """
+    for start in range(0, ntime, ntime_max):
+        stop = min(start + ntime_max, ntime)
+        c_args = []
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                if _has_time_axis(arg, ntime):
+                    # Broadcast (zero stride) inputs are copied one chunk at a 
+                    # time, contiguous slices are passed as they are.
+                    arg = np.ascontiguousarray(arg[start:stop])
+                c_args.append(_c_ptr(arg))
+            else:
+                c_args.append(ctypes.byref(arg))
+        routine(ctypes.byref(ctypes.c_int(stop - start)), *c_args)
+    return
+
+def _trajectory_seconds(iyear, idoy, ut):
+    """
+    Returns the times of the prepared iyear, idoy and ut arrays in seconds 
+    since 1970.
+    """
+    years = (iyear - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    days = years.astype(np.float64) + idoy - 1
+    return 86400*days + ut
+
+def _adaptive_samples(t, compute, cadence, rtol):
+    """
+    Runs compute(idx), which returns the (len(idx), 6) make_lstar outputs of 
+    the samples idx, every cadence samples of the times t, then bisects the 
+    intervals that fail _interpolation_ok() until they pass or have no 
+    samples left inside. The other samples are interpolated.
+
+    Returns
+    -------
+    tuple
+        The (ntime, 6) outputs and the boolean array of the computed samples.
+    """
+    ntime = t.shape[0]
+    values = np.empty((ntime, 6))
+    computed = np.zeros(ntime, dtype=bool)
+    idx = np.unique(np.r_[np.arange(0, ntime, cadence), ntime-1])
+    values[idx] = compute(idx)
+    computed[idx] = True
+
+    lo, hi = idx[:-1], idx[1:]
+    while True:
+        inner = hi - lo > 1
+        lo, hi = lo[inner], hi[inner]
+        if lo.size == 0:
+            break
+        # The midpoints of all of the open intervals are run in one call, in 
+        # time order so make_lstar1 can start from the previous drift shell.
+        order = np.argsort(lo)
+        lo, hi = lo[order], hi[order]
+        mid = (lo + hi)//2
+        values[mid] = compute(mid)
+        computed[mid] = True
+        split = ~_interpolation_ok(t, values, lo, mid, hi, rtol)
+        lo = np.r_[lo[split], mid[split]]
+        hi = np.r_[mid[split], hi[split]]
+
+    known = np.flatnonzero(computed)
+    missing = np.flatnonzero(~computed)
+    right = np.searchsorted(known, missing)
+    left, right = known[right-1], known[right]
+    w = ((t[missing] - t[left])/(t[right] - t[left]))[:, np.newaxis]
+    values[missing] = _interpolate_outputs(values[left], values[right], w)
+    # Intervals with bad data at one end are computed throughout, so the bad 
+    # data left to fill is that of all bad intervals.
+    bad = values[left] == baddata
+    values[missing] = np.where(bad, baddata, values[missing])
+    return values, computed
+
+def _interpolate_outputs(v0, v1, w):
+    """
+    Linearly interpolates the make_lstar outputs v0 and v1 with the weights w 
+    of v1, the MLT across midnight.
+    """
+    v = v0 + w*(v1 - v0)
+    dmlt = (v1[:, 5] - v0[:, 5] + 12) % 24 - 12
+    v[:, 5] = (v0[:, 5] + w[:, 0]*dmlt) % 24
+    return v
+
+def _interpolation_ok(t, values, lo, mid, hi, rtol):
+    """
+    Checks, for each interval, that the computed midpoint matches the 
+    interpolation of the computed endpoints within rtol, and that the three 
+    samples agree in bad data and in the sign of Lm and L*.
+    """
+    v0, vm, v1 = values[lo], values[mid], values[hi]
+    sign = np.ones(6)
+    sign[:2] = 0
+
+    def status(v):
+        return np.where(v == baddata, 0, np.where(sign == 1, 1, np.sign(v)))
+
+    same = (status(v0) == status(vm)) & (status(vm) == status(v1))
+    w = ((t[mid] - t[lo])/(t[hi] - t[lo]))[:, np.newaxis]
+    err = _interpolate_outputs(v0, v1, w) - vm
+    err[:, 5] = (err[:, 5] + 12) % 24 - 12
+    scale = np.abs(vm)
+    scale[:, 4] = np.abs(vm[:, 0])
+    scale[:, 5] = 24
+    ok = (vm == baddata) | (np.abs(err) <= rtol*scale)
+    return np.all(same & ok, axis=1)
+
+def _pack_lines(posit, blocal, nposit, compact):
+    """
+    Formats the fixed size (nlines, 1000) field line buffers filled by 
+    drift_shell1 and drift_bounce_orbit2_1. The unused points of POSIT are set 
+    to NaN or, if compact, dropped so that the lines are packed back to back 
+    with an offsets array.
+    """
+    nposit = np.clip(nposit, 0, posit.shape[1])
+    valid = np.arange(posit.shape[1]) < nposit[:, np.newaxis]
+    if compact:
+        offsets = np.zeros(len(nposit)+1, dtype=np.int32)
+        np.cumsum(nposit, out=offsets[1:])
+        return {'POSIT':posit[valid], 'blocal':blocal[valid], 'offsets':offsets}
+    posit[~valid] = np.nan
+    return {'POSIT':posit, 'blocal':blocal}
+
+def _bounce_quadrature(n):
+    """
+    Returns the Gauss-Legendre nodes and weights, mapped to theta in [0, pi], 
+    of the bounce integrals.
+    """
+    x, weights = np.polynomial.legendre.leggauss(n)
+    return np.pi*(x + 1)/2, np.pi*weights/2
+
+def _spline_field_line(posit, blocal):
+    """
+    Returns cubic splines of B and of the GEO position along the arc length 
+    (in Re) of a traced field line, and the arc length of the minimum of B. 
+    Returns None if the line has too few points.
+    """
+    # Arc length along the line, without the repeated points.
+    step = np.linalg.norm(np.diff(posit, axis=0), axis=1)
+    keep = np.concatenate(([True], step > 0))
+    s = np.concatenate(([0], np.cumsum(step)))[keep]
+    if s.shape[0] < 4:
+        return None
+    fB = scipy.interpolate.CubicSpline(s, blocal[keep])
+    fX = scipy.interpolate.CubicSpline(s, posit[keep])
+    return fB, fX, s[np.argmin(blocal[keep])]
+
+def _bounce_nodes(fB, fX, s_eq, mirrorB, theta, weights):
+    """
+    Returns the GEO positions, B and weights of the quadrature nodes of the 
+    bounce integral of ds/sqrt(1 - B(s)/Bm) for each mirror field Bm, with 
+    shapes (n_Bm, n_nodes, 3) and (n_Bm, n_nodes). The mirror points are the 
+    B(s) = Bm crossings closest to the minimum of B on either side. The nodes 
+    are NaN when one of the mirror points is not on the line.
+    """
+    s1, s2 = np.full(mirrorB.shape, np.nan), np.full(mirrorB.shape, np.nan)
+    for j, Bm in enumerate(mirrorB):
+        roots = fB.solve(Bm, extrapolate=False)
+        if np.any(roots <= s_eq) and np.any(roots >= s_eq):
+            s1[j] = roots[roots <= s_eq].max()
+            s2[j] = roots[roots >= s_eq].min()
+    valid = ~np.isnan(s1)
+    mid = ((s1 + s2)/2)[valid, np.newaxis]
+    half = ((s2 - s1)/2)[valid, np.newaxis]
+    s = mid - half*np.cos(theta)
+
+    nodes = np.full((mirrorB.shape[0], theta.shape[0], 3), np.nan)
+    B = np.full(nodes.shape[:-1], np.nan)
+    w = np.full(nodes.shape[:-1], np.nan)
+    nodes[valid] = fX(s)
+    B[valid] = fB(s)
+    w[valid] = weights*half*np.sin(theta)/np.sqrt(np.abs(1 - B[valid]/mirrorB[valid, np.newaxis]))
+    return nodes, B, w
+
+def _bounce_path_integral(posit, blocal, mirrorB, theta, weights):
+    """
+    Integrates ds/sqrt(1 - B(s)/Bm) along a traced field line between the 
+    mirror points of each mirror field Bm (in Re). The integral is NaN when 
+    one of the mirror points is not on the line.
+    """
+    splines = _spline_field_line(posit, blocal)
+    if splines is None:
+        return np.full(mirrorB.shape, np.nan)
+    _, _, w = _bounce_nodes(*splines, mirrorB, theta, weights)
+    return np.sum(w, axis=-1)
+
+def _nbytes(value):
+    """
+    Estimates the memory, in bytes, used by a memoized value.
+    """
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+def _pack_arrays(*arrays):
+    """
+    Serializes NumPy arrays into bytes (without pickle) for the ResultCache.
+    """
+    buffer = io.BytesIO()
+    for array in arrays:
+        np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+def _unpack_arrays(value):
+    """
+    Deserializes the arrays saved by _pack_arrays.
+    """
+    buffer = io.BytesIO(value)
+    arrays = []
+    while buffer.tell() < len(value):
+        arrays.append(np.load(buffer, allow_pickle=False))
+    return arrays
+
+def _output_buffers(out, shapes, dtype=np.float64):
+    """
+    Returns the output arrays of an IRBEM routine: the arrays in the out tuple, 
+    after checking that the routine can write into them in place, or new 
+    empty arrays where out is None or has a None.
+    """
+    if out is None:
+        out = (None,)*len(shapes)
+    buffers = []
+    for buffer, shape in zip(out, shapes):
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+        elif (buffer.shape != shape or buffer.dtype != dtype or 
+              not buffer.flags.c_contiguous or not buffer.flags.writeable):
+            raise ValueError(f'The out arrays must be writeable C-contiguous '
+                             f'{np.dtype(dtype)} arrays with shape {shape}. Got a '
+                             f'{buffer.dtype} array with shape {buffer.shape}.')
+        buffers.append(buffer)
+    return buffers
+
+def _out_tuple(out, keys):
+    """
+    Orders the out dictionary of a public method by its output keys, with None 
+    for the outputs that are not in out.
+    """
+    if out is None:
+        return None
+    unknown = set(out) - set(keys)
+    if unknown:
+        raise ValueError(f'Unknown out keys {sorted(unknown)}. The valid keys '
+                         f'are {keys}.')
+    return tuple(out.get(key) for key in keys)
+
+def _baddata_to_nan(*arrays):
+    """
+    Replaces IRBEM-LIB's bad data value with NaN in the float arrays, in place.
+    """
+    for array in arrays:
+        np.copyto(array, np.nan, where=(array == baddata))
+    return
+
+def _grow(array, capacity):
+    """
+    Returns a copy of array with its first axis enlarged to capacity.
+    """
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+def _has_time_axis(arg, ntime):
+    """
+    Checks if arg is a NumPy array with a leading time axis of length ntime.
+    """
+    return isinstance(arg, np.ndarray) and arg.ndim > 0 and arg.shape[0] == ntime
+
+def _is_array_input(X):
+    """
+    Checks if the X input dictionary contains arrays rather than a single 
+    time and location.
+    """
+    return np.ndim(X['x1']) > 0
+
+def _c_ptr(array):
+    """
+    Returns a pointer to a contiguous NumPy array's buffer so it can be passed 
+    by reference to the Fortran routines without copying it.
+    """
+    return array.ctypes.data_as(ctypes.c_void_p)
+
 """
 These are helper functions to calculate relativistic velocity, 
 parallel velocity, and relativistic gamma factor.
@@ -1,2 +1,6 @@
 from .IRBEM import MagFields
-from .IRBEM import Coords
\ No newline at end of file
+from .IRBEM import ParallelMagFields
+from .IRBEM import PreparedInput
+from .IRBEM import ResultCache
+from .IRBEM import Coords
+from .IRBEM import pack_ts07d_coeffs
@@ -1,4 +1,8 @@
+import os
 import unittest
+import ctypes
+import pathlib
+import tempfile
 import datetime
 import dateutil.parser
 import numpy as np
@@ -90,18 +94,351 @@ class TestIRBEM(unittest.TestCase):
         self.assertAlmostEqualDict(self.model.make_lstar_output, array_true_dict)
         return
 
+    def test_lstar_numpy_array(self):
+        """
+        Test that contiguous numpy inputs give the same output as lists.
+        """
+        X_np = {key:np.array(value) for key, value in self.X_array.items()}
+        maginput_np = {key:np.array(value) for key, value in self.maginput_array.items()}
+        numpy_output = self.model.make_lstar(X_np, maginput_np)
+        list_output = self.model.make_lstar(self.X_array, self.maginput_array)
+        self.assertAlmostEqualDict(numpy_output, list_output)
+        return
+
+    def test_lstar_datetime64(self):
+        """
+        Test lstar with numpy.datetime64 and pandas time arrays.
+        """
+        X_dt64 = self.X_array.copy()
+        X_dt64['dateTime'] = np.array(X_dt64['dateTime'], dtype='datetime64[ns]')
+        dt64_output = self.model.make_lstar(X_dt64, self.maginput_array)
+        list_output = self.model.make_lstar(self.X_array, self.maginput_array)
+        self.assertAlmostEqualDict(dt64_output, list_output)
+        if pandas_imported:
+            pd_output = self.model.make_lstar(self.X_array_pd, self.maginput_array)
+            self.assertAlmostEqualDict(pd_output, list_output)
+        return
+
+    def test_decode_times(self):
+        """
+        Test that the time decoder keeps fractional seconds and finds the
+        day of year for every supported time format.
+        """
+        times = ['2016-12-31T23:59:59.5', '2015-02-02T06:12:43.25']
+        true_values = ([2016, 2015], [366, 33], [86399.5, 22363.25])
+        time_formats = [times, np.array(times, dtype='datetime64[ms]'),
+                        [dateutil.parser.parse(t) for t in times]]
+        if pandas_imported:
+            time_formats.append(pd.to_datetime(times))
+        for time_format in time_formats:
+            decoded = IRBEM.IRBEM._decode_times(time_format)
+            for values, true in zip(decoded, true_values):
+                np.testing.assert_array_equal(values, true)
+        return
+
     def test_lstar_large_array(self):
         """
         Test lstar with array inputs that are longer than NTIME_MAX and 
-        verify that the wrapper returns a ValueError.
+        verify that the wrapper runs them in chunks.
         """
-        n = self.model.NTIME_MAX.value + 1
+        chunked_model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89')
+        chunked_model.NTIME_MAX = ctypes.c_int(2)
 
-        X_huge = {key:n*[value] for key, value in self.X.items()}
-        maginput_huge = {key:n*[value] for key, value in self.maginput.items()}
-        
+        chunked_output = chunked_model.make_lstar(self.X_array, self.maginput_array)
+        output = self.model.make_lstar(self.X_array, self.maginput_array)
+        self.assertAlmostEqualDict(chunked_output, output)
+        return
+
+    def test_make_lstar_shell_splitting(self):
+        """
+        Test that make_lstar_shell_splitting returns (ntime, Nipa) arrays, 
+        that its 90 degree column matches make_lstar, and that it gives the 
+        same output when run in chunks.
+        """
+        alpha = [90, 60, 30]
+        output = self.model.make_lstar_shell_splitting(self.X_array, 
+                                                       self.maginput_array, alpha)
+        self.assertEqual(output['Lm'].shape, (len(self.X_array['x1']), len(alpha)))
+        lstar_output = self.model.make_lstar(self.X_array, self.maginput_array)
+        np.testing.assert_allclose(output['Lm'][:, 0], lstar_output['Lm'])
+        np.testing.assert_allclose(output['bmirr'][:, 0], lstar_output['blocal'])
+
+        chunked_model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89')
+        chunked_model.NTIME_MAX = ctypes.c_int(2)
+        chunked_output = chunked_model.make_lstar_shell_splitting(
+            self.X_array, self.maginput_array, alpha)
+        for key in output:
+            np.testing.assert_array_equal(chunked_output[key], output[key])
+        return
+
+    def test_make_lstar_trajectory(self):
+        """
+        Test that the adaptive cadence L* along a trajectory computes fewer 
+        points than make_lstar, matches it within the tolerance, and finds 
+        the same bad data samples.
+        """
+        model = IRBEM.MagFields(options=[1,0,0,0,5], verbose=False, kext=0)
+        n = 100
+        phase = np.linspace(0, np.pi, n)
+        X = {'x1':20000 + 5000*np.cos(phase), 'x2':20*np.sin(phase), 
+             'x3':np.linspace(0, 90, n), 
+             'dateTime':[self.X['dateTime'] + datetime.timedelta(minutes=i) for i in range(n)]}
+        for key in ['x1', 'x2', 'x3']:
+            X[key][45:50] = -1E31
+        maginput = {'Kp':np.full(n, 40)}
+        full = model.make_lstar(X, maginput)
+        output = model.make_lstar_trajectory(X, maginput, rtol=1e-2, cadence=10)
+
+        computed = output['computed']
+        self.assertLess(computed.sum(), n)
+        for key in full:
+            self.assertEqual(output[key].shape, full[key].shape)
+            np.testing.assert_array_equal(output[key] == -1E31, full[key] == -1E31)
+        good = full['Lm'] != -1E31
+        for key in ['Lm', 'blocal', 'bmin']:
+            np.testing.assert_array_equal(output[key][computed], full[key][computed])
+            np.testing.assert_allclose(output[key][good], full[key][good], rtol=2e-2)
+        np.testing.assert_allclose(output['Lstar'][good], full['Lstar'][good], rtol=5e-2)
+        np.testing.assert_allclose(output['MLT'], full['MLT'], atol=1e-2)
+
+        X['dateTime'] = X['dateTime'][::-1]
         with self.assertRaises(ValueError):
-            self.model.make_lstar(X_huge, maginput_huge)
+            model.make_lstar_trajectory(X, maginput)
+        return
+
+    def test_make_lstar_fast(self):
+        """
+        Test that the empirical L* of method='fast' is close to the traced L* 
+        in the IGRF + OPQ77 models, for make_lstar and the pitch angle variant, 
+        and that it does not change the model selection.
+        """
+        model = IRBEM.MagFields(options=[1,0,0,0,0], verbose=False, kext='OPQ77')
+        X = {'x1':[15000, 20000], 'x2':[0, 10], 'x3':[20, 30], 
+             'dateTime':2*[self.X['dateTime']]}
+        maginput = {'Kp':[40, 40]}
+        full = model.make_lstar(X, maginput)
+        fast = model.make_lstar(X, maginput, method='fast')
+        np.testing.assert_allclose(fast['Lm'], full['Lm'])
+        np.testing.assert_allclose(fast['Lstar'], full['Lstar'], rtol=1e-2)
+
+        full = model.make_lstar_shell_splitting(X, maginput, [90, 60])
+        fast = model.make_lstar_shell_splitting(X, maginput, [90, 60], method='fast')
+        np.testing.assert_allclose(fast['Lstar'], full['Lstar'], rtol=1e-2)
+
+        with self.assertWarns(UserWarning):
+            self.model.make_lstar(X, maginput, method='fast')
+        self.assertEqual(self.model.kext.value, 4)
+        with self.assertRaises(ValueError):
+            model.make_lstar(X, maginput, method='slow')
+        return
+
+    def test_result_cache(self):
+        """
+        Test that the cached make_lstar outputs match the computed ones, that 
+        only the missing points are computed, and the cache eviction and 
+        invalidation.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = IRBEM.ResultCache(pathlib.Path(tmp_dir, 'cache.sqlite'))
+            model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89', 
+                                    cache=cache)
+            output = model.make_lstar(self.X_array, self.maginput_array)
+            self.assertAlmostEqualDict(output, self.model.make_lstar(self.X_array, 
+                                                                     self.maginput_array))
+
+            # Only the new point is computed.
+            X = {key:value+[value[0]] for key, value in self.X_array.items()}
+            X['x1'][-1] = 800
+            maginput = {key:value+[value[0]] for key, value in self.maginput_array.items()}
+            computed_points = []
+            def compute(*args):
+                computed_points.append(args[0].shape[0])
+                return IRBEM.MagFields._make_lstar_arrays(model, *args)
+            model._make_lstar_arrays = compute
+            cached_output = model.make_lstar(X, maginput)
+            self.assertEqual(computed_points, [1])
+            for key, value in output.items():
+                np.testing.assert_array_equal(cached_output[key][:-1], value)
+
+            cache.max_size = cache.size() // 2
+            cache.put_many([])
+            self.assertLessEqual(cache.size(), cache.max_size)
+            cache.validate(-2)
+            self.assertEqual(cache.size(), 0)
+            cache.close()
+        return
+
+    def test_ts07d_coeffs_archive(self):
+        """
+        Test that the TS07D fields computed from the coefficient files and
+        from the archive written by pack_ts07d_coeffs are the same, and that
+        an interval without coefficients returns bad data in both cases.
+        """
+        model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T07',
+                                sysaxes=1)
+        X = {'dateTime':['2015-02-02T06:12:43', '2015-02-02T06:14:00',
+                         '2015-02-02T07:00:00', '2015-02-02T06:12:50'],
+             'x1':[4, 3, 4, 4], 'x2':[1, 2, 0, 1], 'x3':[0.5, -1, 0, 0.5]}
+        data_path = os.environ.get('TS07_DATA_PATH')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outputs = []
+            for name in ('text', 'packed'):
+                path = pathlib.Path(tmp_dir, name)
+                make_dummy_ts07d_data(path)
+                if name == 'packed':
+                    archive = IRBEM.pack_ts07d_coeffs(path)
+                    self.assertEqual(archive, path / 'Coeffs.bin')
+                os.environ['TS07_DATA_PATH'] = str(path)
+                try:
+                    outputs.append(model.get_field_multi(X, None))
+                finally:
+                    if data_path is None:
+                        del os.environ['TS07_DATA_PATH']
+                    else:
+                        os.environ['TS07_DATA_PATH'] = data_path
+        for key in outputs[0]:
+            np.testing.assert_array_equal(outputs[0][key], outputs[1][key])
+        self.assertEqual(outputs[0]['Bl'][2], IRBEM.IRBEM.baddata)
+        return
+
+    def test_ts07d_coeffs_archive_update(self):
+        """
+        Test that the intervals missing from the Coeffs.bin archive are read 
+        from their coefficient files, and that repacking the archive in the 
+        same process replaces the coefficient sets read from the old one.
+        """
+        model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T07',
+                                sysaxes=1)
+        X = {'dateTime':['2015-02-02T06:12:43', '2015-02-02T06:16:00',
+                         '2015-02-02T07:00:00'],
+             'x1':[2.5, 2.5, 2.5], 'x2':[1, 1, 1], 'x3':[0.3, 0.3, 0.3]}
+        data_path = os.environ.get('TS07_DATA_PATH')
+
+        def get_field(path):
+            os.environ['TS07_DATA_PATH'] = str(path)
+            try:
+                return model.get_field_multi(X, None)['Bl']
+            finally:
+                if data_path is None:
+                    del os.environ['TS07_DATA_PATH']
+                else:
+                    os.environ['TS07_DATA_PATH'] = data_path
+
+        def update(path):
+            coeffs = path / 'Coeffs' / '2015_033'
+            (coeffs / '2015_033_07_00.par').write_text(
+                (coeffs / '2015_033_06_10.par').read_text())
+            (coeffs / '2015_033_06_15.par').write_text(
+                (coeffs / '2015_033_06_10.par').read_text())
+            return
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            text, packed = pathlib.Path(tmp_dir, 'text'), pathlib.Path(tmp_dir, 'packed')
+            for path in (text, packed):
+                make_dummy_ts07d_data(path)
+            IRBEM.pack_ts07d_coeffs(packed)
+            old = get_field(packed)
+            self.assertEqual(old[2], IRBEM.IRBEM.baddata)
+            update(packed)
+            added = get_field(packed)
+            IRBEM.pack_ts07d_coeffs(packed)
+            repacked = get_field(packed)
+            update(text)
+            expected = get_field(text)
+
+        self.assertNotEqual(added[2], IRBEM.IRBEM.baddata)
+        self.assertEqual(added[2], expected[2])
+        self.assertEqual(added[1], old[1])
+        self.assertNotEqual(repacked[1], old[1])
+        np.testing.assert_array_equal(repacked, expected)
+        return
+
+    def test_get_field_multi_large_array(self):
+        """
+        Test get_field_multi with an array input one element longer than 
+        NTIME_MAX.
+        """
+        n = self.model.NTIME_MAX.value + 1
+        X_huge = {key:np.repeat(value, n) for key, value in self.X.items()}
+        maginput_huge = {key:np.repeat(value, n) for key, value in self.maginput.items()}
+
+        output = self.model.get_field_multi(X_huge, maginput_huge)
+        self.assertEqual(len(output['Bl']), n)
+        np.testing.assert_allclose(output['Bl'], 42271.43059990003)
+        return
+
+    def test_parallel_make_lstar(self):
+        """
+        Test that the process pool make_lstar and get_field_multi outputs are 
+        the same, and in the same order, as the serial outputs.
+        """
+        X_np = {key:np.array(value) for key, value in self.X_array.items()}
+        X_np['x1'] = np.array([600, 700, 800])
+        with IRBEM.ParallelMagFields(n_workers=2, options=[0,0,0,0,0], 
+                                     verbose=False, kext='T89') as parallel_model:
+            parallel_output = parallel_model.make_lstar(X_np, self.maginput_array)
+            parallel_field = parallel_model.get_field_multi(X_np, self.maginput_array)
+        self.assertAlmostEqualDict(parallel_output, 
+                                   self.model.make_lstar(X_np, self.maginput_array))
+        self.assertAlmostEqualDict(parallel_field, 
+                                   self.model.get_field_multi(X_np, self.maginput_array))
+        return
+
+    def test_thread_parallel_make_lstar(self):
+        """
+        Test that the thread pool backend, with one private shared object copy 
+        per thread, gives the same make_lstar output as the serial model.
+        """
+        X_np = {key:np.array(value) for key, value in self.X_array.items()}
+        X_np['x1'] = np.array([600, 700, 800])
+        with IRBEM.ParallelMagFields(n_workers=3, backend='thread', options=[0,0,0,0,0], 
+                                     verbose=False, kext='T89') as parallel_model:
+            parallel_output = parallel_model.make_lstar(X_np, self.maginput_array)
+        self.assertAlmostEqualDict(parallel_output,
+                                   self.model.make_lstar(X_np, self.maginput_array))
+        return
+
+    @unittest.skipUnless(os.environ.get('IRBEM_SERIAL_LIB'),
+                         'IRBEM_SERIAL_LIB is not set to a serial build')
+    def test_openmp_build(self):
+        """
+        Test that an OPENMP=1 build, run with OMP_NUM_THREADS > 1, gives the
+        same outputs as the serial build in IRBEM_SERIAL_LIB.
+        """
+        serial_path = os.environ['IRBEM_SERIAL_LIB']
+        n = 40
+        X = {'dateTime':np.repeat(self.X['dateTime'], n),
+             'x1':np.linspace(600, 20000, n),
+             'x2':np.linspace(-60, 60, n),
+             'x3':np.linspace(0, 350, n)}
+        maginput = {'Kp':np.full(n, 40.0)}
+        for kext in ['T89', 'OPQ77', 'T96']:
+            model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext=kext)
+            serial_model = IRBEM.MagFields(path=serial_path, options=[0,0,0,0,0],
+                                           verbose=False, kext=kext)
+            maginput.update({'Dst':np.full(n, -20.0), 'Pdyn':np.full(n, 2.0),
+                             'ByIMF':np.full(n, 1.0), 'BzIMF':np.full(n, -2.0)})
+            field = model.get_field_multi(X, maginput)
+            serial_field = serial_model.get_field_multi(X, maginput)
+            for key in field:
+                np.testing.assert_array_equal(field[key], serial_field[key])
+
+        model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89')
+        serial_model = IRBEM.MagFields(path=serial_path, options=[0,0,0,0,0],
+                                       verbose=False, kext='T89')
+        output = model.make_lstar(X, maginput)
+        serial_output = serial_model.make_lstar(X, maginput)
+        for key in ['Lm', 'blocal', 'bmin', 'MLT']:
+            np.testing.assert_array_equal(output[key], serial_output[key])
+        # Only the first point of each thread misses the L* warm start.
+        np.testing.assert_allclose(output['Lstar'], serial_output['Lstar'], rtol=1e-3)
+        np.testing.assert_allclose(output['xj'], serial_output['xj'], rtol=1e-3)
+
+        coords = IRBEM.Coords()
+        serial_coords = IRBEM.Coords(path=serial_path)
+        pos = np.stack([X['x1']/6371 + 1, X['x2']/30, X['x3']/100], axis=1)
+        np.testing.assert_array_equal(coords.transform(X['dateTime'], pos, 'GEO', 'GSM'),
+            serial_coords.transform(X['dateTime'], pos, 'GEO', 'GSM'))
         return
 
     def test_footPoint(self):
@@ -159,6 +496,353 @@ class TestIRBEM(unittest.TestCase):
         self.assertAlmostEqualDict(self.model.find_magequator_output, find_magequator_true_dict)
         return
 
+    def test_batched_points_of_interest(self):
+        """
+        Tests that the array versions of find_foot_point, find_mirror_point 
+        and find_magequator match the single point versions.
+        """
+        foot_point = self.model.find_foot_point(self.X, self.maginput, 100, 0)
+        foot_point_multi = self.model.find_foot_point(self.X_array, self.maginput_array, 100, 0)
+        for key in ['XFOOT', 'BFOOT']:
+            self.assertEqual(foot_point_multi[key].shape, (3, 3))
+            np.testing.assert_allclose(foot_point_multi[key][-1], foot_point[key])
+        np.testing.assert_allclose(foot_point_multi['BFOOTMAG'], foot_point['BFOOTMAG'][0])
+
+        mirror_point = self.model.find_mirror_point(self.X, self.maginput, 45)
+        mirror_point_multi = self.model.find_mirror_point(self.X_array, self.maginput_array, 
+                                                          [90, 45, 45])
+        self.assertAlmostEqual(mirror_point_multi['bmin'][0], mirror_point_multi['blocal'][0])
+        np.testing.assert_allclose(mirror_point_multi['POSIT'][1:], 
+                                   [mirror_point['POSIT'], mirror_point['POSIT']])
+        np.testing.assert_allclose(mirror_point_multi['bmin'][1:], mirror_point['bmin'])
+
+        magequator = self.model.find_magequator(self.X, self.maginput)
+        magequator_multi = self.model.find_magequator(self.X_array, self.maginput_array)
+        np.testing.assert_allclose(magequator_multi['bmin'], magequator['bmin'])
+        np.testing.assert_allclose(magequator_multi['XGEO'][0], magequator['XGEO'])
+        return
+
+    def test_make_lstar_foot_equator(self):
+        """
+        Tests that the fused make_lstar_foot_equator matches the separate 
+        make_lstar, find_magequator and find_foot_point (hemiFlag=+1 and -1) 
+        calls, including the points with open field lines.
+        """
+        n = 8
+        X = {'x1':np.linspace(1000, 30000, n), 'x2':np.linspace(-60, 60, n), 
+             'x3':np.linspace(0, 300, n), 'dateTime':n*[self.X['dateTime']]}
+        maginput = {'Kp':n*[40]}
+        output = self.model.make_lstar_foot_equator(X, maginput, 100)
+
+        lstar = self.model.make_lstar(X, maginput)
+        for key in lstar:
+            np.testing.assert_array_equal(output[key], lstar[key])
+        magequator = self.model.find_magequator(X, maginput)
+        np.testing.assert_allclose(output['XGEO'], magequator['XGEO'])
+        for hemi, hemiFlag in [('N', 1), ('S', -1)]:
+            foot_point = self.model.find_foot_point(X, maginput, 100, hemiFlag)
+            for key in foot_point:
+                np.testing.assert_allclose(output[f'{key}_{hemi}'], foot_point[key])
+        self.assertEqual(output['XFOOT_S'][-1, 0], -1E31)
+        return
+
+    def test_trace_field_line_multi(self):
+        """
+        Tests that the compact batched field line traces match the single 
+        field line traces, including when the output buffer has to grow.
+        """
+        n = 12
+        X = {'x1':np.linspace(600, 1700, n), 'x2':np.full(n, 60.0), 
+             'x3':np.full(n, 50.0), 'dateTime':n*[self.X['dateTime']]}
+        maginput = {'Kp':np.full(n, 40.0)}
+        output = self.model.trace_field_line_multi(X, maginput)
+        self.assertEqual(output['POSIT'].shape, (output['offsets'][-1], 3))
+
+        for i in range(n):
+            X_i = {key:value[i] for key, value in X.items()}
+            line = self.model.trace_field_line(X_i, self.maginput)
+            i_line = slice(output['offsets'][i], output['offsets'][i+1])
+            self.assertEqual(output['Nposit'][i], line['Nposit'])
+            np.testing.assert_array_equal(output['POSIT'][i_line], line['POSIT'])
+            np.testing.assert_array_equal(output['blocal'][i_line], line['blocal'])
+            self.assertEqual(output['lm'][i], line['lm'])
+
+        # Chunks of 2 lines start with room for 3600 points, so the Fortran 
+        # routine stops early and the buffer grows.
+        chunked_model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89')
+        chunked_model.NTIME_MAX = ctypes.c_int(2)
+        chunked_output = chunked_model.trace_field_line_multi(X, maginput)
+        for key in output:
+            np.testing.assert_array_equal(chunked_output[key], output[key])
+        return
+
+    def test_field_line_memo(self):
+        """
+        Test that bounce_period and mirror_point_altitude at one location trace 
+        the field line once, and that the memo respects its size limit.
+        """
+        model = IRBEM.MagFields(options=[0,0,0,0,0], verbose=False, kext='T89')
+        X = {'x1':20000, 'x2':5, 'x3':20, 'dateTime':self.X['dateTime']}
+        traced = []
+        def trace_field_line(*args, **kwargs):
+            traced.append(args)
+            return IRBEM.MagFields.trace_field_line(model, *args, **kwargs)
+        model.trace_field_line = trace_field_line
+
+        Tb = [model.bounce_period(X, self.maginput, 1000, alpha=alpha) 
+              for alpha in [90, 60, 40]]
+        model.mirror_point_altitude(X, self.maginput)
+        self.assertEqual(len(traced), 1)
+        self.assertTrue(Tb[0] < Tb[1] < Tb[2])
+
+        model._memo.max_size = 1000
+        model._memo.put('key', np.zeros(1000))
+        self.assertLessEqual(model._memo.size, 1000)
+        return
+
+    def test_bounce_period_multi(self):
+        """
+        Test the batched bounce periods against the dipole approximation 
+        Tb = 4*L*Re/v*(1.3802 - 0.3198*(y + sqrt(y))), y = sin(equatorial alpha), 
+        which is accurate to about 1%.
+        """
+        X = {'x1':[20000, 20000, 600], 'x2':[10, 30, 60], 'x3':[50, 50, 50], 
+             'dateTime':3*[self.X['dateTime']]}
+        maginput = {'Kp':3*[40]}
+        alpha = np.array([90, 60, 30])
+        E = np.array([100, 1000, 10000])
+        Tb = self.dipol_model.bounce_period_multi(X, maginput, E, alpha=alpha)
+        self.assertEqual(Tb.shape, (3, 3, 3))
+
+        output = self.dipol_model.make_lstar(X, maginput)
+        L = np.array(output['Lm'])[:2, np.newaxis, np.newaxis]
+        y = np.sqrt(np.sin(np.deg2rad(alpha))**2*np.array(output['bmin'])[:2, np.newaxis]/
+                    np.array(output['blocal'])[:2, np.newaxis])[:, :, np.newaxis]
+        v = IRBEM.IRBEM.c*IRBEM.IRBEM.beta(E)
+        Tb_dipole = 4*L*IRBEM.IRBEM.Re*1E3/v*(1.3802 - 0.3198*(y + np.sqrt(y)))
+        np.testing.assert_allclose(Tb[:2], Tb_dipole, rtol=1.5e-2)
+        # At 600 km, the 30 degree particles mirror below the ground.
+        self.assertTrue(np.all(np.isnan(Tb[2, 2])))
+
+        # A single time applies to all of the locations.
+        X['dateTime'] = self.X['dateTime']
+        np.testing.assert_array_equal(
+            self.dipol_model.bounce_period_multi(X, maginput, E, alpha=alpha), Tb)
+        return
+
+    def test_get_hemi(self):
+        """
+        Test get_hemi in both hemispheres, with an array input longer than 
+        NTIME_MAX so it runs in chunks.
+        """
+        X = {key:np.repeat(value, 3) for key, value in self.X.items()}
+        X['x2'] = np.array([63, -63, 63])
+        maginput = {key:np.repeat(value, 3) for key, value in self.maginput.items()}
+        self.model.NTIME_MAX = ctypes.c_int(2)
+
+        hemi = self.model.get_hemi(X, maginput)
+        self.assertEqual(hemi.dtype, np.int8)
+        np.testing.assert_array_equal(hemi, [1, -1, 1])
+        return
+
+    def test_scalar_maginput_broadcast(self):
+        """
+        Test that a scalar maginput is broadcast to the array X length, in 
+        chunks shorter than the input, and that a wrong length is rejected.
+        """
+        self.model.NTIME_MAX = ctypes.c_int(2)
+        broadcast = self.model.make_lstar(self.X_array, {'Kp':40})
+        expanded = self.model.make_lstar(self.X_array, self.maginput_array)
+        np.testing.assert_allclose(broadcast['Lm'], expanded['Lm'])
+        np.testing.assert_allclose(broadcast['Lstar'], expanded['Lstar'])
+
+        maginput = self.model._prepMagInput({'Kp':40, 'Dst':[-10, -20, -30]}, 3)
+        np.testing.assert_array_equal(maginput[:, :2], [[40, -10], [40, -20], [40, -30]])
+        np.testing.assert_array_equal(maginput[:, 2:], -9999)
+
+        with self.assertRaises(ValueError):
+            self.model.get_field_multi(self.X_array, {'Kp':[40, 40]})
+        return
+
+    def test_out_buffers(self):
+        """
+        Test that the outputs are written into the caller's out arrays, that 
+        the wrong out arrays are rejected, and that the bad data value can be 
+        replaced with NaN.
+        """
+        out = {'Lm':np.empty(3), 'Lstar':np.empty(3)}
+        output = self.model.make_lstar(self.X_array, self.maginput_array, out=out)
+        self.assertIs(output['Lm'], out['Lm'])
+        self.assertIs(output['Lstar'], out['Lstar'])
+        np.testing.assert_allclose(out['Lstar'], 
+            self.model.make_lstar(self.X_array, self.maginput_array)['Lstar'])
+
+        with self.assertRaises(ValueError):
+            self.model.make_lstar(self.X_array, self.maginput_array, 
+                                  out={'Lm':np.empty(2)})
+        with self.assertRaises(ValueError):
+            self.model.make_lstar(self.X_array, self.maginput_array, 
+                                  out={'L':np.empty(3)})
+
+        with IRBEM.ParallelMagFields(n_workers=2, backend='thread', options=[0,0,0,0,0], 
+                                     verbose=False, kext='T89') as parallel_model:
+            out = {'Bgeo':np.empty((3, 3))}
+            output = parallel_model.get_field_multi(self.X_array, self.maginput_array, 
+                                                    out=out)
+            np.testing.assert_allclose(out['Bgeo'][:, 2], output['BzGEO'])
+
+        # A 1 degree pitch angle at 651 km mirrors below the surface, so 
+        # find_mirror_point returns the bad data value.
+        output = self.model.find_mirror_point(self.X_array, self.maginput_array, 
+                                              1, baddata_to_nan=True)
+        self.assertTrue(np.all(np.isnan(output['POSIT'])))
+        return
+
+    def test_prepared_input(self):
+        """
+        Test that the MagFields methods return the same outputs for a 
+        PreparedInput as for the X and maginput dictionaries.
+        """
+        ephemeris = IRBEM.PreparedInput(self.X_array, self.maginput_array)
+        self.assertFalse(hasattr(ephemeris, '__dict__'))
+        self.assertEqual(len(ephemeris), 3)
+
+        np.testing.assert_allclose(
+            self.model.make_lstar(ephemeris, ephemeris)['Lstar'], 
+            self.model.make_lstar(self.X_array, self.maginput_array)['Lstar'])
+        np.testing.assert_allclose(
+            self.model.get_field_multi(ephemeris, ephemeris)['Bl'], 
+            self.model.get_field_multi(self.X_array, self.maginput_array)['Bl'])
+        np.testing.assert_allclose(
+            self.model.find_foot_point(ephemeris, ephemeris, 100, 0)['XFOOT'], 
+            self.model.find_foot_point(self.X_array, self.maginput_array, 100, 0)['XFOOT'])
+
+        # A single time and location runs the scalar methods.
+        single = IRBEM.PreparedInput(self.X, self.maginput)
+        self.assertEqual(self.model.find_mirror_point(single, single, 90), 
+                         self.model.find_mirror_point(self.X, self.maginput, 90))
+        # The single point only methods do not drop the other points.
+        with self.assertRaises(ValueError):
+            self.model.drift_shell(ephemeris, ephemeris)
+        with self.assertRaises(ValueError):
+            self.model.get_mlt(ephemeris)
+        return
+
+    def test_prepared_input_sort_by_time(self):
+        """
+        Test that the outputs for a time sorted PreparedInput match the
+        unsorted ones once restore_order() is applied.
+        """
+        X = dict(self.X_array)
+        X['dateTime'] = [datetime.datetime(2015, 2, 2, 6), datetime.datetime(2015, 2, 1, 6),
+                         datetime.datetime(2015, 2, 2, 5)]
+        maginput = {'Kp':[40, 20, 30]}
+        ephemeris = IRBEM.PreparedInput(X, maginput, sort_by_time=True)
+        np.testing.assert_array_equal(ephemeris.idoy, [32, 33, 33])
+        np.testing.assert_array_equal(ephemeris.ut, [21600, 18000, 21600])
+
+        expected = self.model.get_field_multi(X, maginput)
+        output = ephemeris.restore_order(
+            self.model.get_field_multi(ephemeris, ephemeris))
+        for key in expected:
+            np.testing.assert_array_equal(output[key], expected[key])
+
+        unsorted = IRBEM.PreparedInput(X, maginput)
+        self.assertIs(unsorted.restore_order(expected), expected)
+        return
+
+    def test_get_bderivs(self):
+        """
+        Test that get_bderivs returns the get_field_multi field, and that the 
+        divergence computed by compute_grad_curv_curl is small.
+        """
+        bderivs = self.model.get_bderivs(self.X_array, self.maginput_array)
+        field = self.model.get_field_multi(self.X_array, self.maginput_array)
+        np.testing.assert_allclose(bderivs['Bmag'], field['Bl'])
+        self.assertEqual(bderivs['diffB'].shape, (3, 3, 3))
+
+        output = self.model.compute_grad_curv_curl(bderivs)
+        gradB = np.linalg.norm(bderivs['gradBmag'], axis=1)
+        self.assertTrue(np.all(np.abs(output['divB']) < 1e-2*gradB))
+        return
+
+    def test_drift_bounce_period_grid(self):
+        """
+        Test the bounce and drift period grid in a centered dipole against the 
+        dipole approximations Tb = 4*L*Re/v*T(y) and 
+        Td = 2*pi*q*B0*Re**2/(3*L*p*v)*T(y)/D(y), with y = sin(alpha_eq).
+        """
+        model = IRBEM.MagFields(options=[0,0,5,0,5], verbose=False, kext=0)
+        alpha = np.array([80, 60, 30])
+        E = np.array([100, 1000])
+        output = model.drift_bounce_period_grid([3, 4, 6], alpha, E, 
+                                                self.X['dateTime'], self.maginput)
+        self.assertEqual(output['Td'].shape, (3, 3, 2))
+
+        L = np.array(output['Lm'])[:, np.newaxis, np.newaxis]
+        B0 = output['bmin'][:, np.newaxis, np.newaxis]*L**3
+        y = np.sin(np.deg2rad(alpha))[:, np.newaxis]
+        T = 1.3802 - 0.3198*(y + np.sqrt(y))
+        D = (5.520692 - 2.357194*y + 1.279385*y**0.75)/12
+        v = IRBEM.IRBEM.c*IRBEM.IRBEM.beta(E)
+        pv = E*(E + 2*511)/(E + 511)*1E3
+        Re = IRBEM.IRBEM.Re*1E3
+        np.testing.assert_allclose(output['Tb'], 4*L*Re/v*T, rtol=1e-2)
+        np.testing.assert_allclose(output['Td'], 
+                                   2*np.pi*B0*1E-9*Re**2/(3*L*pv)*T/D, rtol=1e-2)
+        return
+
+    def test_coords_rotation_matrices(self):
+        """
+        Test that the Coords rotation matrices rotate vectors like transform(), 
+        also when several vectors share a time, and that they are rejected for 
+        non-cartesian coordinate systems.
+        """
+        coords = IRBEM.Coords()
+        times = np.array(['2015-02-02T06:12:43', '2015-02-02T06:12:43', 
+                          '2017-07-14T00:00:00'], dtype='datetime64[s]')
+        pos = np.array([[6.90274, -1.63624, 1.91669], [1, 2, 3], [-3, 0, 4]])
+        matrices = coords.rotation_matrices(times, 'GEO', 'GSM')
+        self.assertEqual(matrices.shape, (3, 3, 3))
+        np.testing.assert_allclose(coords.rotate(matrices, pos), 
+                                   coords.transform(times, pos, 'GEO', 'GSM'), atol=1e-12)
+        rotated = coords.rotate(matrices, np.stack((pos, 2*pos), axis=1))
+        np.testing.assert_allclose(rotated[:, 1], 2*rotated[:, 0])
+
+        with self.assertRaises(ValueError):
+            coords.rotation_matrices(times, 'GDZ', 'GSM')
+        return
+
+    def test_coords_heliospheric_and_dmag(self):
+        """
+        Test that the heliospheric systems chain through GSE in one transform, 
+        and that the DMAG transform inverts and differs from MAG by the 
+        dipole offset.
+        """
+        coords = IRBEM.Coords()
+        times = np.array(['2015-02-02T06:12:43', '2017-07-14T00:00:00'], 
+                         dtype='datetime64[s]')
+        # The heliospheric systems are in AU: the Earth (the GSE origin) is 
+        # on the HEE x axis at the Sun-Earth distance, near perihelion in 
+        # February and aphelion in July.
+        hee = coords.transform(times, np.zeros((2, 3)), 'GSE', 'HEE')
+        np.testing.assert_allclose(hee, [[0.98535, 0, 0], [1.01654, 0, 0]], 
+                                   atol=1e-5)
+        pos = np.array([[0.98, 0.01, 0.002], [1.01, -0.02, 0.001]])
+        gse = coords.transform(times, pos, 'HEEQ', 'GSE')
+        np.testing.assert_allclose(coords.transform(times, pos, 'HEEQ', 'GSM'), 
+                                   coords.transform(times, gse, 'GSE', 'GSM'))
+        earth = coords.transform(times, np.zeros((2, 3)), 'GSE', 'HEEQ')
+        np.testing.assert_allclose(coords.transform(times, earth, 'HEEQ', 'GSE'), 
+                                   np.zeros((2, 3)), atol=1e-3)
+
+        geo = np.array([[3, 1, -2], [-1, 4, 0.5]])
+        dmag = coords.transform(times, geo, 'geo', 'dmag')
+        np.testing.assert_allclose(coords.transform(times, dmag, 'DMAG', 'GEO'), geo)
+        offset = dmag - coords.transform(times, geo, 'GEO', 'MAG')
+        self.assertTrue(np.all(np.linalg.norm(offset, axis=1) > 0.05))
+        return
+
     def test_get_mlt(self):
         """
         Tests the get_mlt IRBEM function. 
@@ -170,6 +854,8 @@ class TestIRBEM(unittest.TestCase):
         true_MLT = 9.56999052595853
         self.model.get_mlt(input_dict)
         self.assertAlmostEqual(self.model.get_mlt_output, true_MLT)
+        self.assertAlmostEqual(self.model.get_mlt(IRBEM.PreparedInput(input_dict)), 
+                               true_MLT)
         return
     
     def test_drift_shell(self):
@@ -182,6 +868,26 @@ class TestIRBEM(unittest.TestCase):
         L_posit = self._compute_dipole_L_shell(res['POSIT'])
         self.assertLessEqual(np.nanmax(np.abs(L_posit-Lm))/Lm, 1e-2)
 
+    def test_drift_shell_compact(self):
+        """
+        Tests that the compact and batched drift shells hold the same points 
+        as the padded drift_shell output.
+        """
+        res = self.dipol_model.drift_shell(self.X, self.maginput)
+        valid = ~np.isnan(res['POSIT'][:, :, 0])
+        compact = self.dipol_model.drift_shell(self.X, self.maginput, compact=True)
+        np.testing.assert_array_equal(compact['POSIT'], res['POSIT'][valid])
+        np.testing.assert_array_equal(np.diff(compact['offsets']), res['Nposit'])
+
+        X = {key:[value, value] for key, value in self.X.items()}
+        maginput = {key:[value, value] for key, value in self.maginput.items()}
+        multi = self.dipol_model.drift_shell_multi(X, maginput)
+        np.testing.assert_array_equal(multi['Nposit'], [res['Nposit'], res['Nposit']])
+        np.testing.assert_array_equal(multi['POSIT'], 
+            np.concatenate([compact['POSIT'], compact['POSIT']]))
+        np.testing.assert_array_equal(multi['Lm'], [res['Lm'], res['Lm']])
+        return
+
     def test_drift_bounce_orbit(self):
         """
         Tests the drift_bounce_orbit IRBEM function.
@@ -263,5 +969,35 @@ def get_dummy_model_inputs(n=1, datetime_obj=True, maginput=False):
             raise ValueError(f'n must be greater or equal to 1. n = {n}')
     return X, maginput
 
+
+def make_dummy_ts07d_data(path, seed=0):
+    """
+    Helper function to write a TS07D data directory with random tail
+    parameters and two coefficient files, for 06:10 and 06:15 on 2015-02-02.
+    """
+    rng = np.random.default_rng(seed)
+    path = pathlib.Path(path)
+    tail_par = path / 'TAIL_PAR'
+    tail_par.mkdir(parents=True)
+    names = [f'tailamebhr{i}.par' for i in range(1, 6)]
+    names += [f'tailamhr_{parity}_{i}{k}.par' for parity in 'oe'
+              for i in range(1, 6) for k in range(1, 5)]
+    for name in names:
+        values = rng.uniform(-1, 1, 80)
+        (tail_par / name).write_text(''.join(f'{v:17.10G}\n' for v in values))
+
+    coeffs = path / 'Coeffs' / '2015_033'
+    coeffs.mkdir(parents=True)
+    for minute in (10, 15):
+        lines = [f'{v:15.6G}' for v in rng.uniform(-5, 5, 101)]
+        lines += [f'{label:7s}{value:15.6G}' for label, value in
+                  (('Q', 0.5), ('B_RMS', 1.2))]
+        lines += [f'{label:7s}{value:15d}' for label, value in
+                  (('M_INX', 1), ('N_INX', 2))]
+        lines += [f'{label:7s}{value:15.6G}' for label, value in
+                  (('PDYN', 2.1), ('TILT', 10.3))]
+        (coeffs / f'2015_033_06_{minute}.par').write_text('\n'.join(lines) + '\n')
+    return
+
 if __name__ == '__main__':
     unittest.main(verbosity=2, exit=False)
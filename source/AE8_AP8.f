@@ -101,11 +101,16 @@ c Declare output variables
       REAL*8     flux(ntime_max,nene_max)
 C
       COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
       DATA  xSUN /1.d0,0.d0,0.d0/
 C
       Ilflag=0
@@ -150,6 +155,15 @@ c
 c
       idoy_dip=0
       UT_dip=0.d0
+c     The L computation is shared between threads in an OpenMP build,
+c     the flux interpolation below stays serial
+!$OMP PARALLEL COPYIN(/magmod/)
+!$OMP&  PRIVATE(isat,alti,lati,longi,xGEO,psi)
+!$    Ilflag=0
+!$    CALL INITIZE
+!$    if (kint .eq. 2) CALL JensenANDCain1960
+!$    if (kint .eq. 3) CALL GSFC1266
+!$OMP DO SCHEDULE(STATIC)
       DO isat = 1,ntime
          ! need to reinitialize sun for GEI to GEO coordinate transforms
          ! INIT_GSM: compute sun among other things
@@ -169,6 +183,8 @@ C           BBo(isat)=BLOCAL(isat)/BMIN(isat)  ! removed to use McIlwain Gmagmo
          BBo(isat)=BLOCAL(isat)/(31165.3/Lm(isat)**3)  ! use McIlwain Gmagmo for B0 calc.
 !        write(6,'(I10,3f12.5)')isat,Lm(isat),BLOCAL(isat),BMIN(isat)
       enddo
+!$OMP END DO
+!$OMP END PARALLEL
       call get_AE8_AP8_flux(ntime,whichm,whatf,nene,
      &                             energy,BBo,Lm,flux)
         end
@@ -239,9 +255,13 @@ c  minimum and maximum Lshell to calculate electron fluxes
       INTEGER*4 IHEADPMIN(8),IHEADPMAX(8),IHEADEMIN(8),IHEADEMAX(8)
 c
       COMMON /PROMIN/ IHEADPMIN, MAPPMIN
+!$OMP THREADPRIVATE(/PROMIN/)
       COMMON /PROMAX/ IHEADPMAX, MAPPMAX
+!$OMP THREADPRIVATE(/PROMAX/)
       COMMON /ELEMIN/ IHEADEMIN, MAPEMIN
+!$OMP THREADPRIVATE(/ELEMIN/)
       COMMON /ELEMAX/ IHEADEMAX, MAPEMAX
+!$OMP THREADPRIVATE(/ELEMAX/)
 c
 c  init
       DO i=1,ntmax
@@ -595,6 +615,7 @@ c
       REAL*8    FISTEP,ESCALE,FSCALE
       REAL*8    E0,E1,E2,F0,F1,F2
       COMMON/TRA2/FISTEP
+!$OMP THREADPRIVATE(/TRA2/)
       DATA F1,F2/1.001D0,1.002D0/
 C
       FISTEP=dble(DESCR(7)/DESCR(2))
@@ -720,6 +741,7 @@ C
       REAL*8 DFL,FKB1,FKB2,SL1,SL2,FKBJ1
       REAL*8 FLOGM,FKBM,FKBJ2,FLOG,FKB
       COMMON/TRA2/FISTEP
+!$OMP THREADPRIVATE(/TRA2/)
       FNL=IL
       FNB=IB
       ITIME=0
@@ -879,6 +901,7 @@ C
 !      BLOCK DATA AE8MAX
 
       COMMON /ELEMAX/ IHEADEMAX, MAPEMAX
+!$OMP THREADPRIVATE(/ELEMAX/)
 
       INTEGER*4 IHEADEMAX(8)
       INTEGER*4 MAPEMAX(13548)
@@ -2469,6 +2492,7 @@ C
 !      BLOCK DATA AE8MIN
 
       COMMON /ELEMIN/ IHEADEMIN, MAPEMIN
+!$OMP THREADPRIVATE(/ELEMIN/)
 
       INTEGER*4 IHEADEMIN(8)
       INTEGER*4 MAPEMIN(13168)
@@ -4003,6 +4027,7 @@ C
 !      BLOCK DATA AP8MAX
 
       COMMON /PROMAX/ IHEADPMAX, MAPPMAX
+!$OMP THREADPRIVATE(/PROMAX/)
 
       INTEGER*4 IHEADPMAX(8)
       INTEGER*4 MAPPMAX(16291)
@@ -6438,6 +6463,7 @@ C
 !      BLOCK DATA AP8MIN
 
       COMMON /PROMIN/ IHEADPMIN, MAPPMIN
+!$OMP THREADPRIVATE(/PROMIN/)
 
       INTEGER*4 IHEADPMIN(8)
       INTEGER*4 MAPPMIN(16582)
@@ -88,12 +88,17 @@ c
 	CHARACTER*(500) afrl_crres_path
 C
         COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
 	COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
         COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
         COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
         DATA  xSUN /1.d0,0.d0,0.d0/
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         DO i=1,strlen
 	   afrl_crres_path(i:i)=char(ascii_path(i))
@@ -203,7 +208,9 @@ C
 c
 c       common /crres_model/Ne,Nbb0,Nl,c_Lshell,c_Ec,c_bb0,c_flux
        common /crres_model_int/Ne,Nbb0,Nl
+!$OMP THREADPRIVATE(/crres_model_int/)
        common /crres_model_dbl/c_Lshell,c_Ec,c_bb0,c_flux
+!$OMP THREADPRIVATE(/crres_model_dbl/)
 c       
        data c_Ap15 /5.0D0,7.0D0,10.0D0,15.0D0,20.0D0,25.0D0,55.0D0/
 c
@@ -510,7 +517,9 @@ c
        CHARACTER*(1000) afrl_crres_path_tmp
 C
        common /crres_model_int/Ne,Nbb0,Nl
+!$OMP THREADPRIVATE(/crres_model_int/)
        common /crres_model_dbl/Lshell,Ec,bb0,flux
+!$OMP THREADPRIVATE(/crres_model_dbl/)
 c       
        if (imod .EQ. 1) then
           Ne=22
@@ -796,7 +805,9 @@ c
        REAL*8 Lshell(91)
 c
        common /crres_model_int/Ne,Nbb0,Nl
+!$OMP THREADPRIVATE(/crres_model_int/)
        common /crres_model_dbl/Lshell,Ec,bb0,flux
+!$OMP THREADPRIVATE(/crres_model_dbl/)
 c       common /crres_model/Ne,Nbb0,Nl,Lshell,Ec,bb0,flux
 c       
        data tmp_bb0 /1.000D0,1.004D0,1.020D0,1.046D0,1.085D0,1.140D0,
@@ -851,7 +862,9 @@ c
 c
 c       common /crres_model/Ne,Nbb0,Nl,Lshell,Ec,bb0,flux
        common /crres_model_int/Ne,Nbb0,Nl
+!$OMP THREADPRIVATE(/crres_model_int/)
        common /crres_model_dbl/Lshell,Ec,bb0,flux
+!$OMP THREADPRIVATE(/crres_model_dbl/)
 c       
        data tmp_bb0 /1.000D0,1.004D0,1.020D0,1.046D0,1.085D0,1.140D0,
      >           1.200D0,1.300D0,1.400D0,1.520D0,1.690D0,1.880D0,
@@ -73,6 +73,7 @@
       INTEGER*4 a2000_iyear,a2000_imonth,a2000_iday,ifail
 *
       COMMON /a2000_time/a2000_ut,a2000_iyear,a2000_imonth,a2000_iday
+!$OMP THREADPRIVATE(/a2000_time/)
 *
       ut=a2000_ut
       iy=a2000_iyear
@@ -218,7 +219,9 @@ C
 *       COMMON BLOCK /ddd/).                                  .
 ***************************************************************
       COMMON/TRAN/g2gsm(3,3)
+!$OMP THREADPRIVATE(/TRAN/)
       common /ddd/ sind,cosd
+!$OMP THREADPRIVATE(/ddd/)
       dimension gauss(3)         
       Ihour=int(ut)
       dmin=(ut-ihour)*60.
@@ -372,11 +375,17 @@ C
 ******************************************************************************
       COMMON/TK/B1(3),B2(3),B1A(3),B1R(3),B2A(3),B2R(3),
      *BA(3),DB(3),AB,B(3)
+!$OMP THREADPRIVATE(/TK/)
       COMMON/BEGFC/B1CF(3),B1CFD(3),B1CFR(3),B1D(3),B1RC(3)
+!$OMP THREADPRIVATE(/BEGFC/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/IMFd/Bimf(3),b3(3)
+!$OMP THREADPRIVATE(/IMFd/)
       common/fac12/ami1,ami2,tm1,tm2
+!$OMP THREADPRIVATE(/fac12/)
       common/bfac12/bfac1(3),bfac2(3)
+!$OMP THREADPRIVATE(/bfac12/)
       DIMENSION X0(3), FF(3), bm(3), par(10), bdd(7,3)
 
       psi=par(1)
@@ -449,18 +458,31 @@ C
 ***************************************************************************
       COMMON/TK/B1(3),B2(3),B1A(3),B1R(3),B2A(3),B2R(3),                
      *BA(3),DB(3),AB,B(3)
+!$OMP THREADPRIVATE(/TK/)
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/COR1/AL,BE,SQ,PQ,QA                                        
+!$OMP THREADPRIVATE(/COR1/)
       COMMON/COR2/CFI,SFI                                               
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/COR3/R,CT,ST                                               
+!$OMP THREADPRIVATE(/COR3/)
       COMMON/GN/V2(3)                                                   
+!$OMP THREADPRIVATE(/GN/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/IMFd/Bimf(3),b3(3)
+!$OMP THREADPRIVATE(/IMFd/)
       COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,bkc
+!$OMP THREADPRIVATE(/T21/)
       COMMON/BEGF/UFCF(3)
+!$OMP THREADPRIVATE(/BEGF/)
       COMMON/BEGFC/B1CF(3),B1CFD(3),B1CFR(3),B1D(3),B1RC(3)
+!$OMP THREADPRIVATE(/BEGFC/)
       common/fac12/ami1,ami2,tm1,tm2
+!$OMP THREADPRIVATE(/fac12/)
       common/bfac12/bfac1(3),bfac2(3)
+!$OMP THREADPRIVATE(/bfac12/)
       DIMENSION UF(3),FF(3),V1(3),V3(3),                                
      *UZ(3,3),B1IJ(3,3),B2AA(3,3),ZU(3,3)                               
      *,EZ(3,3),EA(3,3),V4(3),V5(3)                                      
@@ -599,13 +621,20 @@ C
 * Written by I. Alexeev. 						    *
 *****************************************************************************
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/AA/BM,ZN,HN,ON
      *,CP,V7
+!$OMP THREADPRIVATE(/AA/)
       COMMON/T1/A1(12)
+!$OMP THREADPRIVATE(/T1/)
       COMMON/A/Y(3),F(5),V(3),U(3),YF(3)
+!$OMP THREADPRIVATE(/A/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,bkc
+!$OMP THREADPRIVATE(/T21/)
       common/fac12/ami1,ami2,tm1,tm2
+!$OMP THREADPRIVATE(/fac12/)
       dimension d1(12)
       DATA D1/0.64972264,0.21646207,
      +0.043429128,-0.000846358,-0.004917225,-0.002224403,0.94028094,
@@ -673,6 +702,7 @@ C******************************************************************
 ****************************************************************************
       dimension x(3),b(3)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       x1=x(1)
       x2=x(2)
       x3=x(3)
@@ -701,8 +731,11 @@ C******************************************************************
 * Written by I. Alexeev 					      *
 ***********************************************************************
       COMMON/COR2/CFI,SFI
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       DIMENSION P(3)
       RR=R*R
       T=Bdp/R/RR
@@ -734,6 +767,7 @@ C******************************************************************
 * Written by I. Alexeev 					      	  *
 ***************************************************************************
       COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,bkc
+!$OMP THREADPRIVATE(/T21/)
       RK =RKM
       RK3 = RK*RK*RK
       T = RK/R0/2
@@ -758,9 +792,13 @@ C    Written by Igor I. Alexeev 				     *
 C*********************************************************************
 c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD,bd0
+!$OMP THREADPRIVATE(/T2/)
        COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,BKC
+!$OMP THREADPRIVATE(/T21/)
       COMMON /COR2/CFI,SFI
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       DIMENSION P(3),PD(3),UFR(3)
       T=BD1*BKA/R/R/R
       P(1)=2.*T*(CPSI*CFI*ST-SPSI*CT)
@@ -803,7 +841,9 @@ c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
 * Written by I. Alexeev 					      *    
 ***********************************************************************
       COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,bkc
+!$OMP THREADPRIVATE(/T21/)
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       DIMENSION P(3),PD(3)
 
 ***Calculation of the Magnetic Fields of Geodipole and Ring Current 
@@ -832,14 +872,22 @@ c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
 * Written by I. Alexeev 				       *
 ****************************************************************
       COMMON /COR2/CFI,SFI	
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/T1/A1(12)
+!$OMP THREADPRIVATE(/T1/)
       COMMON/AA/BM,ZN,HN,ON
      *,CP,V7
+!$OMP THREADPRIVATE(/AA/)
       COMMON/begf/UFCF(3)
+!$OMP THREADPRIVATE(/begf/)
       COMMON/T21/BD1,R0,RKM,BK1,BKA,BKB,bkc
+!$OMP THREADPRIVATE(/T21/)
       DIMENSION UF(3),VV(3,3),ufr(3)
       DIMENSION EL(7),EL1(7),EL2(7)
       EL(1)=1.
@@ -909,12 +957,18 @@ c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
 * Written by I. Alexeev 					 *     
 ******************************************************************
       COMMON/S2/ CF0(5),CF1(5),CF2(5),CF3(5),CF4(5)
+!$OMP THREADPRIVATE(/S2/)
       REAL L,L0
       COMMON/T3/ L(6,5),L0(5)
+!$OMP THREADPRIVATE(/T3/)
       COMMON /COR1/AL,BE,SQ,PQ,QA
+!$OMP THREADPRIVATE(/COR1/)
       COMMON /COR2/CFI,SFI
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       DIMENSION P(3),BB(3,3)
       A2=AL*AL
       B2=BE*BE
@@ -970,10 +1024,14 @@ C BFACP1=BFACP0*(1-CTM).
 C Written by I. Alexeev
 C*************************************************************
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       COMMON/COR4/CTE,STE,CFIE,SFIE
+!$OMP THREADPRIVATE(/COR4/)
       COMMON/TFAC/STM,CTM,BFAC0,BFAC1,TETAM,AJ0
+!$OMP THREADPRIVATE(/TFAC/)
 c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD,bd0
+!$OMP THREADPRIVATE(/T2/)
        DIMENSION P(3)
 
         U= TETAM*PI/180.
@@ -1033,12 +1091,18 @@ C***************************************************
 ***************************************************************
       REAL L,L0
       COMMON /COR1/AL,BE,SQ,PQ,QA
+!$OMP THREADPRIVATE(/COR1/)
       COMMON /COR2/CFI,SFI
+!$OMP THREADPRIVATE(/COR2/)
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/T3/ L(6,5),L0(5)
+!$OMP THREADPRIVATE(/T3/)
       COMMON/S1/CB(6,5),CB2(6,5),
      +CD(6,5),CB3(6,5),CD2(6,5),CD3(6,5)
+!$OMP THREADPRIVATE(/S1/)
       DIMENSION P(3),BB(3,3),U(6,5),DU(6,5)
 
       if (sbt.eq.1.)then 
@@ -1165,7 +1229,9 @@ C
 C
       SUBROUTINE PRIS(UF,VV)
       COMMON /COR1/AL,BE,SQ,PQ,QA
+!$OMP THREADPRIVATE(/COR1/)
       COMMON /COR2/CFI,SFI
+!$OMP THREADPRIVATE(/COR2/)
       DIMENSION UF(3,3),VV(3,3)
       UF(1,1)=-AL/SQ
       UF(1,2)=BE/SQ
@@ -1188,12 +1254,18 @@ C
       BLOCK DATA
       REAL L,L0
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       COMMON/T3/L(6,5),L0(5)
+!$OMP THREADPRIVATE(/T3/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/S2/ CF0(5),CF1(5),CF2(5),CF3(5),CF4(5)
+!$OMP THREADPRIVATE(/S2/)
       COMMON/S5/CI0(9),CI1(9)
+!$OMP THREADPRIVATE(/S5/)
       COMMON/AA/BM,ZN,HN,ON
      *,CP,V7
+!$OMP THREADPRIVATE(/AA/)
       DATA
      *L0/3.83170597,7.01558667,10.17346814,13.3236919,16.47063005/,
      *L/1.84118390,4.2011889412,6.4156163752,8.5778364889,10.711433969,
@@ -1221,13 +1293,19 @@ C
 * Written by I. Alexeev 					 *     
       REAL L,L0
       COMMON/T3/L(6,5),L0(5)
+!$OMP THREADPRIVATE(/T3/)
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       COMMON/S1/ CB(6,5),CB2(6,5),
      *CD(6,5),CB3(6,5),CD2(6,5),
      +CD3(6,5)
+!$OMP THREADPRIVATE(/S1/)
       COMMON/S2/ CF0(5),CF1(5),CF2(5),CF3(5),CF4(5)
+!$OMP THREADPRIVATE(/S2/)
       COMMON/S5/CI0(9),CI1(9)
+!$OMP THREADPRIVATE(/S5/)
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       DIMENSION CF00(5),CF01(5),
      *cb0(6,5),cd0(6,5)
         DATA                      CB0/
@@ -1322,6 +1400,7 @@ C
       SUBROUTINE BESM(M,X,V,DV)
 * Written by I. Alexeev 					 *     
       COMMON/S5/CI0(9),CI1(9)
+!$OMP THREADPRIVATE(/S5/)
       IF(X.GT.3.75)GO TO 5
       XA=-X
       IF(XA-174.673)50,50,51
@@ -1870,12 +1949,18 @@ c      B2=0 in this version of the paraboloid model
 * Written by V. Kalegaev         					 *     
 ********************************************************************
       COMMON/COR3/R,CT,ST
+!$OMP THREADPRIVATE(/COR3/)
       COMMON/COR4/CTE,STE,CFIE,SFIE
+!$OMP THREADPRIVATE(/COR4/)
       COMMON/TFAC/STM,CTM,BFAC0,BFAC1,TETAM,AJ0
+!$OMP THREADPRIVATE(/TFAC/)
 c      COMMON/T2/PI,R1,R2,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,B0,BD,bd0
+!$OMP THREADPRIVATE(/T2/)
        COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       common/fac12/ami1,ami2,tm1,tm2
+!$OMP THREADPRIVATE(/fac12/)
       DIMENSION x(3),B2(3),xsm(3),Bsm(3),xr(3),Br(3),sm2gsm(3,3)
      *,zu(3,3),Bsm1(3),b1(3),Br1(3)
       do i=1,3
@@ -1959,6 +2044,7 @@ C
 * Written by V. Kalegaev         					 *     
 ****************************************************************
       COMMON/T2/PI,R1,BETA0,AL0,C0,E5,AL1,BT,CPSI,SPSI,PSI,Z0,b0,bd,bd0
+!$OMP THREADPRIVATE(/T2/)
       DIMENSION SM2GSM(3,3)
       SM2GSM(1,1)=CPSI
       SM2GSM(1,2)=0.
@@ -1978,6 +2064,7 @@ C
 * Written by V. Kalegaev         					 *     
 *****************************************************************
       COMMON/SM/SSCP,SSP,simf,smd,ssd,ssr,smr,sbt,ss1,ss2
+!$OMP THREADPRIVATE(/SM/)
       SSD =x1 ! dipole field on/off (1/0)
       SSR =x2 ! RC field on/off (1/0)
       SBT =x3 ! tail current field on/off (1/0)
@@ -2015,6 +2102,7 @@ C
 
         INTEGER*4 IYR,IDAY,IHOUR,MIN,ISEC
       common /ddd/ sind,cosd
+!$OMP THREADPRIVATE(/ddd/)
       DOUBLE PRECISION DJ,FDAY
       DATA RAD/57.295779513/
       IF(IYR.LT.1901.OR.IYR.GT.2099) RETURN
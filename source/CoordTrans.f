@@ -1136,11 +1136,47 @@ c-------------------------------------------------------------------------------
 !
 ! OUTPUT: xOUT -> position in output coordinate system (double array(3))
 !
+! The eccentric dipole system DMAG (sysaxes=15) is converted through GEO,
+! in the same call.
+!
 ! CALLING SEQUENCE: call coord_trans1(sysaxesIN,sysaxesOUT,iyr,idoy,secs,xIN,xOUT)
 !---------------------------------------------------------------------------------------------------
 c
       SUBROUTINE coord_trans1(sysaxesIN,sysaxesOUT,iyr,idoy,
      &   secs,xIN,xOUT)
+c
+      IMPLICIT NONE
+      INCLUDE 'variables.inc'
+c
+      INTEGER*4 sysaxesIN,sysaxesOUT,iyr,idoy
+      INTEGER*4 i
+      REAL*8    secs
+      REAL*8    xIN(3),xOUT(3),xTMP(3)
+
+      if ((sysaxesIN.EQ.15).and.(sysaxesOUT.NE.15)) then
+         call dmag2geo1(iyr,xIN,xTMP)
+         call coord_trans_nodmag1(1,sysaxesOUT,iyr,idoy,secs,xTMP,xOUT)
+      else if ((sysaxesOUT.EQ.15).and.(sysaxesIN.NE.15)) then
+         call coord_trans_nodmag1(sysaxesIN,1,iyr,idoy,secs,xIN,xTMP)
+         if (xTMP(1).EQ.baddata) then
+            do i=1,3
+               xOUT(i)=baddata
+            enddo
+            return
+         endif
+         call geo2dmag1(iyr,xTMP,xOUT)
+      else
+         call coord_trans_nodmag1(sysaxesIN,sysaxesOUT,iyr,idoy,secs,
+     &      xIN,xOUT)
+      endif
+      end
+c
+c---------------------------------------------------------------------------------------------------
+! coord_trans1 for all of the coordinate systems but DMAG (sysaxes=0 to 14)
+!---------------------------------------------------------------------------------------------------
+c
+      SUBROUTINE coord_trans_nodmag1(sysaxesIN,sysaxesOUT,iyr,idoy,
+     &   secs,xIN,xOUT)
 c
       IMPLICIT NONE
 c
@@ -2726,7 +2762,9 @@ C
       REAL*8 xIN(3),xOUT(3),s
 
       ! Loop over the number of points specified, calling
-      !  coord_trans1 each iteration
+      !  coord_trans1 each iteration (shared between threads
+      !  in an OpenMP build)
+!$OMP PARALLEL DO SCHEDULE(STATIC) PRIVATE(i,y,d,s,xIN,xOUT)
       DO i = 1,ntime
          y = iyear(i)
          d = idoy(i)
@@ -2751,6 +2789,7 @@ C
 
 10      continue
       ENDDO
+!$OMP END PARALLEL DO
 
       END
 
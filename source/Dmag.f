@@ -11,6 +11,18 @@ c
         CALL GEO_DMAG(xGEO,xDMAG)
         end
 
+c --------------------------------------------------------------------
+c
+        SUBROUTINE dmag2geo1(iyr,xDMAG,xGEO)
+	    INTEGER*4 iyr
+	    REAL*8    dyear
+	    REAL*8    xGEO(3),xDMAG(3)
+
+	    dyear=iyr+0.5d0
+        CALL INIT_DTD(dyear)
+        CALL DMAG_GEO(xDMAG,xGEO)
+        end
+
 C++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 C
        SUBROUTINE GEO_DMAG(xGEO,xDMAG)
@@ -25,6 +37,7 @@ C
        REAL*8    Bo
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
        xGEO_DEC(1)= xGEO(1) - xc
        xGEO_DEC(2)= xGEO(2) - yc
@@ -39,3 +52,30 @@ C
        RETURN
        END
 C
+C++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+C
+       SUBROUTINE DMAG_GEO(xDMAG,xGEO)
+C
+C      Inverse of GEO_DMAG: rotate back to the GEO axes and move the 
+C      origin from the eccentric dipole center to the Earth's center.
+C
+       IMPLICIT NONE
+C
+       REAL*8    xGEO(3)
+       REAL*8    xDMAG(3)
+       REAL*8    xc,yc,zc                  !Re
+       REAL*8    ct,st,cp,sp
+       REAL*8    Bo
+C
+       COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
+C
+       xGEO(1) =  xDMAG(1)*ct*cp - xDMAG(2)*sp
+     & + xDMAG(3)*st*cp + xc
+       xGEO(2) =  xDMAG(1)*ct*sp + xDMAG(2)*cp
+     & + xDMAG(3)*st*sp + yc
+       xGEO(3) = -xDMAG(1)*st    + xDMAG(3)*ct + zc
+C
+       RETURN
+       END
+C
@@ -75,6 +75,7 @@ c-------------------------------------------------------------------------------
       REAL*8 p_1,c_1
 
       COMMON  /Param_IGE/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_IGE/)
 
       IF (launch_year .EQ. 0) then
          write(6,*)'*****************************'
@@ -411,6 +412,7 @@ c-------------------------------------------------------------------------------
       REAL*8            Emin,Emax
 
       COMMON  /Param_IGE/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_IGE/)
       
       do i=1,Nenergy
          do j=1,11
@@ -728,6 +730,7 @@ c-------------------------------------------------------------------------------
       REAL*8            Emin,Emax
 
       COMMON  /Param_IGE/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_IGE/)
       
       do i=1,Nenergy
          do j=1,11
@@ -937,6 +940,7 @@ c-------------------------------------------------------------------------------
       REAL*8            Emin,Emax
 
       COMMON  /Param_IGE/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_IGE/)
 
       do i=1,Nenergy
          do j=1,11
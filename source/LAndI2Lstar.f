@@ -66,6 +66,7 @@ c
 c
       COMMON/LAndI2LstarCom/Lmax,Imax,Lupper,Iupper,Lm4,A0,A1,A2,A3,A4,
      &Lm5,A50,A51,A52,A53,A54,A55
+!$OMP THREADPRIVATE(/LAndI2LstarCom/)
 c
 c Definition of Loss cone as Lmax=f(Imax) for doy=001
       DATA (Lmax ( 1,I), I= 1, 2100) /
@@ -20582,7 +20583,7 @@ c Compute Bmin at all locations first.
       DO isat = 1,ntime
         if (BMIN(isat) .NE. baddata) then
            do imagin = 1,25
-              maginput_tmp(imagin) = maginput(isat,imagin)
+              maginput_tmp(imagin) = maginput(imagin,isat)
            enddo
            DO IPA=1,Nipa
               options(1)=0
@@ -20593,7 +20594,8 @@ c Compute Bmin at all locations first.
                  CALL find_bm_nalpha(xIN,1,alpha(IPA),BL,
      &                BMIR,xGEO)
                  call make_lstar1(ntime_tmp,kext,options,sysaxesIN,
-     &                iyearsat,idoy,UT,xGEO(1),xGEO(2),xGEO(3),
+     &                iyearsat(isat),idoy(isat),UT(isat),
+     &                xGEO(1),xGEO(2),xGEO(3),
      &                maginput_tmp,Lm_tmp,Lstar_tmp,BLOCAL_tmp,BMIN_tmp,
      &                XJ_tmp,MLT_tmp)
               ELSE
@@ -20706,13 +20708,16 @@ c Declare internal variables
       REAL*8     DeltaT
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 c
 c Declare output variables
       REAL*8     Lstar(ntime_max)
 C
       COMMON/LAndI2LstarCom/Lmax,Imax,Lupper,Iupper,Lm4,A0,A1,A2,A3,A4,
      &Lm5,A50,A51,A52,A53,A54,A55
+!$OMP THREADPRIVATE(/LAndI2LstarCom/)
       COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
       integer*4 int_field_select, ext_field_select
 c
 c     This method to compute L* is only available for IGRF + Olson-Pfitzer quiet
@@ -15,6 +15,7 @@ c	    REAL*8	  Kp
         COMMON /drivers/density,speed,dst_nt,Pdyn_nPa,BxIMF_nt,ByIMF_nt
      &        ,BzIMF_nt,G1_tsy01,G2_tsy01,fkp,G3_tsy01,W1_tsy04,W2_tsy04
      &        ,W3_tsy04,W4_tsy04,W5_tsy04,W6_tsy04,Al
+!$OMP THREADPRIVATE(/drivers/)
 
         CALL GEO_DMAG(xGEO,xDMAG)
 
@@ -244,6 +244,7 @@ C     EXTERNAL MODEL MAGNETIC FIELD (WITH TILTE)
       PARAMETER (MF=29)
       REAL*8 A(MF),RE(3),R(3),X,Y,Z,B(3),BAZIS(3,MF)
       COMMON/COEFOM97/A,NA
+!$OMP THREADPRIVATE(/COEFOM97/)
 C
       DO J=1,3
          R(J)=RE(J)/10.D0 !  TO NORMALIZATION UNITS
@@ -266,6 +267,7 @@ C     ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
       PARAMETER (MF=29,NC=4)
       REAL*8 AA(85),C(4),SN,A(MF),Dst,Pdyn,Kp,IMFz
       COMMON/COEFOM97/A,NA
+!$OMP THREADPRIVATE(/COEFOM97/)
 C Input parameters:
 C Dst (nT), Pdyn (nPa),Kp (numeric),IMFz (nT), SN=sin(tilt of dipole)
 C Kp (as key )=  0,  0+,  1-,   1,  1+,...
@@ -152,7 +152,9 @@ C Local
       REAL*8 Y2, Z2, R2, BX, BY, BZ, CON, EXPR, XB, YEXB, ZEYEXB
       INTEGER*4 ITA(32), ITB(22), ITC(32), I, J, K, II, JJ, KK, IJK
       SAVE TILTL,TT,A,B,E,F,C,D
+!$OMP THREADPRIVATE(TILTL,TT,A,B,E,F,C,D)
       COMMON /dip_ang/TILT
+!$OMP THREADPRIVATE(/dip_ang/)
 
       DATA ITA /2,1,2,1,2,2,1,2,1,2,1,2,1,2,1,2,2,1,2,2,2,1,
      *          2,1,2,1,2,1,2,2,2,1/
@@ -9,6 +9,7 @@ C=======================================================================
         DIMENSION AK(5)
         DIMENSION AJM(0:14),AJMD(0:14)
         COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
 
         AK(1)=TSE(76,K,L)
         AK(2)=TSE(77,K,L)
@@ -74,6 +75,7 @@ C==---------------------------------------------------------------------
         DIMENSION AK(5)
         DIMENSION AJM(0:14),AJMD(0:14)
         COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
 
         AK(1)=TSO(76,K,L)
         AK(2)=TSO(77,K,L)
@@ -139,6 +141,7 @@ C==---------------------------------------------------------------------
         DIMENSION AK(5)
         DIMENSION AJM(0:14),AJMD(0:14)
         COMMON /TSS/ TSS(80,5)
+!$OMP THREADPRIVATE(/TSS/)
 
         AK(1)=TSS(76,K)
         AK(2)=TSS(77,K)
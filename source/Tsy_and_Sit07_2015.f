@@ -33,7 +33,9 @@ c bessj from Jay Albert (in TS07j_2015.f renamed from TS07j.f as we now have a 2
 !      REAL*8 BXTO(5,4),BYTO(5,4),BZTO(5,4),BXTE(5,4),BYTE(5,4),BZTE(5,4)
 
       COMMON /GEOPACK1/ AAA(10),SPS,CPS,BBB(3),PSI,CCC(18)
+!$OMP THREADPRIVATE(/GEOPACK1/)
       COMMON /TS07D_DATA/ M_INX,N_INX,PDYN,TILT,A07(NTOT)
+!$OMP THREADPRIVATE(/TS07D_DATA/)
 
       PSS = PSI * 1.D0 
 
@@ -82,9 +84,13 @@ C
       INTEGER*4 M_INX,N_INX ! NOTE THAT THESE ARE FOR FUTURE USE
 C
       COMMON /TAIL/ D  ! THE COMMON BLOCK FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  SCALING FACTORS FOR BIRKELAND CURRENTS
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /G/ G,TW
+!$OMP THREADPRIVATE(/G/)
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
 C
       DATA A0_A,A0_S0,A0_X0 /34.586D0,1.1960D0,3.4397D0/   !   SHUE ET AL. PARAMETERS
       DATA DSIG /0.005D0/, RH2 /-5.2D0/
@@ -711,6 +717,7 @@ C
       DIMENSION BZASS(5),BZASO(5,4),BZASE(5,4)
 C
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
       DATA RH2,IEPS /-5.2D0,3/
 C
 C  RH0,RH1,RH2, AND IEPS CONTROL THE TILT-RELATED DEFORMATION OF THE TAIL FIELD
@@ -813,6 +820,7 @@ C
       DIMENSION BZ_ASS(5),BZ_ASO(5,4),BZ_ASE(5,4)
 C
       COMMON /G/ G,TW
+!$OMP THREADPRIVATE(/G/)
       DGDX=0.D0
       XL=20.D0
       DXLDX=0.D0
@@ -906,10 +914,14 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TSS/ TSS(80,5)
+!$OMP THREADPRIVATE(/TSS/)
       COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
       COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
 
       COMMON /TAIL/ D0
+!$OMP THREADPRIVATE(/TAIL/)
 
       DIMENSION BXS(5),BXO(5,4),BXE(5,4)
       DIMENSION BYS(5),BYO(5,4),BYE(5,4)
@@ -1002,6 +1014,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TAIL/ D  ! THE COMMON BLOCKS FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
 
 C-----------------------------------------------------------------------------------
 C
@@ -1043,6 +1056,7 @@ C
         DIMENSION AK(5)
 C
         COMMON /TSS/ TSS(80,5)
+!$OMP THREADPRIVATE(/TSS/)
 
 c
          AK(1)=TSS(76,K)
@@ -1153,6 +1167,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TAIL/ D0  ! THE COMMON BLOCKS FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
 
 C-----------------------------------------------------------------------------------
 C
@@ -1247,6 +1262,7 @@ C
         DIMENSION AK(5)
 C
         COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
 
 c
          AK(1)=TSO(76,K,L)
@@ -1361,6 +1377,7 @@ C
         DIMENSION AK(5)
 C
         COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
 
 c
          AK(1)=TSE(76,K,L)
@@ -1579,7 +1596,9 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
       DATA SH11/46488.84663,-15541.95244,-23210.09824,-32625.03856,
      *-109894.4551,-71415.32808,58168.94612,55564.87578,-22890.60626,
@@ -1721,9 +1740,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -1868,7 +1890,9 @@ c
       DIMENSION A(31)
 
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
 
       DATA DR,DT/1.D-6,1.D-6/  !   JUST FOR NUMERICAL DIFFERENTIATION
 
@@ -2185,9 +2209,11 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
 C                                            (JOINT WITH  BIRK_TOT_2015  FOR THE ANTISYMMETRICAL MODE)
 C
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 c
       DATA SH11/ 4956703.683,-26922641.21,-11383659.85,29604361.65,
      *-38919785.97,70230899.72,34993479.24,-90409215.02,30448713.69,
@@ -2320,9 +2346,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -2450,6 +2479,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       DATA HSQR2/0.707106781D0/
 
       IF (M.EQ.1) THEN   !   ROTATION BY 90 DEGS
@@ -2641,6 +2671,7 @@ C  WRITTEN BY: N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       SAVE M,PSI,SPS,CPS
+!$OMP THREADPRIVATE(M,PSI,SPS,CPS)
       DATA M,PSI/0,5.D0/
       IF(M.EQ.1.AND.DABS(PS-PSI).LT.1.D-5) GOTO 1
       SPS=DSIN(PS)
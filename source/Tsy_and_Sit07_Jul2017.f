@@ -65,8 +65,10 @@ C
       PARAMETER (NTOT=101)
 
       COMMON /GEOPACK1/ AAA(10),SPS,CPS,BBB(3),PSI,CCC(18)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 
       COMMON /TS07D_DATA/  M_INX,N_INX,PDYN,TILT,A07(NTOT)
+!$OMP THREADPRIVATE(/TS07D_DATA/)
 
       DIMENSION BXTS(5),BXTO(5,4),BXTE(5,4)
       DIMENSION BYTS(5),BYTO(5,4),BYTE(5,4)
@@ -111,9 +113,13 @@ C
       DIMENSION BZTS(5),BZTO(5,4),BZTE(5,4)
 C
       COMMON /TAIL/ D  ! THE COMMON BLOCK FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  SCALING FACTORS FOR BIRKELAND CURRENTS
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /G/ G,TW
+!$OMP THREADPRIVATE(/G/)
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
 C
       DATA A0_A,A0_S0,A0_X0 /34.586D0,1.1960D0,3.4397D0/   !   SHUE ET AL. PARAMETERS
       DATA DSIG /0.005D0/, RH2 /-5.2D0/
@@ -740,6 +746,7 @@ C
       DIMENSION BZASS(5),BZASO(5,4),BZASE(5,4)
 C
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
       DATA RH2,IEPS /-5.2D0,3/
 C
 C  RH0,RH1,RH2, AND IEPS CONTROL THE TILT-RELATED DEFORMATION OF THE TAIL FIELD
@@ -842,6 +849,7 @@ C
       DIMENSION BZ_ASS(5),BZ_ASO(5,4),BZ_ASE(5,4)
 C
       COMMON /G/ G,TW
+!$OMP THREADPRIVATE(/G/)
       DGDX=0.D0
       XL=20.D0
       DXLDX=0.D0
@@ -936,10 +944,14 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TSS/ TSS(80,5)
+!$OMP THREADPRIVATE(/TSS/)
       COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
       COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
 
       COMMON /TAIL/ D0
+!$OMP THREADPRIVATE(/TAIL/)
 
       DIMENSION BXS(5),BXO(5,4),BXE(5,4)
       DIMENSION BYS(5),BYO(5,4),BYE(5,4)
@@ -1008,6 +1020,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TAIL/ D  ! THE COMMON BLOCKS FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
       DIMENSION AJM(0:5),AJMD(0:5)
 C-----------------------------------------------------------------------------------
 C
@@ -1051,6 +1064,7 @@ C     improvements to the Bessel function evaluation.
       DIMENSION AK(5)
       DIMENSION AJM(0:14),AJMD(0:14)
       COMMON /TSS/ TSS(80,5)
+!$OMP THREADPRIVATE(/TSS/)
       
       AK(1)=TSS(76,K)
       AK(2)=TSS(77,K)
@@ -1121,6 +1135,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /TAIL/ D0  ! THE COMMON BLOCKS FORWARDS TAIL SHEET THICKNESS
+!$OMP THREADPRIVATE(/TAIL/)
       DIMENSION AJM(0:5),AJMD(0:5)
 C-----------------------------------------------------------------------------------
 C
@@ -1212,6 +1227,7 @@ C     improvements to the Bessel function evaluation.
       DIMENSION AK(5)
       DIMENSION AJM(0:14),AJMD(0:14)
       COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
       
       AK(1)=TSO(76,K,L)
       AK(2)=TSO(77,K,L)
@@ -1280,6 +1296,7 @@ C     improvements to the Bessel function evaluation.
       DIMENSION AK(5)
       DIMENSION AJM(0:14),AJMD(0:14)
       COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
       
       AK(1)=TSE(76,K,L)
       AK(2)=TSE(77,K,L)
@@ -1423,7 +1440,9 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
       DATA SH11/46488.84663,-15541.95244,-23210.09824,-32625.03856,
      *-109894.4551,-71415.32808,58168.94612,55564.87578,-22890.60626,
@@ -1565,9 +1584,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -1712,7 +1734,9 @@ c
       DIMENSION A(31)
 
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
 
       DATA DR,DT/1.D-6,1.D-6/  !   JUST FOR NUMERICAL DIFFERENTIATION
 
@@ -2028,9 +2052,11 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
 C                                            (JOINT WITH  BIRK_TOT  FOR THE ANTISYMMETRICAL MODE)
 C
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 c
       DATA SH11/ 4956703.683,-26922641.21,-11383659.85,29604361.65,
      *-38919785.97,70230899.72,34993479.24,-90409215.02,30448713.69,
@@ -2163,9 +2189,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -2293,6 +2322,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       DATA HSQR2/0.707106781D0/
 
       IF (M.EQ.1) THEN   !   ROTATION BY 90 DEGS
@@ -2484,6 +2514,7 @@ C  WRITTEN BY: N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       SAVE M,PSI,SPS,CPS
+!$OMP THREADPRIVATE(M,PSI,SPS,CPS)
       DATA M,PSI/0,5.D0/
       IF(M.EQ.1.AND.DABS(PS-PSI).LT.1.D-5) GOTO 1
       SPS=DSIN(PS)
@@ -83,6 +83,7 @@ c
      *  HYIMF,HZIMF,BBX,BBY,BBZ
 C
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 c
       DATA A /1.00000,2.47341,0.40791,0.30429,-0.10637,-0.89108,3.29350,
      * -0.05413,-0.00696,1.07869,-0.02314,-0.66173,-0.68018,-0.03246,
@@ -157,10 +158,15 @@ C
       DIMENSION A(NTOT)
 C
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D,DELTADY  ! THE COMMON BLOCKS FORWARD NONLINEAR PARAMETERS
+!$OMP THREADPRIVATE(/TAIL/)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /RCPAR/ SC_SY,SC_AS,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
 C
       DATA A0_A,A0_S0,A0_X0 /34.586D0,1.1960D0,3.4397D0/   !   SHUE ET AL. PARAMETERS
       DATA DSIG /0.003D0/, RH0,RH2 /8.0D0,-5.2D0/
@@ -728,6 +734,7 @@ C    WARPING IN Y-Z (DONE BY THE S/R WARPED) AND BENDING IN X-Z (DONE BY THIS SU
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /RH0/ RH0
+!$OMP THREADPRIVATE(/RH0/)
       DATA RH2,IEPS /-5.2D0,3/
 C
 C  RH0,RH1,RH2, AND IEPS CONTROL THE TILT-RELATED DEFORMATION OF THE TAIL FIELD
@@ -798,6 +805,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       DGDX=0.D0
       XL=20.D0
       DXLDX=0.D0
@@ -871,6 +879,7 @@ C
       DIMENSION A1(60),A2(60)  !   TAIL SHIELDING FIELD PARAMETERS FOR THE MODES #1 & #2
 
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D0,DELTADY
+!$OMP THREADPRIVATE(/TAIL/)
 C
       DATA DELTADX1,ALPHA1,XSHIFT1 /1.D0,1.1D0,6.D0/
       DATA DELTADX2,ALPHA2,XSHIFT2 /0.D0,.25D0,4.D0/
@@ -1114,7 +1123,9 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM S/R EXTALL
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROLLING THE DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
       DATA SH11/46488.84663D0,-15541.95244D0,-23210.09824D0,
      *-32625.03856D0,-109894.4551D0,-71415.32808D0,58168.94612D0,
@@ -1265,9 +1276,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -1418,7 +1432,9 @@ c
       DIMENSION A(31)
 
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
 
       DATA DR,DT/1.D-6,1.D-6/  !   JUST FOR NUMERICAL DIFFERENTIATION
 
@@ -1738,6 +1754,7 @@ C
         IMPLICIT REAL*8 (A-H,O-Z)
         DIMENSION C_SY(86),C_PR(86)
         COMMON /RCPAR/ SC_SY,SC_PR,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
 C
         DATA C_SY/-957.2534900,-817.5450246,583.2991249,758.8568270,     !   CORRECTED VALUES (AS OF MAY 2006)
      *13.17029064,68.94173502,-15.29764089,-53.43151590,27.34311724,
@@ -2606,6 +2623,7 @@ C    WRITTEN BY: N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       SAVE M,PSI,SPS,CPS
+!$OMP THREADPRIVATE(M,PSI,SPS,CPS)
       DATA M,PSI/0,5.D0/
       IF(M.EQ.1.AND.DABS(PS-PSI).LT.1.D-5) GOTO 1   !   THIS IS TO AVOID MULTIPLE CALCULATIONS
       SPS=DSIN(PS)                                  !   OF SIN(PS) AND COS(PS), IF THE ANGLE PS
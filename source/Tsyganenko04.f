@@ -82,6 +82,7 @@ c
      *  HYIMF,HZIMF,BBX,BBY,BBZ
 C
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 c
       DATA A/1.00000,5.44118,0.891995,9.09684,0.00000,
      * -7.18972,12.2700,
@@ -163,10 +164,15 @@ C
       DIMENSION A(NTOT)
 C
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D,DELTADY  ! THE COMMON BLOCKS FORWARD NONLINEAR PARAMETERS
+!$OMP THREADPRIVATE(/TAIL/)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /RCPAR/ SC_SY,SC_AS,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       COMMON /RH0_tsyg04/ RH0
+!$OMP THREADPRIVATE(/RH0_tsyg04/)
 C
 C
       DATA A0_A,A0_S0,A0_X0 /34.586D0,1.1960D0,3.4397D0/   !   SHUE ET AL. PARAMETERS
@@ -733,6 +739,7 @@ C    WARPING IN Y-Z (DONE BY THE S/R WARPED_04) AND BENDING IN X-Z (DONE BY THIS
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /RH0_tsyg04/ RH0
+!$OMP THREADPRIVATE(/RH0_tsyg04/)
       DATA RH2,IEPS /-5.2D0,3/
 C
 C  RH0,RH1,RH2, AND IEPS CONTROL THE TILT-RELATED DEFORMATION OF THE TAIL FIELD
@@ -807,6 +814,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       DGDX=0.D0
       XL=20.D0
       DXLDX=0.D0
@@ -880,6 +888,7 @@ C
       DIMENSION A1(60),A2(60)  !   TAIL SHIELDING FIELD PARAMETERS FOR THE MODES #1 & #2
 
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D0,DELTADY  ! ATTENTION:  HERE D0 & DELTADY ARE INCLUDED IN /TAIL/
+!$OMP THREADPRIVATE(/TAIL/)
 C                                                                  AND EXCLUDED FROM DATA
       DATA DELTADX1,ALPHA1,XSHIFT1
      *  /1.D0,1.1D0,6.D0/
@@ -1142,7 +1151,9 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
       DATA SH11/46488.84663D0,-15541.95244D0,-23210.09824D0,
      *-32625.03856D0,
@@ -1345,9 +1356,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -1515,7 +1529,9 @@ c
       DIMENSION A(31)
 
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
 
       DATA DR,DT/1.D-6,1.D-6/  !   JUST FOR NUMERICAL DIFFERENTIATION
 
@@ -1837,6 +1853,7 @@ C
         IMPLICIT REAL*8 (A-H,O-Z)
         DIMENSION C_SY(86),C_PR(86)
         COMMON /RCPAR/ SC_SY,SC_PR,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
 C
         DATA C_SY/-957.2534900,-817.5450246,583.2991249,
      * 758.8568270,
@@ -56,8 +56,12 @@ C Local
       REAL*8 BY1, BXSM
       INTEGER*4 I, IP
       SAVE IP,PA,C1,RRC2,DSTR,XN,RH,X1,DY,B0,B1,XN21,XN2,XNR,XN22,ADLN
+      SAVE B2
+!$OMP THREADPRIVATE(IP,PA,C1,RRC2,DSTR,XN,RH,X1,DY,B0,B1,B2,XN21,
+!$OMP&  XN2,XNR,XN22,ADLN)
 C
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 C    &-.1058,-3.221,-.00114,-.02166,-30.43,.04049,.05464,.008884,42.,
 C
 C errata 1.29.90 D.P. Stern
@@ -53,8 +53,10 @@ C Local
       REAL*8 YZ, XSM, ZSM, RR, RR2, ZN, BRSM, BZSM, BY1, BXSM
       INTEGER*4 I, IP
       SAVE IP,PA,C1,RRC2,DSTR,XN,RH,X1,DY,B0,B1,XN21
+!$OMP THREADPRIVATE(IP,PA,C1,RRC2,DSTR,XN,RH,X1,DY,B0,B1,XN21)
 C
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 C    &12.72,-.00867,-.001953,-.3437,-.002903,-.000999,18.41,-270.3,
 C
 C errata 1.29.90 D.P. Stern
@@ -67,6 +67,7 @@ C
 c-mk-c       DOUBLE PRECISION F,DER
        real*8 F,DER,tilt
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
         DATA PARAM/-116.53,-10719.,42.375,59.753,-11363.,1.7844,30.268,
      * -0.35372E-01,-0.66832E-01,0.16456E-01,-1.3024,0.16529E-02,
      * 0.20293E-02,20.289,-0.25203E-01,224.91,-9234.8,22.788,7.8813,
@@ -96,7 +97,9 @@ c-mk-c       DOUBLE PRECISION F,DER
      * 12.714,7.6777,0.57138,2.9633,9.3909,9.7263,11.123,21.558,0.01,
      * 0.0,4.4518,4.0,20.0/
 
+        SAVE A
         DATA IOP/10/
+!$OMP THREADPRIVATE(IOP,A)
 C
       ps=tilt*4.D0*ATAN(1.D0)/180.d0
 c
@@ -210,6 +213,24 @@ c    current in X- and Y- direction
 C
       DATA DXL/20.D0/
 C
+C   The quantities set up for ID=1 are kept for the next calls, by
+C   each OpenMP thread
+!$OMP THREADPRIVATE(A6H,A9T,ADR,ADRT,ADRT2,ADSL,AK1,AK10,AK11,AK12,AK13,
+!$OMP&  AK14,AK15,AK16,AK17,AK2,AK3,AK4,AK5,AK6,AK610,AK7,AK711,AK8,
+!$OMP&  AK812,AK9,AK913,AT,ATT,BRRZ1,BRRZ2,BXCL,BXT,BYCL,BYT,BZCL,BZT,
+!$OMP&  CPS,D,D0,D2,D2ZSGY,DBLDEL,DBXC1,DBXC2,DBXDP,DBZC1,DBZC2,DBZDP,
+!$OMP&  DD,DDR,DDY,DEL,DELY2,DFA0,DRDYC2,DRDYC3,DSFC,DSQT,DT,DVX,DWCX,
+!$OMP&  DWCY,DWX,DX,DYC,DYC2,DZSX,DZSY,EC,ECZ,ECZ2,ES,ESY,ESZ,ESZY2,
+!$OMP&  ESZZ2,EX,F1,F3,F5,F7,F9,FA0,FACXY,FAQ,FC,FK,FS,FXMN,FXPL,FXYM,
+!$OMP&  FXYP,FY,FYC,FYDY,FYMN,FYPL,FYPR,FZMN,FZPL,G,GAM,GAMH,GSP,GSY4,H,
+!$OMP&  HA02,HLWC2M,HRDXL,HS,HTP,HXLD2M,HXLW2M,I,L,OM,OMS,OMSV,P,Q,RC,
+!$OMP&  RDSQ,RDSQ2,RDX2,RDX2M,RDXL,RDY,RDY2,RDYC2,RO2,ROGSM2,RQC,RQC2,
+!$OMP&  RQD,RQDS,RTR,RTT,S1,SMN,SPL,SPS,SX,SX1,SXA,SXRC,SY1,SY4,SYA,SZ1,
+!$OMP&  SZA,SZRM,SZRP,T,TILT,TLT2,TPS,TR,V,W,W1,W2,W3,W4,W5,W6,WC,WCSM,
+!$OMP&  WCSP,WT,WTFS,X,X2,XDWX,XGHS,XRC,XRC16,XSM,XSM2,XSMX,XSXC,XXD,
+!$OMP&  XYWC,XZR,XZYZ,Y,Y2,Y4,Y410,YDWY,YFY1,YND,YNP,YZR,Z,Z2,ZMN,ZPL,
+!$OMP&  ZR,ZS,ZS1,ZSM)
+C
 C
          IF (ID.NE.1)  GOTO  3
            DO  2  I = 1, 30
@@ -68,6 +68,7 @@ c----------------------------------------------------------------------
      *   A(9),tilt
 c
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
       DATA PDYN0,EPS10 /2.d0,3630.7d0/
 C
       DATA A/1.162d0,22.344d0,18.50d0,2.602d0,6.903d0,5.287d0,0.5790d0,
@@ -529,6 +530,7 @@ C
         DIMENSION A(15),RP(3),RR(3),P(3),R(3)
 C
       SAVE M,RP,RR
+!$OMP THREADPRIVATE(M,RP,RR)
 C
       DATA A/-8.411078731d0,5932254.951d0,-9073284.93d0,-11.68794634d0,
      * 6027598.824d0,-9218378.368d0,-6.508798398d0,-11824.42793d0,
@@ -600,6 +602,7 @@ C
          DIMENSION ARC(48),ATAIL2(48),ATAIL3(48)
          COMMON /WARP/ CPSS,SPSS,DPSRR,RPS,WARP,D,XS,ZS,DXSX,DXSY,DXSZ,
      *   DZSX,DZSY,DZSZ,DZETAS,DDZETADX,DDZETADY,DDZETADZ,ZSWW
+!$OMP THREADPRIVATE(/WARP/)
 C
          DATA ARC/-3.087699646d0,3.516259114d0,18.81380577d0,
      :  -13.95772338d0,-5.497076303d0,0.1712890838d0,2.392629189d0,
@@ -740,6 +743,7 @@ C
         DIMENSION F(2),BETA(2)
         COMMON /WARP/ CPSS,SPSS,DPSRR, XNEXT(3),XS,ZSWARPED,DXSX,DXSY,
      *   DXSZ,DZSX,DZSYWARPED,DZSZ,OTHER(4),ZS  
+!$OMP THREADPRIVATE(/WARP/)
 c!  ZS HERE IS WITHOUT Y-Z WARP
 C
 
@@ -845,6 +849,7 @@ C
          DIMENSION F(4),BETA(4)
          COMMON /WARP/ CPSS,SPSS,DPSRR,XNEXT(3),XS,ZS,DXSX,DXSY,DXSZ,
      *    OTHER(3),DZETAS,DDZETADX,DDZETADY,DDZETADZ,ZSWW
+!$OMP THREADPRIVATE(/WARP/)
 C
          DATA XSHIFT /4.5d0/
 C
@@ -920,6 +925,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 
       COMMON /WARP/ FIRST(3), RPS,WARP,D, OTHER(13)
+!$OMP THREADPRIVATE(/WARP/)
 C
 C      'LONG' VERSION OF THE 1987 TAIL MAGNETIC FIELD MODEL
 C              (N.A.TSYGANENKO, PLANET. SPACE SCI., V.35, P.1347, 1987)
@@ -1149,11 +1155,16 @@ C
       DIMENSION D1(3,26),D2(3,79),XI(4),C1(26),C2(79)
 
          COMMON /COORD11/ XX1(12),YY1(12)
+!$OMP THREADPRIVATE(/COORD11/)
          COMMON /RHDR/ RH,DR
+!$OMP THREADPRIVATE(/RHDR/)
          COMMON /LOOPDIP1/ TILT,XCENTRE(2),RADIUS(2), DIPX,DIPY
+!$OMP THREADPRIVATE(/LOOPDIP1/)
 C
          COMMON /COORD21/ XX2(14),YY2(14),ZZ2(14)
+!$OMP THREADPRIVATE(/COORD21/)
          COMMON /DX1/ DX,SCALEIN,SCALEOUT
+!$OMP THREADPRIVATE(/DX1/)
 C
       DATA C1/-0.911582d-03,-0.376654d-02,-0.727423d-02,-0.270084d-02,
      * -0.123899d-02,-0.154387d-02,-0.340040d-02,-0.191858d-01,
@@ -1476,8 +1487,11 @@ c
          IMPLICIT  REAL * 8  (A - H, O - Z)
 C
          COMMON /COORD11/ XX(12),YY(12)
+!$OMP THREADPRIVATE(/COORD11/)
          COMMON /LOOPDIP1/ TILT,XCENTRE(2),RADIUS(2),  DIPX,DIPY
+!$OMP THREADPRIVATE(/LOOPDIP1/)
          COMMON /RHDR/RH,DR
+!$OMP THREADPRIVATE(/RHDR/)
          DIMENSION XI(4),D(3,26)
 C
            X = XI(1)
@@ -1693,7 +1707,9 @@ c
          IMPLICIT  REAL * 8  (A - H, O - Z)
 C
       COMMON /DX1/ DX,SCALEIN,SCALEOUT
+!$OMP THREADPRIVATE(/DX1/)
       COMMON /COORD21/ XX(14),YY(14),ZZ(14)
+!$OMP THREADPRIVATE(/COORD21/)
 c
          DIMENSION XI(4),D(3,79),CF(5),SF(5)
 C
@@ -2068,6 +2084,7 @@ C    (WITHOUT SHIELDING FIELD)
 C
        IMPLICIT REAL*8 (A-H,O-Z)
        SAVE PSI,CPS,SPS
+!$OMP THREADPRIVATE(PSI,CPS,SPS)
        DATA DELARG/0.030D0/,DELARG1/0.015D0/,PSI/10.D0/
 C
        IF (DABS(PSI-PS).GT.1.D-10) THEN
@@ -2638,6 +2655,7 @@ C
          REAL*8 FUNCTION TKSI(XKSI,XKS0,DXKSI)
          IMPLICIT REAL*8 (A-H,O-Z)
          SAVE M,TDZ3
+!$OMP THREADPRIVATE(M,TDZ3)
          DATA M/0/
 C
          IF (M.EQ.0) THEN
@@ -2684,6 +2702,7 @@ C
       REAL*8 PS,X,Y,Z,BX,BY,BZ,PSI,SPS,CPS,P,U,V,T,Q
       INTEGER*4 M
       SAVE M,PSI,SPS,CPS
+!$OMP THREADPRIVATE(M,PSI,SPS,CPS)
 
       DATA M,PSI/0,5.d0/
       IF(M.EQ.1.AND.ABS(PS-PSI).LT.1.d-5) GOTO 1
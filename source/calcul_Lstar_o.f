@@ -73,11 +73,16 @@ C
        REAL*8     Bo,xc,yc,zc,ct,st,cp,sp
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /calotte/tet
+!$OMP THREADPRIVATE(/calotte/)
        COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
        REAL*8     pi,rad
        common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
 C
        Nder=Nder_def*r_resol
@@ -36,8 +36,10 @@ C
        REAL*8 ct,st,cp,sp
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
        xMAG = ct*cp*(xGEO-xc) + ct*sp*(yGEO-yc) - st*(zGEO-zc)
        yMAG = -  sp*(xGEO-xc) +    cp*(yGEO-yc)
@@ -83,8 +85,10 @@ C
        REAL*8 ct,st,cp,sp
        REAL*8     pi,rad
        common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
        rr = SQRT(xGEO*xGEO+yGEO*yGEO+zGEO*zGEO)
        tt = ACOS(zGEO/rr)
@@ -119,6 +123,7 @@ C
        REAL*8    Bo
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
 C  Centered dipole !
        xc = 0.d0
@@ -84,7 +84,9 @@ c     Declare output variables
       REAL*8     Lm,Lstar
 C     
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
       integer*4 int_field_select, ext_field_select
 C     
 c     initialize outputs
@@ -226,6 +228,7 @@ C
       REAL*8     somme,BrR2
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 
 c variables to deal with leI~0 case
       REAL*8     x1old(3)
@@ -241,9 +244,13 @@ C     Output Variables
       INTEGER*4  Nposit(Nder_def), tet_count
 C     
       COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
       COMMON /calotte/tet
+!$OMP THREADPRIVATE(/calotte/)
       COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
 C     
 C     
 
@@ -110,8 +110,11 @@ C
        real*8     R0,R02 ! R0^2
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
 C
 C
        R02 = R0*R0
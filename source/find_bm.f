@@ -64,8 +64,10 @@ C
        REAL*8     sn2,sn2max
 C
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
        REAL*8     pi,rad
        common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
 C
        Nrebmax = 20*Nreb
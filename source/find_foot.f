@@ -68,6 +68,7 @@ c Declare output variables
         REAL*8     XFOOT(3),BFOOT(3),BFOOTMAG
 C
 	COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
 
@@ -107,6 +108,43 @@ c
         BFOOT(3) = baddata
         BFOOTMAG = baddata
 	END
+c
+c --------------------------------------------------------------------
+c
+      SUBROUTINE find_foot_point_multi(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,stop_alt,hemi_flag,maginput,
+     &  XFOOT,BFOOT,BFOOTMAG)
+C     Call find_foot_point1 many times (ntime, up to ntime = ntime_max)
+c
+      IMPLICIT NONE
+      INCLUDE 'ntime_max.inc'   ! include file created by make, defines ntime_max
+C
+c     declare inputs
+      INTEGER*4    ntime
+      INTEGER*4    kext,options(5)
+      INTEGER*4    sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     stop_alt
+      INTEGER*4  hemi_flag
+      real*8     maginput(25,ntime_max)
+c
+c     Declare output variables
+      REAL*8     XFOOT(3,ntime_max),BFOOT(3,ntime_max)
+      REAL*8     BFOOTMAG(ntime_max)
+C
+c     Declare internal variables
+      integer*4 isat
+
+      do isat = 1,ntime
+         call find_foot_point1(kext,options,sysaxes,iyearsat(isat),
+     &        idoy(isat),UT(isat),xIN1(isat),xIN2(isat),xIN3(isat),
+     &        stop_alt,hemi_flag,maginput(1,isat),XFOOT(1,isat),
+     &        BFOOT(1,isat),BFOOTMAG(isat))
+      enddo
+      end
       
        SUBROUTINE find_foot(
      &     lati,longi,alti,stop_alt,hemi_flag,
@@ -311,3 +349,183 @@ C
        RETURN
        END
 C
+
+       SUBROUTINE find_feet_equator_opt (
+     &     xx0,stop_alt,XFOOTN,BFOOTN,BFOOTMAGN,
+     &     XFOOTS,BFOOTS,BFOOTMAGS,posit)
+C
+c      Traces the field line through xx0 once, from the start point to
+c      the northern and then to the southern foot point with the steps of
+c      find_foot_opt, and locates the magnetic equator on the way as
+c      loc_equator_opt does.
+c
+c      inputs:
+c      REAL*8 xx0(3) - GEO cartesian coordinates
+c      REAL*8 stop_alt - geodetic altitude of the foot points (gdz), km
+c
+c      outputs:
+c      REAL*8 XFOOTN(3),XFOOTS(3) - GDZ position of the northern and
+c             southern foot points (alt, lat, lon)
+c      REAL*8 BFOOTN(3),BFOOTS(3) - Magnetic field at the foot points (nT, GEO)
+c      REAL*8 BFOOTMAGN,BFOOTMAGS - Magnetic field at the foot points (nT)
+c      REAL*8 posit(3) - GEO position of the magnetic equator
+       IMPLICIT NONE
+       INCLUDE 'variables.inc'
+C
+       INTEGER*4  Nreb
+       PARAMETER (Nreb = 50)
+C
+       INTEGER*4  Ifail
+       REAL*8     rr,tt,Lb,alt,lat,lon
+       REAL*8     xx0(3),xx(3),x1(3),x2(3),xmin(3)
+       REAL*8     stop_alt
+       REAL*8     B(3),Bl,B0,B1,B3,Bmin
+       REAL*8     dsreb,dsmin,aa,bb,smin
+       REAL*8     XFOOT(3,2),BFOOT(3,2),BFOOTMAG(2)
+       REAL*8     XFOOTN(3),BFOOTN(3),BFOOTMAGN
+       REAL*8     XFOOTS(3),BFOOTS(3),BFOOTMAGS
+       REAL*8     posit(3)
+
+       INTEGER*4  I,J,K
+C      IFOUND is a dummy loop result variable, NFOUND counts the feet
+       integer*4  IFOUND,NFOUND
+C
+       DO K = 1,2
+         XFOOT(1,K) = baddata
+         XFOOT(2,K) = baddata
+         XFOOT(3,K) = baddata
+         BFOOT(1,K) = baddata
+         BFOOT(2,K) = baddata
+         BFOOT(3,K) = baddata
+         BFOOTMAG(K) = baddata
+       ENDDO
+       posit(1) = baddata
+       posit(2) = baddata
+       posit(3) = baddata
+C
+       CALL GEO_SM(xx0,xx)
+       rr = SQRT(xx(1)*xx(1)+xx(2)*xx(2)+xx(3)*xx(3))
+       tt = ACOS(xx(3)/rr)
+       Lb  = rr/SIN(tt)/SIN(tt)
+C
+       CALL CHAMP(xx0,B,B0,Ifail)
+       IF (Ifail.LT.0) THEN
+          goto 100
+       ENDIF
+
+       call geo_gdz(xx0(1),xx0(2),xx0(3),lat,lon,alt)
+       if (alt.LE.stop_alt) then
+c         no foot points below the starting point, as in find_foot_opt
+          call loc_equator_opt(xx0,Bmin,posit)
+          goto 100
+       endif
+C
+C calcul de la ligne de champ, vers le nord (K=1) puis vers le sud (K=2)
+C
+       Bmin = B0
+       DO I = 1,3
+         xmin(I) = xx0(I)
+       ENDDO
+       NFOUND = 0
+       DO K = 1,2
+         dsreb = Lb/(Nreb*1.d0) ! step size
+         if (dsreb.GT.1) THEN
+          dsreb = 1
+         ENDIF
+         dsmin = dsreb
+         if (K.eq.2) then
+            dsreb = -dsreb ! point dsreb south
+         endif
+         DO I = 1,3
+           x1(I)  = xx0(I)
+         ENDDO
+C
+         Bl = B0 ! reset to starting value
+15       continue ! prepare to do loop
+         IFOUND = 0
+         DO J = 1,500
+           CALL sksyst(dsreb,x1,x2,Bl,Ifail)
+           IF (Ifail.LT.0) THEN
+              goto 30
+           ENDIF
+           IF (Bl.LT.Bmin) THEN
+             xmin(1) = x2(1)
+             xmin(2) = x2(2)
+             xmin(3) = x2(3)
+             Bmin = Bl
+             dsmin = ABS(dsreb)
+           ENDIF
+c
+c test for completion
+           call geo_gdz(x2(1),x2(2),x2(3),
+     &       XFOOT(2,K),XFOOT(3,K),XFOOT(1,K))
+           if (XFOOT(1,K).LE.stop_alt) then
+              IFOUND = 1
+              goto 20 ! done with loop
+           endif
+           x1(1) = x2(1)
+           x1(2) = x2(2)
+           x1(3) = x2(3)
+         ENDDO
+20       CONTINUE
+C
+         if (IFOUND.EQ.1) then
+            ! footpoint is between x1 and x2
+            if (abs(XFOOT(1,K)-stop_alt).le.1.0) then
+               !get B field at x2
+               call champ(x2,BFOOT(1,K),BFOOTMAG(K),Ifail)
+               if (Ifail.LT.0) then
+                  goto 30
+               endif
+               NFOUND = NFOUND+1
+               goto 40
+            else  ! try loop again with smaller step
+               dsreb = dsreb/100.0
+               goto 15
+            endif
+         endif
+30       CONTINUE  ! no foot point in this hemisphere
+         XFOOT(1,K) = baddata
+         XFOOT(2,K) = baddata
+         XFOOT(3,K) = baddata
+         BFOOT(1,K) = baddata
+         BFOOT(2,K) = baddata
+         BFOOT(3,K) = baddata
+         BFOOTMAG(K) = baddata
+40       CONTINUE
+       ENDDO
+C
+C calcul de l'equateur: the minimum of B along the line is only
+C bracketed when both foot points were reached, otherwise it is
+C searched for as in loc_equator_opt
+C
+       IF (NFOUND.LT.2) THEN
+          call loc_equator_opt(xx0,Bmin,posit)
+          goto 100
+       ENDIF
+       CALL sksyst(dsmin,xmin,x1,B3,Ifail)
+       IF (Ifail.LT.0) goto 100
+       CALL sksyst(-dsmin,xmin,x1,B1,Ifail)
+       IF (Ifail.LT.0) goto 100
+       aa = 0.5D0*(B3+B1-2.D0*Bmin)
+       bb = 0.5D0*(B3-B1)
+       smin = 0.D0
+       IF (aa.GT.0.D0) smin = -0.5D0*bb/aa
+       CALL sksyst(smin*dsmin,xmin,posit,Bl,Ifail)
+       IF (Ifail.LT.0) THEN
+          posit(1) = baddata
+          posit(2) = baddata
+          posit(3) = baddata
+       ENDIF
+C
+100    CONTINUE
+       DO I = 1,3
+         XFOOTN(I) = XFOOT(I,1)
+         BFOOTN(I) = BFOOT(I,1)
+         XFOOTS(I) = XFOOT(I,2)
+         BFOOTS(I) = BFOOT(I,2)
+       ENDDO
+       BFOOTMAGN = BFOOTMAG(1)
+       BFOOTMAGS = BFOOTMAG(2)
+       RETURN
+       END
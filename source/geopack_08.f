@@ -83,6 +83,7 @@ C
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK2/ G(105),H(105),REC(105)
+!$OMP THREADPRIVATE(/GEOPACK2/)
 
       DIMENSION A(14),B(14)
 
@@ -211,6 +212,7 @@ C
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK2/ G(105),H(105),REC(105)
+!$OMP THREADPRIVATE(/GEOPACK2/)
 
       DIMENSION A(14),B(14)
 
@@ -316,7 +318,9 @@ C  AUTHOR: N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ AA(10),SPS,CPS,BB(22)
+!$OMP THREADPRIVATE(/GEOPACK1/)
       COMMON /GEOPACK2/ G(105),H(105),REC(105)
+!$OMP THREADPRIVATE(/GEOPACK2/)
 C
       DIPMOM=DSQRT(G(2)**2+G(3)**2+H(3)**2)
 C
@@ -579,11 +583,13 @@ C
       COMMON /GEOPACK1/ ST0,CT0,SL0,CL0,CTCL,STCL,CTSL,STSL,SFI,CFI,
      * SPS,CPS,DS3,CGST,SGST,PSI,A11,A21,A31,A12,A22,A32,A13,A23,A33,
      * E11,E21,E31,E12,E22,E32,E13,E23,E33
+!$OMP THREADPRIVATE(/GEOPACK1/)
 C
 C  THE COMMON BLOCK /GEOPACK1/ CONTAINS ELEMENTS OF THE ROTATION MATRICES AND OTHER
 C   PARAMETERS RELATED TO THE COORDINATE TRANSFORMATIONS PERFORMED BY THIS PACKAGE
 C
       COMMON /GEOPACK2/ G(105),H(105),REC(105)
+!$OMP THREADPRIVATE(/GEOPACK2/)
 C
 C  THE COMMON BLOCK /GEOPACK2/ CONTAINS COEFFICIENTS OF THE IGRF FIELD MODEL, CALCULATED
 C    FOR A GIVEN YEAR AND DAY FROM THEIR STANDARD EPOCH VALUES. THE ARRAY REC CONTAINS
@@ -1275,6 +1281,7 @@ c       IDENTICAL TO THE STANDARD ONE.
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ AAA(25),E11,E21,E31,E12,E22,E32,E13,E23,E33
+!$OMP THREADPRIVATE(/GEOPACK1/)
 C
 C  DIRECT TRANSFORMATION:
 C
@@ -1318,6 +1325,7 @@ C   AUTHOR:  N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ ST0,CT0,SL0,CL0,CTCL,STCL,CTSL,STSL,AB(26)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 
       IF(J.GT.0) THEN
        XMAG=XGEO*CTCL+YGEO*CTSL-ZGEO*ST0
@@ -1355,6 +1363,7 @@ C     AUTHOR:  N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ A(13),CGST,SGST,B(19)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 C
       IF(J.GT.0) THEN
        XGEO=XGEI*CGST+YGEI*SGST
@@ -1398,6 +1407,7 @@ C     AUTHOR:  N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ A(8),SFI,CFI,B(24)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 C
       IF (J.GT.0) THEN
        XSM=XMAG*CFI-YMAG*SFI
@@ -1441,6 +1451,7 @@ C     AUTHOR:  N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ A(10),SPS,CPS,B(22)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 
       IF (J.GT.0) THEN
        XGSW=XSM*CPS+ZSM*SPS
@@ -1481,6 +1492,7 @@ C     AUTHOR:  N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /GEOPACK1/ AA(16),A11,A21,A31,A12,A22,A32,A13,A23,A33,B(9)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 C
       IF (J.GT.0) THEN
        XGSW=A11*XGEO+A12*YGEO+A13*ZGEO
@@ -1600,6 +1612,7 @@ C     EXNAME AND INNAME ARE NAMES OF SUBROUTINES FOR THE EXTERNAL AND INTERNAL
 C     PARTS OF THE TOTAL FIELD, E.G., T96_01 AND IGRF_GSW_08
 C
       COMMON /GEOPACK1/ A(12),DS3,BB(2),PSI,CC(18)
+!$OMP THREADPRIVATE(/GEOPACK1/)
 
       CALL EXNAME (IOPT,PARMOD,PSI,X,Y,Z,BXGSW,BYGSW,BZGSW)
       CALL INNAME (X,Y,Z,HXGSW,HYGSW,HZGSW)
@@ -1643,6 +1656,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION PARMOD(10)
       COMMON /GEOPACK1/ A(12),DS3,B(21)
+!$OMP THREADPRIVATE(/GEOPACK1/)
       EXTERNAL EXNAME,INNAME
 
   1   DS3=-DS/3.D0
@@ -1774,6 +1788,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION XX(LMAX),YY(LMAX),ZZ(LMAX), PARMOD(10)
       COMMON /GEOPACK1/ AA(12),DD,BB(21)
+!$OMP THREADPRIVATE(/GEOPACK1/)
       EXTERNAL EXNAME,INNAME
 C
       L=0
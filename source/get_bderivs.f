@@ -34,6 +34,7 @@ C        diffB(i,j,t) = dB_i/dx_j for point t (t=1 to ntime)
       INCLUDE 'variables.inc'
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
 
 c     declare inputs
       INTEGER*4    ntime,kext,options(5)
@@ -25,6 +25,7 @@ c      if the new B is larger, then in Northern Hemisphere (xHEMI=+1), else (xHE
       INCLUDE 'variables.inc'
 C     
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
 c     declare inputs
       INTEGER*4    kext,options(5)
       INTEGER*4    sysaxes
@@ -64,6 +64,7 @@ c
 	 
 c
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
         CALL SUN2(iyr,idoy,secs, T0,  Lamda0,st,ct,sl,cl,so,co)
         CALL HAE_HEEQ(xHAE,xHEEQ)
@@ -95,6 +96,7 @@ c
 	REAL*8 T0,Lamda0,st,ct,sl,cl,so,co
 c	
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 c
 ! c	xHEEQ(1) =  (ct*co-st*cl*so)*xHAE(1) + (ct*so+st*cl*co)*xHAE(2)	!old
 ! 	xHEEQ(1) =  (co*ct-so*cl*st)*xHAE(1) + (-co*st-so*cl*ct)*xHAE(2)
@@ -154,6 +156,7 @@ c
 	
 c
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
         CALL SUN2(iyr,idoy,secs, T0, Lamda0,st,ct,sl,cl,so,co)
         CALL HEEQ_HAE(xHEEQ,xHAE)
@@ -185,6 +188,7 @@ c
 	REAL*8 T0,Lamda0,st,ct,sl,cl,so,co
 c	
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 c
 	xHAE(1) =  (ct*co-st*cl*so)*xHEEQ(1) + (-st*co-ct*cl*so)*xHEEQ(2)
      &              + so*sl*xHEEQ(3)
@@ -224,6 +228,7 @@ c
 	 
 c
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
         CALL SUN2(iyr,idoy,secs, T0, Lamda0,st,ct,sl,cl,so,co)
         CALL HAE_HEE(xHAE,xHEE)
@@ -255,6 +260,7 @@ c
 	REAL*8 T0,Lamda0,rad,angle,st,ct,sl,cl,so,co
 c	
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 	DATA rad /57.29577951308D0/
 c
         !angle=(Lamda0+180.0D0)/rad
@@ -293,6 +299,7 @@ c
 	REAL*8    T0,Lamda0,st,ct,sl,cl,so,co
 c
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
         CALL SUN2(iyr,idoy,secs, T0, Lamda0,st,ct,sl,cl,so,co)
         CALL HEE_HAE(xHEE,xHAE)
@@ -325,6 +332,7 @@ c
 	REAL*8 pi
 	 
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co        
+!$OMP THREADPRIVATE(/sunMAH/)
 	DATA rad /57.29577951308D0/
 		pi = ACOS(0.0D0)*2.0D0
 		angle=-(Lamda0+180)			!Kellerman
@@ -364,7 +372,9 @@ c
 	 
 c
         COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
         CALL INITIZE
 	do i=1,3
@@ -406,7 +416,9 @@ c
 	 
 c
         COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 C
 	do i=1,3
 	   xHEE(i)=xHEE(i)*1.495985D8
@@ -446,6 +458,7 @@ c
 	
 c	
         COMMON /sunMAH/T0,Lamda0,st,ct,sl,cl,so,co
+!$OMP THREADPRIVATE(/sunMAH/)
 	DATA rad /57.29577951308D0/
 C
 c
@@ -70,6 +70,7 @@ C-----------------------------------------------------------------------
       REAL*8  		XI(3),H(144)
       REAL*8            G(144)
       COMMON/MODEL/	G  
+!$OMP THREADPRIVATE(/MODEL/)
 C
 C-- IS RECORDS ENTRY POINT
 C
@@ -76,6 +76,7 @@ C
        REAL*8    year
        INTEGER*4 year_error_reported ! only report year error once
        save year_error_reported
+!$OMP THREADPRIVATE(year_error_reported)
        DATA year_error_reported/0/ ! initially not reported
 C
        DATA G1900/
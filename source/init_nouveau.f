@@ -36,12 +36,17 @@ C
        REAL*8      Bo,xc,yc,zc,ct,st,cp,sp
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
        COMMON /drivers/density,speed,dst_nt,Pdyn_nPa,BxIMF_nt,ByIMF_nt,
      &        BzIMF_nt,G1_tsy01,G2_tsy01,fkp,G3_tsy01,W1_tsy04,W2_tsy04,
      &         W3_tsy04,W4_tsy04,W5_tsy04,W6_tsy04,Al
+!$OMP THREADPRIVATE(/drivers/)
        COMMON /index/activ
+!$OMP THREADPRIVATE(/index/)
        COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 C
        Ifail=0
        IF(kint.EQ.0)THEN
@@ -339,9 +344,24 @@ C
        REAL*8    thet,phit           !radian
        REAL*8    ct,st,cp,sp
        REAL*8    Bo
+       INTEGER*4 M
+       REAL*8    yearS,dipS(8)
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /dgrf/g,h
+!$OMP THREADPRIVATE(/dgrf/)
+C
+C  Batched callers re-initialise for every point: skip the IGRF set-up
+C  when the epoch is unchanged and /dipigrf/ still holds what this
+C  routine left there (INIT_CD or the kint=2,3 fields overwrite it).
+       SAVE M,yearS,dipS
+!$OMP THREADPRIVATE(M,yearS,dipS)
+       DATA M/0/
+       IF (M.EQ.1 .AND. year.EQ.yearS .AND.
+     &     Bo.EQ.dipS(1) .AND. xc.EQ.dipS(2) .AND. yc.EQ.dipS(3) .AND.
+     &     zc.EQ.dipS(4) .AND. ct.EQ.dipS(5) .AND. st.EQ.dipS(6) .AND.
+     &     cp.EQ.dipS(7) .AND. sp.EQ.dipS(8)) RETURN
 C
        call get_igrf_coeffs(year,g,h,ierr)
 c
@@ -354,6 +374,17 @@ C
        st = SIN(thet)
        cp = COS(phit)
        sp = SIN(phit)
+C
+       M = 1
+       yearS = year
+       dipS(1) = Bo
+       dipS(2) = xc
+       dipS(3) = yc
+       dipS(4) = zc
+       dipS(5) = ct
+       dipS(6) = st
+       dipS(7) = cp
+       dipS(8) = sp
 C
        RETURN
        END
@@ -377,11 +408,28 @@ C
        REAL*8      Bo
        REAL*8      norm
        REAL*8      psi
+       INTEGER*4   M,iyrS,idayS
+       REAL*8      secsS,psiS,dipS(4)
 C
        COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
+C
+C  Same time and same dipole axis as the previous call: /Soleil/ and
+C  /sundip/ are already up to date.
+       SAVE M,iyrS,idayS,secsS,psiS,dipS
+!$OMP THREADPRIVATE(M,iyrS,idayS,secsS,psiS,dipS)
+       DATA M/0/
+       IF (M.EQ.1 .AND. iyr.EQ.iyrS .AND. iday.EQ.idayS .AND.
+     &     secs.EQ.secsS .AND. ct.EQ.dipS(1) .AND. st.EQ.dipS(2) .AND.
+     &     cp.EQ.dipS(3) .AND. sp.EQ.dipS(4)) THEN
+         psi = psiS
+         RETURN
+       ENDIF
 C
        CALL SUN(iyr,iday,secs,gst,Slong,Srasn,Sdec)
 C
@@ -431,6 +479,16 @@ C
        zSDD = zSDD/norm
 C
        psi = ASIN(xD*xS + yD*yS + zD*zS)
+C
+       M = 1
+       iyrS = iyr
+       idayS = iday
+       secsS = secs
+       psiS = psi
+       dipS(1) = ct
+       dipS(2) = st
+       dipS(3) = cp
+       dipS(4) = sp
 C
        RETURN
        END
@@ -450,8 +508,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI =  cgst*xGEO(1) - sgst*xGEO(2)
       yGEI =  sgst*xGEO(1) + cgst*xGEO(2)
@@ -479,8 +539,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI = xS*xGSM(1) + xSD*xGSM(2) + xSSD*xGSM(3)
       yGEI = yS*xGSM(1) + ySD*xGSM(2) + ySSD*xGSM(3)
@@ -505,6 +567,7 @@ C
         REAL*8    xS,yS,zS,cgst,sgst
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
 C
       xGEI(1) =  cgst*xGEO(1) - sgst*xGEO(2)
       xGEI(2) =  sgst*xGEO(1) + cgst*xGEO(2)
@@ -525,6 +588,7 @@ C
         REAL*8    xS,yS,zS,cgst,sgst
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
 C
       xGEO(1) =  cgst*xGEI(1) + sgst*xGEI(2)
       xGEO(2) = -sgst*xGEI(1) + cgst*xGEI(2)
@@ -548,8 +612,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI =  cgst*xGEO(1) - sgst*xGEO(2)
       yGEI =  sgst*xGEO(1) + cgst*xGEO(2)
@@ -577,8 +643,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI = xSDD*xSM(1) + xSD*xSM(2) + xD*xSM(3)
       yGEI = ySDD*xSM(1) + ySD*xSM(2) + yD*xSM(3)
@@ -606,8 +674,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI = xSDD*xSM(1) + xSD*xSM(2) + xD*xSM(3)
       yGEI = ySDD*xSM(1) + ySD*xSM(2) + yD*xSM(3)
@@ -635,8 +705,10 @@ C
         REAL*8    xSD,ySD,zSD,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
 C
       COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
         COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
       xGEI = xS*xGSM(1) + xSD*xGSM(2) + xSSD*xGSM(3)
       yGEI = yS*xGSM(1) + ySD*xGSM(2) + ySSD*xGSM(3)
@@ -662,6 +734,7 @@ C
        REAL*8    Bo
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
        xMAG(1) =  xGEO(1)*ct*cp + xGEO(2)*ct*sp - xGEO(3)*st
        xMAG(2) = -xGEO(1)*sp    + xGEO(2)*cp
@@ -683,6 +756,7 @@ C
        REAL*8    Bo
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C
        xGEO(1) =  xMAG(1)*ct*cp - xMAG(2)*sp + xMAG(3)*st*cp
        xGEO(2) =  xMAG(1)*ct*sp + xMAG(2)*cp + xMAG(3)*st*sp
@@ -706,8 +780,10 @@ C
       REAL*8    aa,bb,y1,y2,y3
 C
        COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
        COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
         aa = -0.3978D0
       bb = 0.9175D0
@@ -742,8 +818,10 @@ C
       REAL*8    aa,bb,y1,y2,y3,det
 C
        COMMON /Soleil/xS,yS,zS,cgst,sgst
+!$OMP THREADPRIVATE(/Soleil/)
        COMMON /sundip/xD,yD,zD,xSD,ySD,zSD
      &      ,xSSD,ySSD,zSSD,xSDD,ySDD,zSDD
+!$OMP THREADPRIVATE(/sundip/)
 C
         aa = -0.3978D0
       bb = 0.9175D0
@@ -781,6 +859,7 @@ C
        REAL*8     x(3)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
        colati = pi/2.d0 - lati*rad
@@ -802,6 +881,7 @@ C
        REAL*8     x(3)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
        SQ = x(1)*x(1) + x(2)*x(2)
@@ -833,6 +913,7 @@ C
        REAL*8     sph(3),x(3)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
        colati = pi/2.d0 - lati*rad
@@ -861,6 +942,7 @@ C
        REAL*8     sph(3),x(3)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
        colati = pi/2.d0 - lati*rad
@@ -898,6 +980,7 @@ C
       REAL*8 t,vl,g,obliq,slp,sind,cosd
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
 
        CALL INITIZE
@@ -1422,7 +1505,9 @@ C
       REAL*8     X,F,F0
 C
       COMMON /MODEL/GH1
+!$OMP THREADPRIVATE(/MODEL/)
       COMMON /dgrf/G,H
+!$OMP THREADPRIVATE(/dgrf/)
 C
       L = 0
       M = 0
@@ -1473,8 +1558,10 @@ C
         REAL*8 ERA,AQUAD,BQUAD
 C
         COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
 C
@@ -1506,8 +1593,10 @@ C
         REAL*8 ERA,AQUAD,BQUAD
 C
         COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
         CALL INITIZE
 C
@@ -1543,8 +1632,10 @@ C
       integer*4 i
 C
       COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
       REAL*8     pi,rad
       common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
       CALL INITIZE
       longi = ATAN2(yy,xx)/rad
@@ -1600,8 +1691,10 @@ C-----------------------------------------------------------------
         IMPLICIT NONE
       REAL*8 ERA,AQUAD,BQUAD,EREQU,ERPOL
             COMMON/GENER/ERA,AQUAD,BQUAD
+!$OMP THREADPRIVATE(/GENER/)
       real*8 rad,pi
       common/rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
       ERA=6371.2D0
 c WGS84 World Geodetic System 84 (GPS)
       EREQU=6378.137D0
@@ -1,7 +1,13 @@
       ! Adapted for IRBEM by A. C. Kellerman, needs to be called on date
-      ! update. TODO: check if we already loaded the current files and
-      ! skip the load if so, as they currently have a cadence of 5
-      ! minutes
+      ! update. The coefficient files have a cadence of 5 minutes, so the
+      ! sets already read are kept in memory, keyed by their 5 minute
+      ! interval, and the files are only read for a new interval.
+      ! If TS07_DATA_PATH holds a Coeffs.bin archive (see
+      ! pack_ts07d_coeffs in the Python wrapper), the sets are read from
+      ! its fixed length records instead of the Coeffs/ text files, and
+      ! the intervals missing from it from their text files. The archive
+      ! is reopened when it is written again, e.g. by pack_ts07d_coeffs
+      ! in the same process.
       ! ifail returns as -1 if the files are not found, resulting in 
       ! bad data returned by each subroutine
       
@@ -27,6 +33,26 @@
       PARAMETER (NTOT=101)
 
       COMMON /TS07D_DATA/ M_INX,N_INX,PDYN,TILT,A07(NTOT)
+!$OMP THREADPRIVATE(/TS07D_DATA/)
+
+c     Coefficient sets in memory: one day of 5 minute intervals, the
+c     slot of an interval being its index modulo NCACHE
+      INTEGER*4 NCACHE,NREC,PUNIT
+      PARAMETER (NCACHE=288,NREC=NTOT+4,PUNIT=17)
+      INTEGER*4 KEY,SLOT,IREC,RECLEN,JULDAY
+      INTEGER*4 cacheKey(NCACHE),cacheM(NCACHE),cacheN(NCACHE)
+      REAL*8 cacheA(NTOT,NCACHE),cachePDYN(NCACHE),cacheTILT(NCACHE)
+      REAL*8 record(NREC),header(NREC)
+      INTEGER*4 packedBase,packedN,packedStat(3),archStat(3)
+      LOGICAL packed,found
+      CHARACTER*80 cacheDir
+
+      SAVE cacheKey,cacheM,cacheN,cacheA,cachePDYN,cacheTILT
+      SAVE packed,packedBase,packedN,packedStat,cacheDir
+      DATA cacheKey/NCACHE*-1/
+      DATA packed/.false./
+      DATA packedStat/3*0/
+      DATA cacheDir/' '/
 
       CALL GETENV('TS07_DATA_PATH', ts07d_env)
       if (LEN_TRIM(ts07d_env).ne.0) then 
@@ -41,6 +67,44 @@
       enddo
       TS7LEN=i
 
+c     A new data directory, or an archive created, replaced or removed
+c     since the last call (inode, size and modification time), invalidates
+c     the sets in memory, and decides whether they come from the packed
+c     archive or the text files
+      filename=TS7DIR(1:TS7LEN)//'/Coeffs.bin'
+      INQUIRE( FILE=filename, EXIST=found )
+      do i=1,3
+        archStat(i)=0
+      enddo
+      if (found) then
+        ierr=stat(filename,statb)
+        archStat(1)=statb(2)
+        archStat(2)=statb(8)
+        archStat(3)=statb(10)
+      endif
+      if (TS7DIR .ne. cacheDir .or. (found .neqv. packed) .or.
+     +  archStat(1).ne.packedStat(1) .or.
+     +  archStat(2).ne.packedStat(2) .or.
+     +  archStat(3).ne.packedStat(3)) then
+        do i=1,NCACHE
+          cacheKey(i)=-1
+        enddo
+        if (packed) CLOSE(PUNIT)
+        packed=found
+        do i=1,3
+          packedStat(i)=archStat(i)
+        enddo
+        if (packed) then
+          INQUIRE( IOLENGTH=RECLEN ) record
+          OPEN (UNIT=PUNIT,FILE=filename,ACCESS='DIRECT',
+     +      FORM='UNFORMATTED',RECL=RECLEN,STATUS='OLD',action='read')
+          READ (PUNIT,REC=1) header
+          packedBase=NINT(header(2))
+          packedN=NINT(header(3))
+        endif
+        cacheDir=TS7DIR
+      endif
+
       IYR=iyear
       IDY=idoy
       IHR=floor(dut/3600.D0)
@@ -51,6 +115,35 @@
       WRITE (PAR_FNAME,'(I4,A1,I0.3,A1,I0.2,A1,I0.2,A4)')
      +iyear,'_',idoy,'_',IHR,'_',IMN-MODMIN,'.par' 
 
+c     5 minute interval index from the Julian day number
+      KEY=(JULDAY(iyear,01,01)+idoy-1)*288+IHR*12+IMN/5
+      SLOT=MOD(KEY,NCACHE)+1
+
+      if (cacheKey(SLOT) .ne. KEY) then
+
+      OK=.false.
+      if (packed) then
+c     Record 1 is the header, a missing interval has M_INX = -1
+        IREC=KEY-packedBase+2
+        OK=(IREC .ge. 2 .and. IREC .le. packedN+1)
+        if (OK) then
+          READ (PUNIT,REC=IREC) record
+          OK=(record(NTOT+1) .ge. 0.D0)
+        endif
+        if (OK) then
+          do i=1,NTOT
+            cacheA(i,SLOT)=record(i)
+          enddo
+          cacheM(SLOT)=NINT(record(NTOT+1))
+          cacheN(SLOT)=NINT(record(NTOT+2))
+          cachePDYN(SLOT)=record(NTOT+3)
+          cacheTILT(SLOT)=record(NTOT+4)
+        endif
+      endif
+
+c     Intervals missing from the archive are read from their text file
+      if (.not. OK) then
+
 C     TS7LEN is the directory length
 c      WRITE(FMT,'("(A", I0, ",A8,A18)")') TS7LEN
 c      write(filename,FMT), TS7DIR(1:TS7LEN),'/Coeffs/',PAR_FNAME
@@ -69,14 +162,15 @@ c check that filename exists:
         stop
       endif
 
-      READ (1,100) (A07(I),I=1,NTOT)                             !  A SPECIFIC TIME MOMENT
+      READ (1,100) (cacheA(I,SLOT),I=1,NTOT)                     !  A SPECIFIC TIME MOMENT
       READ (1,101) COEFF_Q 
       READ (1,101) COEFF_B_RMS 
-      READ (1,102) M_INX
-      READ (1,102) N_INX
-      READ (1,101) PDYN
-      READ (1,101) TILT
+      READ (1,102) cacheM(SLOT)
+      READ (1,102) cacheN(SLOT)
+      READ (1,101) cachePDYN(SLOT)
+      READ (1,101) cacheTILT(SLOT)
       CLOSE(1)                                        
+      endif
 
 c      print *, filename
 c      do i=1,NTOT
@@ -90,6 +184,24 @@ c      call sleep(10)
  101  FORMAT(7x,G15.6)                                            
  102  FORMAT(7x,I15)                                            
 
+      endif
+
+      if (.not. OK) then
+        print *, 'TS07d error: No Coeff files exist for ',iyear,idoy
+        print *, 'TS07d error: filename: ',filename,' does not exist'
+        ifail=-1
+        return
+      endif
+      cacheKey(SLOT)=KEY
+      endif
+
+      do i=1,NTOT
+        A07(i)=cacheA(i,SLOT)
+      enddo
+      M_INX=cacheM(SLOT)
+      N_INX=cacheN(SLOT)
+      PDYN=cachePDYN(SLOT)
+      TILT=cacheTILT(SLOT)
       
 !      print *, filename
       VXGSE=-400.D0  !  GSE COMPONENTS OF SOLAR WIND VELOCITY VECTOR; THIS PARTICULAR CHOICE
@@ -100,9 +212,4 @@ c      call sleep(10)
       call RECALC_08 (IYR,IDY,IHR,IMN,ISC,VXGSE,VYGSE,VZGSE) ! CALCULATES TILT ANGLE AND
 C                                                                  UPDATES MAIN FIELD COEFFICIENTS      
 
-      else
-        print *, 'TS07d error: No Coeff files exist for ',iyear,idoy
-        print *, 'TS07d error: filename: ',filename,' does not exist'
-        ifail=-1
-      endif
       end
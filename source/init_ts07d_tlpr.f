@@ -1,7 +1,7 @@
 c     Adapted for IRBEM by A. C. Kellerman, loads tail par files
-c     these only need to be loaded once
-c     TODO: introduce a parameter when this is loaded, so we don't
-c     call it in the GET_FIELD1 and GET_MULTI1 scripts for each call
+c     these only need to be loaded once: the files are read again only
+c     when TS07_DATA_PATH changes, so the per call uses in GET_FIELD1
+c     and the other single point routines do not touch the disk
 
 c     revised Nov 8 2017 in preparation for 2017 TS07d model inclusion - A.C.K
       
@@ -16,10 +16,18 @@ c     revised Nov 8 2017 in preparation for 2017 TS07d model inclusion - A.C.K
       CHARACTER*200 filename,FFMT
       CHARACTER*255 TS7DIR
       CHARACTER*255 ts07d_env
+      CHARACTER*255 loadedDir ! directory of the loaded tail pars
 
       COMMON /TSS/ TSS(80,5) ! tail pars
+!$OMP THREADPRIVATE(/TSS/)
       COMMON /TSO/ TSO(80,5,4)
+!$OMP THREADPRIVATE(/TSO/)
       COMMON /TSE/ TSE(80,5,4)
+!$OMP THREADPRIVATE(/TSE/)
+
+      SAVE loadedDir
+!$OMP THREADPRIVATE(loadedDir)
+      DATA loadedDir/' '/
 
       CALL GETENV('TS07_DATA_PATH', ts07d_env)
       if (LEN_TRIM(ts07d_env).ne.0) then
@@ -28,6 +36,7 @@ c     revised Nov 8 2017 in preparation for 2017 TS07d model inclusion - A.C.K
         write(*,*) "error, TS07_DATA_PATH global variable not set"
         stop
       endif
+      if (TS7DIR .eq. loadedDir) return
 
       i=len(TS7DIR)
       do while (TS7DIR(i:i) == ' ')
@@ -64,4 +73,5 @@ c     revised Nov 8 2017 in preparation for 2017 TS07d model inclusion - A.C.K
  1005   CONTINUE
  1004 CLOSE(1)
 
+      loadedDir=TS7DIR
       end
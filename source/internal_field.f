@@ -99,8 +99,10 @@ C
         INTEGER*4 i, j,norder
 C
       COMMON /intfield/  G,norder
+!$OMP THREADPRIVATE(/intfield/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C      
 C     
       CALL geo_gdz(xGEO,yGEO,zGEO,lati,longi,alti)
@@ -561,7 +563,9 @@ C
         INTEGER*4     i, j, k, n, norder
 C
       COMMON /intfield/  G,norder
+!$OMP THREADPRIVATE(/intfield/)
       COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C      
       DATA ((gjc(i,j),j=1,2),i=1,27) 
      & / 30411.2d0,    0.0d0,  2147.4d0, -5798.9d0,  2403.5d0,    0.0d0,
@@ -622,7 +626,9 @@ C
         INTEGER*4     i, j, k, n,jj,m,norder
 c
       COMMON /intfield/  G,norder
+!$OMP THREADPRIVATE(/intfield/)
       COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
 C      
       DATA ((ggsfc(i,j),j=1,2),i=1,65)
      & / -30401.2d0,0.0d0,-2163.8d0,5778.2d0,-1540.1d0,0.0d0,
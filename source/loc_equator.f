@@ -61,8 +61,10 @@ C
        REAL*8     posit(3)
 C
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
        REAL*8     pi,rad
        common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
 C
        dtet = pi/Ntet
@@ -35,6 +35,7 @@ C LOCAL:
       INTEGER*4 i, j, k, l, m, n 
 
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
 C COEFFICIENTS OF MODEL 1 (MEAD-FAIRFIELD 1975)
 
       DATA ((A(I,J),I=1,7),J=1,4)/17.93D0,-5.79D0,2.98D0,-2.57D0,
@@ -76,6 +76,7 @@ c-------------------------------------------------------------------------------
       PARAMETER (eps = 0.01)
       
       COMMON  /Param_meo_gnss/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_meo_gnss/)
 
       IF (launch_year .EQ. 0) then
          write(6,*)'*****************************'
@@ -295,6 +296,7 @@ c-------------------------------------------------------------------------------
       REAL*8            Emin,Emax
 
       COMMON  /Param_meo_gnss/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_meo_gnss/)
       
       do i=1,Nenergy
          do j=1,11
@@ -408,6 +410,7 @@ c-------------------------------------------------------------------------------
       REAL*8            Emin,Emax
 
       COMMON  /Param_meo_gnss/ flux_tab,energies,Emin,Emax
+!$OMP THREADPRIVATE(/Param_meo_gnss/)
       
       do i=1,Nenergy
          do j=1,11
@@ -128,14 +128,22 @@ c
       CHARACTER NAME(2)*4,ISDATE(3)*4,ISTIME(2)*4
 c
       COMMON/UINR/IIEE
+!$OMP THREADPRIVATE(/UINR/)
       COMMON/GTS3C/TLB,S,DB04,DB16,DB28,DB32,DB40,DB48,DB01,ZA,T0,Z0
      $ ,G0,RL,DD,DB14,TR12
+!$OMP THREADPRIVATE(/GTS3C/)
       COMMON/LOWER5/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER5/)
       COMMON/PARM5/PT,PD,PS,PDL
+!$OMP THREADPRIVATE(/PARM5/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/TTEST/TINFG,GB,ROUT,TT
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/DATIME/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/DATIME/)
       DATA MT/48,0,4,16,28,32,40,1,49,14/,IFL/0/
       DATA ALTL/200.D0,400.D0,150.D0,200.D0,240.D0,450.D0,
      &         320.D0,450.D0/
@@ -425,8 +433,11 @@ c
       REAL*8 GLB,GAMMA,DENSA,GAMM
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/FIT/TAF
+!$OMP THREADPRIVATE(/FIT/)
       COMMON/LSQV/MP,II,JG,LT,QPB,IERR,IFUN,N,J,DV
+!$OMP THREADPRIVATE(/LSQV/)
       DATA RGAS/831.4D0/
       ZETA(ZZ,ZL)=(ZZ-ZL)*(RE+ZL)/(RE+ZZ)
 c
@@ -514,11 +525,16 @@ C
       REAL*8 XLONG,CLONG,SLONG ! not used but added for consistency with newer MSIS models
 c
       COMMON/TTEST/TINF,GB,ROUT,T
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      &             DAY,DF,DFA,APD,APDF,APT,XLONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
       DATA DGTR/1.74533D-2/,DR/1.72142D-2/, XL/1000.D0/,TLL/1000.D0/
      &  DAYL/-1.D0/,P14/-1000.D0/,P18/-1000.D0/,P32/-1000.D0/
      &  HR/.2618D0/,SR/7.2722D-5/,SV/25*1.D0/,NSW/14/,P39/-1000.D0/
@@ -718,7 +734,9 @@ C
       REAL*8 SW(25),SWC(25),SV(25),SVV(25),SAV(25)
 c
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
 c
       DO 100 I = 1,25
         SAV(I)=SV(I)
@@ -754,9 +772,13 @@ c
 c
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      $ DAY,DF,DFA,APD,APDF,APT,XLONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
 C!!OLD!! DIMENSION P(1),T(15) !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 c
       DATA DR/1.72142D-2/,T/15*0.D0/
@@ -858,13 +880,17 @@ c
       CHARACTER ISD(3)*4,IST(2)*4,NAME(2)*4,ISDATE(3)*4,ISTIME(2)*4
 c
       COMMON/UINR/IIEE
+!$OMP THREADPRIVATE(/UINR/)
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/PARM5/PT1,PT2,PT3,PA1,PA2,PA3,
      * PB1,PB2,PB3,PC1,PC2,PC3,
      * PD1,PD2,PD3,PE1,PE2,PE3,
      * PF1,PF2,PF3,PG1,PG2,PG3,
      * PH1,PH2,PH3,PI1
+!$OMP THREADPRIVATE(/PARM5/)
       COMMON/LOWER5/PTM,PDM/DATIME/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/LOWER5/,/DATIME/)
       DATA ISD/'11-F','EB-8','6   '/,IST/'18:2','3:31'/
 c
       GSURF=980.665D0
@@ -113,17 +113,29 @@ c
 c
       COMMON/GTS3C/TLB,S,DB04,DB16,DB28,DB32,DB40,DB48,DB01,ZA,T0,Z0
      & ,G0,RL,DD,DB14,TR12
+!$OMP THREADPRIVATE(/GTS3C/)
       COMMON/MESO6/TN1,TN2,TN3,TGN1,TGN2,TGN3
+!$OMP THREADPRIVATE(/MESO6/)
       COMMON/LOWER6/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER6/)
       COMMON/PARM6/PT,PD,PS,PDL,PTL,PMA
+!$OMP THREADPRIVATE(/PARM6/)
       COMMON/DATIM6/ISD,IST,NAM
+!$OMP THREADPRIVATE(/DATIM6/)
       COMMON/DATIME/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/DATIME/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/MAVG6/PAVGM
+!$OMP THREADPRIVATE(/MAVG6/)
       COMMON/DMIX/DM04,DM16,DM28,DM32,DM40,DM01,DM14
+!$OMP THREADPRIVATE(/DMIX/)
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/METSEL/IMR
+!$OMP THREADPRIVATE(/METSEL/)
       SAVE
       EXTERNAL GTD6BK
       DATA MN3/5/,ZN3/32.5D0,20.D0,15.D0,10.D0,0.D0/
@@ -301,7 +313,9 @@ C
       REAL*8 G,SH
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/METSEL/IMR
+!$OMP THREADPRIVATE(/METSEL/)
       SAVE
       DATA BM/1.3806D-19/,RGAS/831.4D0/
       DATA TEST/.00043D0/
@@ -374,7 +388,9 @@ C       Return 0 if unchanged and 1 if changed
       REAL*8 FAL(2),FL(2),APL(7,2),SWL(25,2),SWCL(25,2)
       REAL*8 SW(25),SWC(25),VTST
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       SAVE
       DATA IYDL/2*-999/,SECL/2*-999.D0/,GLATL/2*-999.D0/,GLL/2*-999.D0/
       DATA STLL/2*-999.D0/,FAL/2*-999.D0/,FL/2*-999.D0/,APL/14*-999.D0/
@@ -509,14 +525,23 @@ C
 c
       COMMON/GTS3C/TLB,S,DB04,DB16,DB28,DB32,DB40,DB48,DB01,ZA,T0,Z0
      & ,G0,RL,DD,DB14,TR12
+!$OMP THREADPRIVATE(/GTS3C/)
       COMMON/MESO6/TN1,TN2,TN3,TGN1,TGN2,TGN3
+!$OMP THREADPRIVATE(/MESO6/)
       COMMON/LOWER6/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER6/)
       COMMON/PARM6/PT,PD,PS,PDL,PTL,PMA
+!$OMP THREADPRIVATE(/PARM6/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/TTEST/TINFG,GB,ROUT,TT
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/DMIX/DM04,DM16,DM28,DM32,DM40,DM01,DM14
+!$OMP THREADPRIVATE(/DMIX/)
       COMMON/METSEL/IMR
+!$OMP THREADPRIVATE(/METSEL/)
       SAVE
       DATA MT/48,0,4,16,28,32,40,1,49,14/
       DATA ALTL/200.D0,400.D0,160.D0,200.D0,240.D0,450.D0,
@@ -878,11 +903,16 @@ c
       REAL*8 P44,P45,EXP1,EXP2,GLOBE6
 c
       COMMON/TTEST/TINF,GB,ROUT,T
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      $ DAY,DF,DFA,APD,APDF,APT,XLONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
       SAVE
       DATA DGTR/1.74533D-2/,DR/1.72142D-2/, XL/1000.D0/,TLL/1000.D0/
       DATA SW9/1.D0/,DAYL/-1.D0/,P14/-1000.D0/,P18/-1000.D0/,
@@ -1107,7 +1137,9 @@ C
       REAL*8 SW(25),SWC(25),SV(25),SVV(25),SAV(25)
 c
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       SAVE
       DO 100 I = 1,25
         SAV(I)=SV(I)
@@ -1138,9 +1170,13 @@ C      VERSION OF GLOBE FOR LOWER ATMOSPHERE 1/17/90
 c
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      $ DAY,DF,DFA,APD,APDF,APT,LONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       SAVE
       DATA DR/1.72142D-2/,DGTR/1.74533D-2/
       DATA DAYL/-1.D0/,P32,P18,P14,P39/4*-1000.D0/
@@ -1235,7 +1271,9 @@ c
       REAL*8 GAMMA,DENSA,ZZ,ZL
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/LSQV/MP,II,JG,LT,QPB,IERR,IFUN,N,J,DV
+!$OMP THREADPRIVATE(/LSQV/)
       SAVE
       DATA RGAS/831.4D0/
       ZETA(ZZ,ZL)=(ZZ-ZL)*(RE+ZL)/(RE+ZZ)
@@ -1324,8 +1362,11 @@ c
       REAL*8 GLB,GAMM,YI,EXPL,T2,ZZ,ZL
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/FIT/TAF
+!$OMP THREADPRIVATE(/FIT/)
       COMMON/LSQV/MP,II,JG,LT,QPB,IERR,IFUN,N,J,DV
+!$OMP THREADPRIVATE(/LSQV/)
       SAVE
       DATA RGAS/831.4D0/
       ZETA(ZZ,ZL)=(ZZ-ZL)*(RE+ZL)/(RE+ZZ)
@@ -1611,10 +1652,15 @@ c
      $ PS1,PS2,PU1,PU2,PV1,PV2,
      $ PW1,PW2,PX1,PX2,PY1,PY2,
      $ PZ1,PZ2
+!$OMP THREADPRIVATE(/PARM6/)
       COMMON/LOWER6/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER6/)
       COMMON/MAVG6/PAVGM
+!$OMP THREADPRIVATE(/MAVG6/)
       COMMON/DATIM6/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/DATIM6/)
       COMMON/METSEL/IMR
+!$OMP THREADPRIVATE(/METSEL/)
       DATA IMR/0/
       DATA ISDATE/'12-M','AR-9','0   '/,ISTIME/'15:0','9:04'/
       DATA NAME/'MSIS','E 90'/
@@ -172,17 +172,29 @@ c
 c
       COMMON/GTS3C/TLB,S,DB04,DB16,DB28,DB32,DB40,DB48,DB01,ZA,T0,Z0
      & ,G0,RL,DD,DB14,TR12
+!$OMP THREADPRIVATE(/GTS3C/)
       COMMON/MESO7/TN1,TN2,TN3,TGN1,TGN2,TGN3
+!$OMP THREADPRIVATE(/MESO7/)
       COMMON/LOWER7/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER7/)
       COMMON/PARM7/PT,PD,PS,PDL,PTL,PMA,SAM
+!$OMP THREADPRIVATE(/PARM7/)
       COMMON/DATIM7/ISD,IST,NAM
+!$OMP THREADPRIVATE(/DATIM7/)
       COMMON/DATIME/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/DATIME/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/MAVG7/PAVGM
+!$OMP THREADPRIVATE(/MAVG7/)
       COMMON/DMIX/DM04,DM16,DM28,DM32,DM40,DM01,DM14
+!$OMP THREADPRIVATE(/DMIX/)
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       SAVE
       EXTERNAL GTD7BK
       DATA MN3/5/,ZN3/32.5D0,20.D0,15.D0,10.D0,0.D0/
@@ -385,6 +397,7 @@ C
       REAL*8 D(9),T(2),AP(7)
       REAL*8 SEC,ALT,GLAT,GLONG,STL,F107A,F107
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       CALL GTD7(IYD,SEC,ALT,GLAT,GLONG,STL,F107A,F107,AP,MASS,D,T)
 C       TOTAL MASS DENSITY
 C
@@ -440,7 +453,9 @@ C
       REAL*8 G,SH
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       SAVE
       DATA BM/1.3806D-19/,RGAS/831.4D0/
       DATA TEST/.00043D0/,LTEST/12/
@@ -517,7 +532,9 @@ C       Return 0 if unchanged and 1 if changed
       REAL*8 FAL(2),FL(2),APL(7,2),SWL(25,2),SWCL(25,2)
       REAL*8 SW(25),SWC(25),VTST7
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
 c
       SAVE
       DATA IYDL/2*-999/,SECL/2*-999.D0/,GLATL/2*-999.D0/,GLL/2*-999.D0/
@@ -650,14 +667,23 @@ C
 c
       COMMON/GTS3C/TLB,S,DB04,DB16,DB28,DB32,DB40,DB48,DB01,ZA,T0,Z0
      & ,G0,RL,DD,DB14,TR12
+!$OMP THREADPRIVATE(/GTS3C/)
       COMMON/MESO7/TN1,TN2,TN3,TGN1,TGN2,TGN3
+!$OMP THREADPRIVATE(/MESO7/)
       COMMON/LOWER7/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER7/)
       COMMON/PARM7/PT,PD,PS,PDL,PTL,PMA,SAM
+!$OMP THREADPRIVATE(/PARM7/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/TTEST/TINFG,GB,ROUT,TT
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/DMIX/DM04,DM16,DM28,DM32,DM40,DM01,DM14
+!$OMP THREADPRIVATE(/DMIX/)
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       SAVE
       DATA MT/48,0,4,16,28,32,40,1,49,14,17/
       DATA ALTL/200.D0,300.D0,160.D0,250.D0,240.D0,450.D0,320.D0,450.D0/
@@ -1029,6 +1055,7 @@ C      Convert outputs to Kg & Meters if METER true
       INTEGER*4 IMR
       LOGICAL METER
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       SAVE
       IMR=0
       IF(METER) IMR=1
@@ -1039,6 +1066,7 @@ C-----------------------------------------------------------------------
 C      Calculate scale height (km)
       REAL*8 ALT,XM,TEMP,GSURF,RE,RGAS,SCALH,G
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       SAVE
       DATA RGAS/831.4D0/
       G=GSURF/(1.D0+ALT/RE)**2
@@ -1064,11 +1092,16 @@ c
       REAL*8 P44,P45,EXP1,EXP2,GLOBE7
 c
       COMMON/TTEST/TINF,GB,ROUT,T
+!$OMP THREADPRIVATE(/TTEST/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      $ DAY,DF,DFA,APD,APDF,APT,XLONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
       SAVE
       DATA DGTR/1.74533D-2/,DR/1.72142D-2/,XL/1000.D0/,TLL/1000.D0/
       DATA SW9/1.D0/,DAYL/-1.D0/,P14/-1000.D0/,P18/-1000.D0/,
@@ -1299,7 +1332,9 @@ C
       REAL*8 SW(25),SWC(25),SV(25),SVV(25),SAV(25)
 c
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       SAVE
       DO 100 I = 1,25
         SAV(I)=SV(I)
@@ -1330,9 +1365,13 @@ C      VERSION OF GLOBE FOR LOWER ATMOSPHERE 10/26/99
 c
       COMMON/LPOLY/PLG,CTLOC,STLOC,C2TLOC,S2TLOC,C3TLOC,S3TLOC,
      $ DAY,DF,DFA,APD,APDF,APT,LONG,CLONG,SLONG
+!$OMP THREADPRIVATE(/LPOLY/)
       COMMON/LPOLYI/IYR
+!$OMP THREADPRIVATE(/LPOLYI/)
       COMMON/CSW/SW,SWC
+!$OMP THREADPRIVATE(/CSW/)
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       SAVE
       DATA DR/1.72142D-2/,DGTR/1.74533D-2/,PSET/2.D0/
       DATA DAYL/-1.D0/,P32,P18,P14,P39/4*-1000.D0/
@@ -1434,7 +1473,9 @@ c
       REAL*8 GAMMA,DENSA,ZZ,ZL
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/LSQV/MP,II,JG,LT,QPB,IERR,IFUN,N,J,DV
+!$OMP THREADPRIVATE(/LSQV/)
       SAVE
       DATA RGAS/831.4D0/
       ZETA(ZZ,ZL)=(ZZ-ZL)*(RE+ZL)/(RE+ZZ)
@@ -1523,8 +1564,11 @@ c
       REAL*8 GLB,GAMM,YI,EXPL,T2,ZZ,ZL
 c
       COMMON/PARMB/GSURF,RE
+!$OMP THREADPRIVATE(/PARMB/)
       COMMON/FIT/TAF
+!$OMP THREADPRIVATE(/FIT/)
       COMMON/LSQV/MP,II,JG,LT,QPB,IERR,IFUN,N,J,DV
+!$OMP THREADPRIVATE(/LSQV/)
       SAVE
       DATA RGAS/831.4D0/
       ZETA(ZZ,ZL)=(ZZ-ZL)*(RE+ZL)/(RE+ZZ)
@@ -1833,10 +1877,15 @@ c
      $ PS1,PS2,PU1,PU2,PV1,PV2,
      $ PW1,PW2,PX1,PX2,PY1,PY2,
      $ PZ1,PZ2,PAA1,PAA2
+!$OMP THREADPRIVATE(/PARM7/)
       COMMON/LOWER7/PTM,PDM
+!$OMP THREADPRIVATE(/LOWER7/)
       COMMON/MAVG7/PAVGM
+!$OMP THREADPRIVATE(/MAVG7/)
       COMMON/DATIM7/ISDATE,ISTIME,NAME
+!$OMP THREADPRIVATE(/DATIM7/)
       COMMON/METSEL7/IMR
+!$OMP THREADPRIVATE(/METSEL7/)
       DATA IMR/0/
       DATA ISDATE/'01-F','EB-0','2   '/,ISTIME/'15:4','9:27'/
       DATA NAME/'MSIS','E-00'/
@@ -75,7 +75,9 @@ c Declare output variables
         REAL*8     Lm(ntime_max),Lstar(ntime_max)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
         COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
         DATA  xSUN /1.d0,0.d0,0.d0/
       integer*4 int_field_select, ext_field_select
 C
@@ -94,6 +96,18 @@ c
           call INIT_TS07D_TLPR
       end if
 
+c     An OpenMP build gives each thread a contiguous block of points
+c     (TS07D, kext=13,14, always runs serially). The first point of each
+c     block starts with Ilflag=0 instead of reusing the drift shell of
+c     the previous point, so from the second block on its L* can differ
+c     from a serial run within the accuracy set by options(3)
+!$OMP PARALLEL IF(k_ext.ne.13 .and. k_ext.ne.14) COPYIN(/magmod/)
+!$OMP&  PRIVATE(isat,ifail,Ilflag_old,alti,lati,longi,xGEO,xMAG,rM,
+!$OMP&  MLAT,mlon,mlon1)
+!$    Ilflag=0
+!$    Ilflag_old=Ilflag
+!$    CALL INITIZE
+!$OMP DO SCHEDULE(STATIC)
       DO isat = 1,ntime
 
           call init_fields ( kint, iyearsat(isat), idoy(isat),
@@ -156,6 +170,171 @@ c
            IF (MLT(isat).LT.0.d0) MLT(isat) = MLT(isat) + 24.d0
         endif
       ENDDO
+!$OMP END DO
+!$OMP END PARALLEL
+
+      END
+c
+c --------------------------------------------------------------------
+c
+        SUBROUTINE make_lstar_foot_equator1(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,stop_alt,maginput,
+     &  Lm,Lstar,BLOCAL,BMIN,XJ,MLT,XEQ,XFOOTN,BFOOTN,BFOOTMAGN,
+     &  XFOOTS,BFOOTS,BFOOTMAGS)
+c
+c     make_lstar1, FIND_MAGEQUATOR1 and find_foot_point1 (hemi_flag=+1
+c     and -1) in one call: the field model is set up once per point, and
+c     the equator and both foot points come from a single trace of the
+c     field line (find_feet_equator_opt)
+c
+c      INPUTS have the usual meaning, except:
+c      REAL*8 stop_alt - geodetic altitude of the foot points (gdz), km
+c
+c      OUTPUTS, in addition to the make_lstar1 ones
+c      REAL*8 XEQ(3,ntime_max) - GEO position of the magnetic equator
+c      REAL*8 XFOOTN(3,ntime_max),XFOOTS(3,ntime_max) - GDZ position of
+c             the northern and southern foot points (alt, lat, lon)
+c      REAL*8 BFOOTN(3,ntime_max),BFOOTS(3,ntime_max) - Magnetic field
+c             at the foot points (nT, GEO)
+c      REAL*8 BFOOTMAGN(ntime_max),BFOOTMAGS(ntime_max) - Magnetic field
+c             at the foot points (nT)
+c
+      IMPLICIT NONE
+      INCLUDE 'variables.inc'
+      INCLUDE 'ntime_max.inc'
+C
+c declare inputs
+        INTEGER*4    kext,k_ext,k_l,options(5)
+        INTEGER*4    ntime,sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     stop_alt
+      real*8     maginput(25,ntime_max)
+c
+c Declare internal variables
+      INTEGER*4    isat,kint,ifail,i
+        INTEGER*4    t_resol,r_resol,Ilflag,Ilflag_old
+      REAL*8     mlon,mlon1
+      REAL*8     xGEO(3),xMAG(3),xSUN(3),rM,MLAT
+      real*8     alti,lati,longi
+c
+c Declare output variables
+        REAL*8     BLOCAL(ntime_max),BMIN(ntime_max),XJ(ntime_max)
+      REAL*8     MLT(ntime_max)
+        REAL*8     Lm(ntime_max),Lstar(ntime_max)
+      REAL*8     XEQ(3,ntime_max)
+      REAL*8     XFOOTN(3,ntime_max),BFOOTN(3,ntime_max)
+      REAL*8     BFOOTMAGN(ntime_max)
+      REAL*8     XFOOTS(3,ntime_max),BFOOTS(3,ntime_max)
+      REAL*8     BFOOTMAGS(ntime_max)
+C
+      COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
+        COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
+        DATA  xSUN /1.d0,0.d0,0.d0/
+      integer*4 int_field_select, ext_field_select
+C
+      Ilflag=0
+      Ilflag_old=Ilflag
+      if (options(3).lt.0 .or. options(3).gt.9) options(3)=0
+      t_resol=options(3)+1
+      r_resol=options(4)+1
+      k_l=options(1)
+
+      kint = int_field_select ( options(5) )
+      k_ext = ext_field_select ( kext )
+c
+      CALL INITIZE
+      if (k_ext .eq. 13 .or. k_ext .eq. 14) then !TS07D tail par init, only need it once
+          call INIT_TS07D_TLPR
+      end if
+
+c     Same sharing of the points between OpenMP threads, and same
+c     Ilflag restart per block, as make_lstar1
+!$OMP PARALLEL IF(k_ext.ne.13 .and. k_ext.ne.14) COPYIN(/magmod/)
+!$OMP&  PRIVATE(isat,i,ifail,Ilflag_old,alti,lati,longi,xGEO,xMAG,rM,
+!$OMP&  MLAT,mlon,mlon1)
+!$    Ilflag=0
+!$    Ilflag_old=Ilflag
+!$    CALL INITIZE
+!$OMP DO SCHEDULE(STATIC)
+      DO isat = 1,ntime
+        Lm(isat)=baddata
+        Lstar(isat)=baddata
+        XJ(isat)=baddata
+        BLOCAL(isat)=baddata
+        BMIN(isat)=baddata
+        DO i=1,3
+          XEQ(i,isat)=baddata
+          XFOOTN(i,isat)=baddata
+          BFOOTN(i,isat)=baddata
+          XFOOTS(i,isat)=baddata
+          BFOOTS(i,isat)=baddata
+        ENDDO
+        BFOOTMAGN(isat)=baddata
+        BFOOTMAGS(isat)=baddata
+
+          call init_fields ( kint, iyearsat(isat), idoy(isat),
+     6          ut(isat), options(2) )
+
+          call get_coordinates ( sysaxes,
+     6        xIN1(isat), xIN2(isat), xIN3(isat),
+     6        alti, lati, longi, xGEO )
+
+        if (xIN1(isat) .eq. baddata .and. xIN2(isat) .eq. baddata
+     &  .and. xIN3(isat) .eq.baddata) then
+           GOTO 99
+        endif
+
+          call set_magfield_inputs ( k_ext, maginput(1,isat), ifail )
+
+        if (k_ext .eq. 13 .or. k_ext .eq. 14) then !TS07D coeff init
+            call INIT_TS07D_COEFFS(iyearsat(isat),idoy(isat),
+     &      ut(isat),ifail)
+        end if
+
+          if ( ifail.lt.0 ) then
+              GOTO 99
+             endif
+c
+           CALL calcul_Lstar_opt(t_resol,r_resol,XGeo
+     &     ,Lm(isat),Lstar(isat),XJ(isat),BLOCAL(isat),BMIN(isat))
+           if (Ilflag_old .eq.1 .and. Lstar(isat).eq. Baddata) then
+            Ilflag=0
+              CALL calcul_Lstar_opt(t_resol,r_resol,xGeo
+     &        ,Lm(isat),Lstar(isat),XJ(isat),BLOCAL(isat),BMIN(isat))
+         endif
+         Ilflag_old=Ilflag
+
+           if ((stop_alt.ge.0).and.(stop_alt.lt.6378.0*500.0)) then
+              CALL find_feet_equator_opt(xGEO,stop_alt,
+     &        XFOOTN(1,isat),BFOOTN(1,isat),BFOOTMAGN(isat),
+     &        XFOOTS(1,isat),BFOOTS(1,isat),BFOOTMAGS(isat),
+     &        XEQ(1,isat))
+           endif
+
+99         continue
+
+        if (ifail .eq. -10) then
+          MLT(isat) = baddata
+        else
+           CALL GDZ_GEO(lati,longi,alti
+     &     ,xGEO(1),xGEO(2),xGEO(3))
+           CALL geo_mag(xGEO,xMAG)
+           CALL car_sph(xMAG,rM,MLAT,Mlon1)
+           CALL GSM_GEO(xSUN,xGEO)
+           CALL geo_mag(xGEO,xMAG)
+           CALL car_sph(xMAG,rM,MLAT,Mlon)
+           MLT(isat) = (Mlon1 - Mlon)/15.d0 + 12.d0
+           IF (MLT(isat).GE.24.d0) MLT(isat) = MLT(isat) - 24.d0
+           IF (MLT(isat).LT.0.d0) MLT(isat) = MLT(isat) + 24.d0
+        endif
+      ENDDO
+!$OMP END DO
+!$OMP END PARALLEL
 
       END
 c
@@ -195,7 +374,9 @@ c Declare output variables
         REAL*8     Lm(ntime_max,Nalp),Lstar(ntime_max,Nalp)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
         COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
         DATA  xSUN /1.d0,0.d0,0.d0/
       integer*4 int_field_select, ext_field_select
 C
@@ -214,6 +395,14 @@ c
             call INIT_TS07D_TLPR
         end if
 
+c     Same sharing of the points between OpenMP threads, and same
+c     Ilflag restart per block, as make_lstar1
+!$OMP PARALLEL IF(k_ext.ne.13 .and. k_ext.ne.14) COPYIN(/magmod/)
+!$OMP&  PRIVATE(isat,IPA,ifail,alti,lati,longi,xGEO,xMAG,rM,MLAT,
+!$OMP&  mlon,mlon1,BL,BMIR,Bmin_tmp,xGEOp)
+!$    Ilflag=0
+!$    CALL INITIZE
+!$OMP DO SCHEDULE(STATIC)
        DO isat = 1,ntime
         call init_fields ( kint, iyearsat(isat), idoy(isat),
      6      ut(isat), options(2) )
@@ -275,6 +464,8 @@ c Compute Bmin assuming 90� PA at S/C
            IF (MLT(isat).LT.0.d0) MLT(isat) = MLT(isat) + 24.d0
 
       ENDDO
+!$OMP END DO
+!$OMP END PARALLEL
 
       END
 c
@@ -301,8 +492,10 @@ c Declare output variables
         REAL*8     Phi(ntime_max),Lstar(ntime_max)
 C
         COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
       integer*4 int_field_select, ext_field_select
 C
 
@@ -359,6 +552,7 @@ c Declare output variables
       REAL*8     posit(3,1000,48)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
       k_l=options(1)
@@ -392,6 +586,69 @@ c
      &     ,Lm,Lstar,XJ,BLOCAL,BMIN,
      &     posit,ind)
       END
+c
+c --------------------------------------------------------------------
+c
+      SUBROUTINE DRIFT_SHELL_MULTI(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,maginput,nmax,
+     &  Lm,Lstar,BLOCAL,BMIN,XJ,posit,offsets,nprocessed)
+C     Call drift_shell1 many times (ntime, up to ntime = ntime_max)
+C     and pack the 48 field lines of each drift shell one after the other
+C     in posit and BLOCAL. The points of line j of shell isat are
+C     posit(:,offsets(k)+1) to posit(:,offsets(k+1)) with
+C     k = 48*(isat-1)+j. A drift shell has at most 48*1000 points, so
+C     the routine returns before tracing a shell when fewer points than
+C     that are left in posit; nprocessed gives the number of shells that
+C     were traced, so the caller can continue with a larger buffer.
+c
+      IMPLICIT NONE
+      INCLUDE 'ntime_max.inc'   ! include file created by make, defines ntime_max
+C
+c     declare inputs
+      INTEGER*4    ntime,nmax
+      INTEGER*4    kext,options(5)
+      INTEGER*4    sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     maginput(25,ntime_max)
+c
+c     Declare output variables
+      INTEGER*4  offsets(48*ntime+1),nprocessed
+      REAL*8     Lm(ntime_max),Lstar(ntime_max)
+      REAL*8     BMIN(ntime_max),XJ(ntime_max)
+      REAL*8     BLOCAL(nmax),posit(3,nmax)
+C
+c     Declare internal variables
+      integer*4 isat,ind(48),i,j,k
+      REAL*8     BLOCAL1(1000,48),posit1(3,1000,48)
+
+      offsets(1)=0
+      nprocessed=0
+      do isat = 1,ntime
+         k=48*(isat-1)
+         if (offsets(k+1)+48*1000 .gt. nmax) return
+         do j = 1,48
+            ind(j)=0
+         enddo
+         call drift_shell1(kext,options,sysaxes,iyearsat(isat),
+     &        idoy(isat),UT(isat),xIN1(isat),xIN2(isat),xIN3(isat),
+     &        maginput(1,isat),Lm(isat),Lstar(isat),BLOCAL1,
+     &        BMIN(isat),XJ(isat),posit1,ind)
+         do j = 1,48
+            if (ind(j) .lt. 0) ind(j)=0
+            do i = 1,ind(j)
+               posit(1,offsets(k+j)+i)=posit1(1,i,j)
+               posit(2,offsets(k+j)+i)=posit1(2,i,j)
+               posit(3,offsets(k+j)+i)=posit1(3,i,j)
+               BLOCAL(offsets(k+j)+i)=BLOCAL1(i,j)
+            enddo
+            offsets(k+j+1)=offsets(k+j)+ind(j)
+         enddo
+         nprocessed=isat
+      enddo
+      end
 
 c --------------------------------------------------------------------
 c
@@ -441,6 +698,7 @@ c Declare output variables
       REAL*8     posit(3,3000)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
         do i=1,3
@@ -478,6 +736,63 @@ c
       END
 c
 c --------------------------------------------------------------------
+c
+      SUBROUTINE TRACE_FIELD_LINE_MULTI(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,maginput,R0,nmax,
+     &  Lm,BLOCAL,BMIN,XJ,posit,offsets,nprocessed)
+C     Call trace_field_line2_1 many times (ntime, up to ntime = ntime_max)
+C     and pack the traced field lines one after the other in posit and
+C     BLOCAL. The points of line isat are posit(:,offsets(isat)+1) to
+C     posit(:,offsets(isat+1)). A field line has at most 3000 points, so
+C     the routine returns before tracing a line when fewer points than
+C     that are left in posit; nprocessed gives the number of lines that
+C     were traced, so the caller can continue with a larger buffer.
+c
+      IMPLICIT NONE
+      INCLUDE 'ntime_max.inc'   ! include file created by make, defines ntime_max
+C
+c     declare inputs
+      INTEGER*4    ntime,nmax
+      INTEGER*4    kext,options(5)
+      INTEGER*4    sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     maginput(25,ntime_max)
+      real*8     R0
+c
+c     Declare output variables
+      INTEGER*4  offsets(ntime_max+1),nprocessed
+      REAL*8     Lm(ntime_max),BMIN(ntime_max),XJ(ntime_max)
+      REAL*8     BLOCAL(nmax),posit(3,nmax)
+C
+c     Declare internal variables
+      integer*4 isat,ind,i
+      REAL*8     BLOCAL1(3000),posit1(3,3000)
+
+      offsets(1)=0
+      nprocessed=0
+      do isat = 1,ntime
+         if (offsets(isat)+3000 .gt. nmax) return
+         ind=0
+         call trace_field_line2_1(kext,options,sysaxes,iyearsat(isat),
+     &        idoy(isat),UT(isat),xIN1(isat),xIN2(isat),xIN3(isat),
+     &        maginput(1,isat),R0,Lm(isat),BLOCAL1,BMIN(isat),
+     &        XJ(isat),posit1,ind)
+         if (ind .lt. 0) ind=0
+         do i = 1,ind
+            posit(1,offsets(isat)+i)=posit1(1,i)
+            posit(2,offsets(isat)+i)=posit1(2,i)
+            posit(3,offsets(isat)+i)=posit1(3,i)
+            BLOCAL(offsets(isat)+i)=BLOCAL1(i)
+         enddo
+         offsets(isat+1)=offsets(isat)+ind
+         nprocessed=isat
+      enddo
+      end
+c
+c --------------------------------------------------------------------
 c
       SUBROUTINE trace_field_line_towards_earth1(kext,options,sysaxes
      &  ,iyearsat,idoy,UT,xIN1,xIN2,xIN3,maginput,ds,posit,ind)
@@ -570,6 +885,7 @@ c Declare output variables
         REAL*8     BLOCAL,xGEO(3),BMIR
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
       kint = int_field_select ( options(5) )
@@ -622,6 +938,40 @@ c
         xGEO(3)=xGeop(3,1)
         Bmir=MyBmir(1)
       END
+c
+c --------------------------------------------------------------------
+c
+      SUBROUTINE FIND_MIRROR_POINT_MULTI(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,alpha,maginput,BLOCAL,BMIR,xGEO)
+C     Call find_mirror_point1 many times (ntime, up to ntime = ntime_max)
+c
+      IMPLICIT NONE
+      INCLUDE 'ntime_max.inc'   ! include file created by make, defines ntime_max
+C
+c     declare inputs
+      INTEGER*4    ntime
+      INTEGER*4    kext,options(5)
+      INTEGER*4    sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     alpha(ntime_max)
+      real*8     maginput(25,ntime_max)
+c
+c     Declare output variables
+      REAL*8     BLOCAL(ntime_max),BMIR(ntime_max),xGEO(3,ntime_max)
+C
+c     Declare internal variables
+      integer*4 isat
+
+      do isat = 1,ntime
+         call find_mirror_point1(kext,options,sysaxes,iyearsat(isat),
+     &        idoy(isat),UT(isat),xIN1(isat),xIN2(isat),xIN3(isat),
+     &        alpha(isat),maginput(1,isat),BLOCAL(isat),BMIR(isat),
+     &        xGEO(1,isat))
+      enddo
+      end
 
 
 
@@ -652,6 +1002,7 @@ c Declare output variables
       REAL*8     posit(3)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
       kint = int_field_select ( options(5) )
@@ -682,6 +1033,38 @@ c
 c
         CALL loc_equator_opt(xGeo,BMIN,posit)
       END
+c
+c --------------------------------------------------------------------
+c
+      SUBROUTINE FIND_MAGEQUATOR_MULTI(ntime,kext,options,sysaxes,
+     &  iyearsat,idoy,UT,xIN1,xIN2,xIN3,maginput,BMIN,posit)
+C     Call FIND_MAGEQUATOR1 many times (ntime, up to ntime = ntime_max)
+c
+      IMPLICIT NONE
+      INCLUDE 'ntime_max.inc'   ! include file created by make, defines ntime_max
+C
+c     declare inputs
+      INTEGER*4    ntime
+      INTEGER*4    kext,options(5)
+      INTEGER*4    sysaxes
+      INTEGER*4    iyearsat(ntime_max)
+      integer*4    idoy(ntime_max)
+      real*8     UT(ntime_max)
+      real*8     xIN1(ntime_max),xIN2(ntime_max),xIN3(ntime_max)
+      real*8     maginput(25,ntime_max)
+c
+c     Declare output variables
+      REAL*8     BMIN(ntime_max),posit(3,ntime_max)
+C
+c     Declare internal variables
+      integer*4 isat
+
+      do isat = 1,ntime
+         call FIND_MAGEQUATOR1(kext,options,sysaxes,iyearsat(isat),
+     &        idoy(isat),UT(isat),xIN1(isat),xIN2(isat),xIN3(isat),
+     &        maginput(1,isat),BMIN(isat),posit(1,isat))
+      enddo
+      end
 c --------------------------------------------------------------------
 c
       SUBROUTINE GET_FIELD1(kext,options,sysaxes,iyearsat,idoy,UT,
@@ -708,6 +1091,7 @@ c     Declare output variables
       REAL*8     BxGEO(3),Bl
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
       integer*4 int_field_select, ext_field_select
 C
       kint = int_field_select ( options(5) )
@@ -777,12 +1161,17 @@ c      if (kext.eq.13) then
 c            call INIT_TS07D_TLPR
 c      endif
 
+c    Points are independent: an OpenMP build shares them between
+c    threads, except for TS07D whose coefficient files are read serially
+!$OMP PARALLEL DO SCHEDULE(STATIC) PRIVATE(isat)
+!$OMP&  IF(kext.ne.13 .and. kext.ne.14)
       do isat = 1,ntime
          call GET_FIELD1(kext,options,sysaxes,iyearsat(isat),
      &        idoy(isat),UT(isat), xIN1(isat),xIN2(isat),
      &        xIN3(isat),maginput(1,isat),BxGEO(1,isat),Bl(isat))
 
       enddo
+!$OMP END PARALLEL DO
       end
 c
 c --------------------------------------------------------------------
@@ -891,10 +1280,13 @@ c
       INTEGER*4    a2000_iyear,a2000_imonth,a2000_iday
       REAL*8      a2000_ut
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
       REAL*8     pi,rad
 
       common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
       COMMON /a2000_time/a2000_ut,a2000_iyear,a2000_imonth,a2000_iday
+!$OMP THREADPRIVATE(/a2000_time/)
 
       iyear = 1800
 
@@ -1021,10 +1413,12 @@ c
        subroutine set_magfield_inputs ( kext, maginput, ifail )
       INCLUDE 'variables.inc'
       COMMON /index/activ
+!$OMP THREADPRIVATE(/index/)
       integer*4 activ
       COMMON /drivers/density,speed,dst_nt,Pdyn_nPa,BxIMF_nt,ByIMF_nt
      &       ,BzIMF_nt,G1_tsy01,G2_tsy01,fkp,G3_tsy01,W1_tsy04,W2_tsy04
      &       ,W3_tsy04,W4_tsy04,W5_tsy04,W6_tsy04,Al
+!$OMP THREADPRIVATE(/drivers/)
       real*8  density,speed,dst_nt,Pdyn_nPa,BxIMF_nt,ByIMF_nt,BzIMF_nt
       real*8  G1_tsy01,G2_tsy01,fkp,G3_tsy01,W1_tsy04,W2_tsy04
       real*8  W3_tsy04,W4_tsy04,W5_tsy04,W6_tsy04,Al
@@ -1571,6 +1965,7 @@ c
       REAL*8 Dens(8,100000),Temp(2,100000),APin(7),D(8),T(2)
 c
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       DO I=1,25
          SV(I)=1.D0
       ENDDO
@@ -1615,6 +2010,7 @@ c
       REAL*8 Dens(8,100000),Temp(2,100000),APin(7),D(8),T(2)
 c
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       DO I=1,25
          SV(I)=1.D0
       ENDDO
@@ -1649,6 +2045,7 @@ c
       REAL*8 Dens(9,100000),Temp(2,100000),APin(7),D(8),T(2)
 c
       COMMON/CSWI/ISW
+!$OMP THREADPRIVATE(/CSWI/)
       DO I=1,25
          SV(I)=1.D0
       ENDDO
@@ -1708,7 +2105,9 @@ c Declare output variables
         REAL*8     Lm(Nalp),Lstar(Nalp)
 C
       COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
         COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
         DATA  xSUN /1.d0,0.d0,0.d0/
       integer*4 int_field_select, ext_field_select
 C
@@ -19,8 +19,10 @@
       character tag*81
 
       COMMON /sd2pro/MMAXP,KMAXP,NMAXP,LMAXP,IMIX
+!$OMP THREADPRIVATE(/sd2pro/)
       COMMON /sd2proTab/EP,RP,TEPN,FEPN,TP,ZRP,
      &myDALP,myDRATP
+!$OMP THREADPRIVATE(/sd2proTab/)
       MMAXP= 133
       KMAXP=  28
       NMAXP=  49
@@ -7187,8 +7189,10 @@
 
       COMMON /sd2elbr/MMAXE,NMAXE,LMAXS,LMAXE,
      &LMAXT,LMAXB,IMIX
+!$OMP THREADPRIVATE(/sd2elbr/)
       COMMON /sd2elbrTab/EE,RE,YE,TE,AR,RS,BS,ZRE
      &,ZS,ZB,DALE,DALB,myDRATE,myDRATB
+!$OMP THREADPRIVATE(/sd2elbrTab/)
       MMAXE=  81
       NMAXE=  14
       LMAXS=  33
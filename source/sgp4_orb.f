@@ -87,6 +87,7 @@ c        Character*500 OutFileName
         INCLUDE 'SGP4.CMN'
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
         Help = 'N'
 
@@ -86,6 +86,7 @@ c
         INCLUDE 'SGP4.CMN'
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
         Help = 'N'
 
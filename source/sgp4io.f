@@ -102,6 +102,7 @@
         INCLUDE 'SGP4.CMN'
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
         ! --------------------  Implementation   ----------------------
@@ -149,6 +149,7 @@
         REAL*8  Zel   , Zes   , Znl   , Zns   , Pi   , TwoPi
         Character ildm
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * ----------------------------- Constants -----------------------------
@@ -368,6 +369,7 @@ c        INCLUDE 'debug1.for'
      &          zsinil, zx    , zy
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * ------------------------------ Constants ----------------------------
@@ -658,6 +660,7 @@ c        INCLUDE 'debug2.for'
      &          j3oj2
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
         Pi     = 3.14159265358979D0
@@ -969,6 +972,7 @@ c        INCLUDE 'debug3.for'
      &           Fasx4 , Fasx6 , RPtim , Step2 , Stepn , Stepp , TwoPi
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * ----------------------------- Constants -----------------------------
@@ -1180,6 +1184,7 @@ c        INCLUDE 'debug4.for'
      &         Eccsq , OMEOSQ, POSQ  , rp    , RTEOSQ, SINIO , GSTo
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * -------------------------- Local Variables --------------------------
@@ -1354,6 +1359,7 @@ c        INCLUDE 'debug5.for'
         INCLUDE 'SGP4.CMN'
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * -------------------------- Local Variables --------------------------
@@ -1681,6 +1687,7 @@ c        INCLUDE 'debug6.for'
 	INTEGER*4 iter
 
         COMMON /DebugHelp/ Help
+!$OMP THREADPRIVATE(/DebugHelp/)
         CHARACTER Help
 
 * ------------------------ WGS-72 EARTH CONSTANTS ---------------------
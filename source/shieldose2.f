@@ -147,12 +147,16 @@ cccc INPUTS:
 ccccccEND OF INPUTS cccccccccccccccccccccccc
 
       COMMON /sd2pro/MMAXP,KMAXP,NMAXP,LMAXP,IMIXP
+!$OMP THREADPRIVATE(/sd2pro/)
       COMMON /sd2proTab/EP,RP,TEPN,FEPN,TP,ZRP,
      &DALP,DRATP
+!$OMP THREADPRIVATE(/sd2proTab/)
       COMMON /sd2elbr/MMAXE,NMAXE,LMAXS,LMAXE,
      &LMAXT,LMAXB,IMIXE
+!$OMP THREADPRIVATE(/sd2elbr/)
       COMMON /sd2elbrTab/EE,RE,YE,TE,AR,RS,BS,ZRE
      &,ZS,ZB,DALE,DALB,DRATE,DRATB
+!$OMP THREADPRIVATE(/sd2elbrTab/)
 
 
       DATA  DET/'Aluminum','Graphite','Silicon','Air','Bone','CaF2',
@@ -80,8 +80,10 @@ c
      *  HYIMF,HZIMF,BBX,BBY,BBZ
 C
       COMMON /dip_ang/tilt
+!$OMP THREADPRIVATE(/dip_ang/)
         REAL*8     pi,rad
         common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 c
       DATA A/1.00000D0,-1.19284D0,1.32478D0,0.41388D0,-0.07590D0,
      *-1.97502D0,5.68628D0,0.00000D0,0.00000D0,0.79889D0,-0.02588D0,
@@ -152,10 +154,15 @@ C
       DIMENSION A(NTOT)
 C
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D,DELTADY  ! THE COMMON BLOCKS FORWARD NONLINEAR PARAMETERS
+!$OMP THREADPRIVATE(/TAIL/)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /RCPAR/ SC_SY,SC_AS,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       COMMON /RH0_t01_s/ RH0
+!$OMP THREADPRIVATE(/RH0_t01_s/)
 C
       DATA A0_A,A0_S0,A0_X0 /34.586D0,1.1960D0,3.4397D0/   !   SHUE ET AL. PARAMETERS
       DATA DSIG /0.005D0/, RH0,RH2 /8.0D0,-5.2D0/
@@ -743,6 +750,7 @@ C    WARPING IN Y-Z (DONE BY THE S/R WARPED) AND BENDING IN X-Z (DONE BY THIS SU
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       COMMON /RH0_t01_s/ RH0
+!$OMP THREADPRIVATE(/RH0_t01_s/)
       DATA RH2,IEPS /-5.2D0,3/
 C
 C  RH0,RH1,RH2, AND IEPS CONTROL THE TILT-RELATED DEFORMATION OF THE TAIL FIELD
@@ -816,6 +824,7 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
 C
       COMMON /G/ G
+!$OMP THREADPRIVATE(/G/)
       DGDX=0.D0
       XL=20.D0
       DXLDX=0.D0
@@ -889,6 +898,7 @@ C
       DIMENSION A1(60),A2(60)  !   TAIL SHIELDING FIELD PARAMETERS FOR THE MODES #1 & #2
 
       COMMON /TAIL/ DXSHIFT1,DXSHIFT2,D0,DELTADY  ! ATTENTION:  HERE D0 & DELTADY ARE INCLUDED IN /TAIL/
+!$OMP THREADPRIVATE(/TAIL/)
 C                                                                  AND EXCLUDED FROM DATA
       DATA DELTADX1,ALPHA1,XSHIFT1
      *  /1.D0,1.1D0,6.D0/
@@ -1132,7 +1142,9 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION SH11(86),SH12(86),SH21(86),SH22(86)
       COMMON /BIRKPAR/ XKAPPA1,XKAPPA2   !  INPUT PARAMETERS, SPECIFIED FROM A MAIN PROGRAM
+!$OMP THREADPRIVATE(/BIRKPAR/)
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! PARAMETERS, CONTROL DAY-NIGHT ASYMMETRY OF F.A.C.
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
       DATA SH11/46488.84663D0,-15541.95244D0,-23210.09824D0,
      *-32625.03856D0,-109894.4551D0,-71415.32808D0,58168.94612D0,
@@ -1298,9 +1310,12 @@ C
       IMPLICIT REAL*8 (A-H,O-Z)
       DIMENSION A11(31),A12(31),A21(31),A22(31)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
 
       COMMON /DPHI_B_RHO0/ DPHI,B,RHO_0,XKAPPA ! THESE PARAMETERS CONTROL DAY-NIGHT ASYMMETRY OF F.A.C., AS FOLLOWS:
+!$OMP THREADPRIVATE(/DPHI_B_RHO0/)
 
 C  (1) DPHI:   HALF-DIFFERENCE (IN RADIANS) BETWEEN DAY AND NIGHT LATITUDE OF FAC OVAL AT IONOSPHERIC ALTITUDE;
 C              TYPICAL VALUE: 0.06
@@ -1449,7 +1464,9 @@ c
       DIMENSION A(31)
 
       COMMON /DTHETA/ DTHETA
+!$OMP THREADPRIVATE(/DTHETA/)
       COMMON /MODENUM/ M
+!$OMP THREADPRIVATE(/MODENUM/)
 
       DATA DR,DT/1.D-6,1.D-6/  !   JUST FOR NUMERICAL DIFFERENTIATION
 
@@ -1770,6 +1787,7 @@ C
         IMPLICIT REAL*8 (A-H,O-Z)
         DIMENSION C_SY(86),C_PR(86)
         COMMON /RCPAR/ SC_SY,SC_PR,PHI
+!$OMP THREADPRIVATE(/RCPAR/)
 C
         DATA C_SY/1675.694858D0,1780.006388D0,-961.6082149D0,
      *-1668.914259D0,-27.40437029D0,-107.4169670D0,27.76189943D0,
@@ -2654,6 +2672,7 @@ C  WRITTEN BY: N. A. TSYGANENKO
 C
       IMPLICIT REAL*8 (A-H,O-Z)
       SAVE M,PSI
+!$OMP THREADPRIVATE(M,PSI)
       DATA M,PSI/0,5.D0/
       IF(M.EQ.1.AND.DABS(PS-PSI).LT.1.D-5) GOTO 1
       SPS=DSIN(PS)
@@ -76,11 +76,16 @@ C
        REAL*8     posit(3,20*Nreb,Nder),Bposit(20*Nreb,Nder)
 C
        COMMON /dipigrf/Bo,xc,yc,zc,ct,st,cp,sp
+!$OMP THREADPRIVATE(/dipigrf/)
        COMMON /calotte2/tet
+!$OMP THREADPRIVATE(/calotte2/)
        COMMON /flag_L/Ilflag
+!$OMP THREADPRIVATE(/flag_L/)
        COMMON /magmod/k_ext,k_l,kint
+!$OMP THREADPRIVATE(/magmod/)
        REAL*8     pi,rad
        common /rconst/rad,pi
+!$OMP THREADPRIVATE(/rconst/)
 C
 C
        dtet = pi/Ntet